@@ -2,16 +2,39 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
 RESULTS_DIR = Path(__file__).parent / "results"
 
 
+def _load_result(path: Path) -> object:
+    """Parse a result file, using orjson on the raw bytes when installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+def _case_order(path: Path) -> tuple[str, str]:
+    """Sort key for a "{case}_{run_id}.json" file: by case name, then run id.
+
+    Sorting the whole file name is not enough, since case names contain "_" too:
+    "a_b_<id>.json" would land between two runs of case "a".
+    """
+    case, _, run_id = path.stem.rpartition("_")
+    return case, run_id
+
+
 def generate_markdown_report(results_dir: Path | None = None) -> str:
     """Generate a markdown summary of all benchmark results."""
     results_dir = results_dir or RESULTS_DIR
-    result_files = sorted(results_dir.glob("*.json"))
+    result_files = sorted(results_dir.glob("*.json"), key=_case_order)
 
     if not result_files:
         return "No benchmark results found."
@@ -19,35 +42,37 @@ def generate_markdown_report(results_dir: Path | None = None) -> str:
     results = []
     for f in result_files:
         try:
-            data = json.loads(f.read_text())
-            results.append(data)
+            data = _load_result(f)
         except Exception:
             continue
+        if not isinstance(data, dict):
+            continue
+        # Fill display fields once here so the row loop is plain indexing
+        data.setdefault("case", "?")
+        data.setdefault("score", 0)
+        data.setdefault("tool_calls", "?")
+        data.setdefault("elapsed_s", "?")
+        data["_converged"] = "✓" if data.get("scores", {}).get("convergence", 0) > 50 else "✗"
+        results.append(data)
+
+    buf = io.StringIO()
+    buf.write("# FoamPilot Benchmark Report\n\n")
+    buf.write(f"Total runs: {len(results)}\n\n")
+    buf.write("| Case | Score | Tool Calls | Time (s) | Converged |\n")
+    buf.write("|------|-------|------------|----------|-----------|\n")
+
+    score_sum = 0.0
+    for r in results:
+        score_sum += r["score"]
+        buf.write(
+            f"| {r['case']} | {r['score']:.1f} | {r['tool_calls']} | "
+            f"{r['elapsed_s']} | {r['_converged']} |\n"
+        )
+
+    avg_score = score_sum / len(results) if results else 0
+    buf.write(f"\n**Average score: {avg_score:.1f}/100**")
 
-    lines = [
-        "# FoamPilot Benchmark Report",
-        "",
-        f"Total runs: {len(results)}",
-        "",
-        "| Case | Score | Tool Calls | Time (s) | Converged |",
-        "|------|-------|------------|----------|-----------|",
-    ]
-
-    for r in sorted(results, key=lambda x: x.get("case", "")):
-        case = r.get("case", "?")
-        score = r.get("score", 0)
-        tool_calls = r.get("tool_calls", "?")
-        elapsed = r.get("elapsed_s", "?")
-        converged = "✓" if r.get("scores", {}).get("convergence", 0) > 50 else "✗"
-        lines.append(f"| {case} | {score:.1f} | {tool_calls} | {elapsed} | {converged} |")
-
-    avg_score = sum(r.get("score", 0) for r in results) / len(results) if results else 0
-    lines += [
-        "",
-        f"**Average score: {avg_score:.1f}/100**",
-    ]
-
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
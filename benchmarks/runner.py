@@ -6,9 +6,14 @@ Runs FoamPilot benchmark cases and collects results.
 from __future__ import annotations
 
 import json
+import os
+import queue
+import re
+import secrets
 import sys
+import threading
 import time
-import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,8 +21,24 @@ from typing import Any
 import yaml
 import structlog
 
+from benchmarks.scorer import score_result
+from foampilot import config
+from foampilot.core.orchestrator import Orchestrator
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 log = structlog.get_logger(__name__)
 
+_NAME_RE = re.compile(rb"""^name:[ \t]*(["']?)([\w\-.]+)\1[ \t]*(?:#.*)?\r?$""", re.M)
+
 CASES_DIR = Path(__file__).parent / "cases"
 RESULTS_DIR = Path(__file__).parent / "results"
 
@@ -46,21 +67,108 @@ def _ts() -> str:
     return datetime.now().strftime("%H:%M:%S")
 
 
+def _load_case_spec(yaml_file: Path) -> Any:
+    """Parse a benchmark YAML file, using the LibYAML C loader when available."""
+    with open(yaml_file, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _peek_case_name(yaml_file: Path) -> str | None:
+    """Read a case's top-level ``name:`` from the head of its YAML file.
+
+    Returns None when the caller should fall back to a full parse: the name is not
+    a simple scalar in the first 512 bytes, it is unquoted and YAML would read it
+    as something other than a string (``name: 123``), or ``name:`` appears more
+    than once in the head (YAML keeps the last one). A duplicate further down the
+    file is not seen; duplicate keys are invalid YAML and the first name wins.
+    """
+    with open(yaml_file, "rb") as f:
+        head = f.read(512)
+    if len(head) == 512:
+        head = head[: head.rfind(b"\n") + 1]  # don't match a line cut off mid-value
+    matches = _NAME_RE.findall(head)
+    if len(matches) != 1 or head.count(b"\nname:") + head.startswith(b"name:") != 1:
+        return None
+    quote, value = matches[0]
+    name = value.decode()
+    if not quote and not isinstance(yaml.load(name, Loader=_YamlLoader), str):
+        return None
+    return name
+
+
+def _dump_result(result: dict) -> bytes:
+    """Serialise a result dict to indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    return json.dumps(result, indent=2).encode()
+
+
+def _prefetch_case_specs(yaml_files: list[Path]):
+    """Yield parsed case specs, parsing the next file in a background thread.
+
+    The queue holds at most one spec, so case N+1 is parsed while case N executes.
+    """
+    specs: queue.Queue = queue.Queue(maxsize=1)
+    stop = threading.Event()
+
+    def offer(item: tuple | None) -> bool:
+        while not stop.is_set():
+            try:
+                specs.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        for yaml_file in yaml_files:
+            try:
+                item = (_load_case_spec(yaml_file), None)
+            except Exception as exc:
+                item = (None, exc)
+            if not offer(item):
+                return
+        offer(None)
+
+    producer = threading.Thread(target=produce, name="benchmark-prefetch", daemon=True)
+    producer.start()
+    try:
+        while (item := specs.get()) is not None:
+            spec, exc = item
+            if exc is not None:
+                raise exc
+            yield spec
+    finally:
+        stop.set()
+
+
+def _iter_yaml_files(root: Path):
+    """Yield every ``*.yaml`` file below *root* using a single scandir walk."""
+    try:
+        entries = sorted(os.scandir(root), key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_yaml_files(Path(entry.path))
+        elif entry.name.endswith(".yaml") and entry.is_file():
+            yield Path(entry.path)
+
+
 class _ConsoleProgress:
-    """Prints live progress to the terminal during eval runs."""
+    """Prints live progress to the terminal during eval runs.
+
+    With *echo* off nothing is printed, but tool, turn and token counts are still kept.
+    """
 
-    def __init__(self, case_name: str) -> None:
+    def __init__(self, case_name: str, echo: bool = True) -> None:
         self._case = case_name
+        self._echo = echo
         self._tool_count = 0
         self._turn_count = 0
         self._total_input_tokens = 0
         self._total_output_tokens = 0
         self._total_cost_usd = 0.0
-        self._events: list[dict] = []
-
-    @property
-    def events(self) -> list[dict]:
-        return self._events
 
     @property
     def tool_count(self) -> int:
@@ -75,17 +183,27 @@ class _ConsoleProgress:
         }
 
     def __call__(self, event: dict) -> None:
-        self._events.append(event)
         t = event.get("type", "")
         d = event.get("data", {})
 
+        if t == "tool_call":
+            self._tool_count += 1
+        elif t == "llm_response":
+            self._turn_count += 1
+        elif t == "phase_token_summary":
+            self._total_input_tokens += d.get("total_input_tokens", 0)
+            self._total_output_tokens += d.get("total_output_tokens", 0)
+            self._total_cost_usd += d.get("total_cost_usd", 0.0)
+
+        if not self._echo:
+            return
+
         if t == "phase_start":
             phase = d.get("phase", "?")
             color = _PHASE_COLOR.get(phase, _DIM)
             print(f"  {_DIM}{_ts()}{_RESET}  {color}{_BOLD}▶ PHASE: {phase.upper()}{_RESET}")
 
         elif t == "tool_call":
-            self._tool_count += 1
             tool = d.get("tool", "?")
             inp = d.get("input", {})
             summary = self._summarise_input(inp)
@@ -101,7 +219,6 @@ class _ConsoleProgress:
                 print(f"  {_DIM}{_ts()}{_RESET}  {_RED}✗ {tool}{_RESET} {_RED}{err[:120]}{_RESET}")
 
         elif t == "llm_response":
-            self._turn_count += 1
             text = d.get("text", "")
             preview = text[:100].replace("\n", " ").strip()
             if len(text) > 100:
@@ -120,9 +237,6 @@ class _ConsoleProgress:
             inp = d.get("total_input_tokens", 0)
             out = d.get("total_output_tokens", 0)
             cost = d.get("total_cost_usd", 0.0)
-            self._total_input_tokens += inp
-            self._total_output_tokens += out
-            self._total_cost_usd += cost
             print(
                 f"  {_DIM}{_ts()}{_RESET}  {_BLUE}$ {phase}{_RESET} "
                 f"{_DIM}{inp:,}in + {out:,}out tokens, ${cost:.4f}{_RESET}"
@@ -155,6 +269,7 @@ class BenchmarkRunner:
         cases_dir: Directory containing tier1/, tier2/, tier3/ YAML files.
         results_dir: Directory where run results are saved.
         quiet: Suppress console progress output.
+        parallel: Run the cases of a suite concurrently in a process pool.
     """
 
     def __init__(
@@ -162,11 +277,14 @@ class BenchmarkRunner:
         cases_dir: Path | None = None,
         results_dir: Path | None = None,
         quiet: bool = False,
+        parallel: bool = False,
     ) -> None:
         self._cases_dir = cases_dir or CASES_DIR
         self._results_dir = results_dir or RESULTS_DIR
         self._results_dir.mkdir(parents=True, exist_ok=True)
         self._quiet = quiet
+        self._parallel = parallel
+        self._case_index: dict[str, Path] | None = None
 
     def run_case(self, case_name: str) -> dict:
         """Run a single benchmark case by name."""
@@ -175,8 +293,13 @@ class BenchmarkRunner:
             raise ValueError(f"Benchmark case not found: {case_name}")
         return self._execute(case_spec)
 
-    def run_suite(self, tier: str) -> list[dict]:
-        """Run all cases in a tier."""
+    def run_suite(self, tier: str, max_workers: int = 4) -> list[dict]:
+        """Run all cases in a tier.
+
+        When the runner was created with ``parallel=True``, cases run concurrently in a
+        process pool of up to *max_workers* processes; per-event progress is suppressed
+        and a one-line status is printed as each case finishes.
+        """
         tier_dir = self._cases_dir / tier
         if not tier_dir.exists():
             raise FileNotFoundError(f"Tier directory not found: {tier_dir}")
@@ -185,24 +308,44 @@ class BenchmarkRunner:
         if not self._quiet:
             print(f"\n{_BOLD}Running {tier} — {len(cases)} case(s){_RESET}\n")
 
-        results = []
-        for i, yaml_file in enumerate(cases, 1):
-            with open(yaml_file) as f:
-                case_spec = yaml.safe_load(f)
-            if not self._quiet:
-                print(f"{_DIM}─── [{i}/{len(cases)}] ───{_RESET}")
-            result = self._execute(case_spec)
-            results.append(result)
+        if self._parallel and len(cases) > 1:
+            results = self._run_parallel([_load_case_spec(f) for f in cases], max_workers)
+        else:
+            results = []
+            for i, case_spec in enumerate(_prefetch_case_specs(cases), 1):
+                if not self._quiet:
+                    print(f"{_DIM}─── [{i}/{len(cases)}] ───{_RESET}")
+                result = self._execute(case_spec)
+                results.append(result)
 
         self._print_summary(results)
         return results
 
-    def run_all(self) -> list[dict]:
-        """Run all benchmark cases across all tiers."""
+    def _run_parallel(self, case_specs: list[dict], max_workers: int) -> list[dict]:
+        """Execute *case_specs* in a process pool, returning results in input order."""
+        results: list[dict | None] = [None] * len(case_specs)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_execute_case, spec, self._results_dir, True): i
+                for i, spec in enumerate(case_specs)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[futures[future]] = result
+                if not self._quiet:
+                    status = f"{_GREEN}PASS{_RESET}" if result["success"] else f"{_RED}FAIL{_RESET}"
+                    print(
+                        f"{_DIM}─── [{done}/{len(case_specs)}] ───{_RESET} "
+                        f"{_BOLD}{result['case']}{_RESET} {status} {result['score']:.0f}/100"
+                    )
+        return results
+
+    def run_all(self, max_workers: int = 4) -> list[dict]:
+        """Run all benchmark cases across all tiers (see run_suite for *max_workers*)."""
         all_results = []
         for tier in ("tier1", "tier2", "tier3"):
             try:
-                results = self.run_suite(tier)
+                results = self.run_suite(tier, max_workers=max_workers)
                 all_results.extend(results)
             except FileNotFoundError:
                 log.warning("tier_not_found", tier=tier)
@@ -214,110 +357,30 @@ class BenchmarkRunner:
         return all_results
 
     def _find_case(self, case_name: str) -> dict | None:
-        for yaml_file in self._cases_dir.rglob("*.yaml"):
-            with open(yaml_file) as f:
-                spec = yaml.safe_load(f)
-            if spec.get("name") == case_name:
-                return spec
-        return None
+        if self._case_index is None or case_name not in self._case_index:
+            # Built on first lookup and rebuilt on a miss, so new YAML files are picked up
+            self._case_index = self._build_index()
+        yaml_file = self._case_index.get(case_name)
+        if yaml_file is None:
+            return None
+        return _load_case_spec(yaml_file)
+
+    def _build_index(self) -> dict[str, Path]:
+        """Map case name -> YAML file for every spec under the cases directory."""
+        index: dict[str, Path] = {}
+        for yaml_file in _iter_yaml_files(self._cases_dir):
+            name = _peek_case_name(yaml_file)
+            if name is None:
+                spec = _load_case_spec(yaml_file)
+                if not (isinstance(spec, dict) and "name" in spec):
+                    continue
+                name = spec["name"]
+            index.setdefault(name, yaml_file)
+        return index
 
     def _execute(self, case_spec: dict) -> dict:
         """Execute a single benchmark case and score it."""
-        from foampilot.core.orchestrator import Orchestrator
-        from foampilot import config
-
-        case_name = case_spec["name"]
-        run_id = str(uuid.uuid4())[:8]
-
-        if not self._quiet:
-            print(f"\n{_BOLD}{_CYAN}▶ Benchmark: {case_name}{_RESET} {_DIM}(run {run_id}){_RESET}")
-            prompt_preview = case_spec["prompt"][:120].replace("\n", " ")
-            if len(case_spec["prompt"]) > 120:
-                prompt_preview += "…"
-            print(f"  {_DIM}Prompt: {prompt_preview}{_RESET}")
-            print()
-
-        log.info("benchmark_start", case=case_name, run_id=run_id)
-
-        active_version = config.OPENFOAM_VERSION
-        compatible = case_spec.get("compatible_versions", [str(active_version)])
-        if str(active_version) not in [str(v) for v in compatible]:
-            log.warning(
-                "benchmark_version_incompatible",
-                case=case_name,
-                required=compatible,
-                active=active_version,
-            )
-            if not self._quiet:
-                print(f"  {_YELLOW}⚠ Version mismatch: need {compatible}, have v{active_version}{_RESET}")
-
-        progress = _ConsoleProgress(case_name) if not self._quiet else None
-
-        def event_cb(event: dict) -> None:
-            if progress:
-                progress(event)
-
-        start_time = time.time()
-
-        cases_dir = config.CASES_DIR / f"benchmark_{case_name}_{run_id}"
-
-        try:
-            orchestrator = Orchestrator(
-                cases_dir=cases_dir.parent,
-                event_callback=event_cb,
-            )
-            final_state = orchestrator.run(case_spec["prompt"])
-            success = True
-            error_msg = None
-        except Exception as exc:
-            final_state = None
-            success = False
-            error_msg = str(exc)
-            log.error("benchmark_execution_failed", case=case_name, error=error_msg)
-
-        elapsed = time.time() - start_time
-
-        from benchmarks.scorer import score_result
-        score_data = score_result(
-            case_spec=case_spec,
-            final_state=final_state,
-            tool_calls_used=progress.tool_count if progress else 0,
-            elapsed_s=elapsed,
-            error=error_msg,
-        )
-
-        tokens = progress.token_summary if progress else {}
-
-        result = {
-            "case": case_name,
-            "run_id": run_id,
-            "score": score_data["total_score"],
-            "scores": score_data,
-            "tool_calls": progress.tool_count if progress else 0,
-            "elapsed_s": round(elapsed, 1),
-            "success": success,
-            "error": error_msg,
-            "tokens": tokens,
-        }
-
-        result_file = self._results_dir / f"{case_name}_{run_id}.json"
-        result_file.write_text(json.dumps(result, indent=2, default=str))
-        log.info("benchmark_complete", case=case_name, score=result["score"])
-
-        if not self._quiet:
-            score_color = _GREEN if result["score"] >= 70 else (_YELLOW if result["score"] >= 40 else _RED)
-            status = f"{_GREEN}PASS{_RESET}" if success else f"{_RED}FAIL{_RESET}"
-            cost_str = f"${tokens.get('total_cost_usd', 0):.4f}" if tokens else "n/a"
-            print(
-                f"\n  {_BOLD}Result:{_RESET} {status}"
-                f"  {_BOLD}Score:{_RESET} {score_color}{result['score']:.0f}/100{_RESET}"
-                f"  {_DIM}Tools: {result['tool_calls']}  Time: {elapsed:.0f}s  Cost: {cost_str}{_RESET}"
-            )
-            if error_msg:
-                print(f"  {_RED}Error: {error_msg[:200]}{_RESET}")
-            print()
-
-        return result
+        return _execute_case(case_spec, self._results_dir, self._quiet)
 
     def _print_summary(self, results: list[dict]) -> None:
         """Print a summary table of all results."""
@@ -354,3 +417,99 @@ class BenchmarkRunner:
             f"{_DIM}{' '*6} {' '*7} ${total_cost:>7.4f}{_RESET}"
         )
         print(f"{'='*72}\n")
+
+
+def _execute_case(case_spec: dict, results_dir: Path, quiet: bool) -> dict:
+    """Execute a single benchmark case, score it and save the result.
+
+    Kept at module level (no runner state) so it can be submitted to a process pool.
+    """
+    case_name = case_spec["name"]
+    run_id = secrets.token_hex(4)
+
+    if not quiet:
+        print(f"\n{_BOLD}{_CYAN}▶ Benchmark: {case_name}{_RESET} {_DIM}(run {run_id}){_RESET}")
+        prompt_preview = case_spec["prompt"][:120].replace("\n", " ")
+        if len(case_spec["prompt"]) > 120:
+            prompt_preview += "…"
+        print(f"  {_DIM}Prompt: {prompt_preview}{_RESET}")
+        print()
+
+    log.info("benchmark_start", case=case_name, run_id=run_id)
+
+    active_version = config.OPENFOAM_VERSION
+    active_str = str(active_version)
+    compatible = case_spec.get("compatible_versions", [active_str])
+    if active_str not in {str(v) for v in compatible}:
+        log.warning(
+            "benchmark_version_incompatible",
+            case=case_name,
+            required=compatible,
+            active=active_version,
+        )
+        if not quiet:
+            print(f"  {_YELLOW}⚠ Version mismatch: need {compatible}, have v{active_version}{_RESET}")
+
+    # Quiet runs (including every parallel worker) still need the token totals
+    progress = _ConsoleProgress(case_name, echo=not quiet)
+
+    start_time = time.time()
+
+    cases_dir = config.CASES_DIR / f"benchmark_{case_name}_{run_id}"
+
+    try:
+        orchestrator = Orchestrator(
+            cases_dir=cases_dir.parent,
+            event_callback=progress,
+        )
+        final_state = orchestrator.run(case_spec["prompt"])
+        success = True
+        error_msg = None
+    except Exception as exc:
+        final_state = None
+        success = False
+        error_msg = str(exc)
+        log.error("benchmark_execution_failed", case=case_name, error=error_msg)
+
+    elapsed = time.time() - start_time
+
+    score_data = score_result(
+        case_spec=case_spec,
+        final_state=final_state,
+        tool_calls_used=progress.tool_count,
+        elapsed_s=elapsed,
+        error=error_msg,
+    )
+
+    tokens = progress.token_summary
+
+    result = {
+        "case": case_name,
+        "run_id": run_id,
+        "score": score_data["total_score"],
+        "scores": score_data,
+        "tool_calls": progress.tool_count,
+        "elapsed_s": round(elapsed, 1),
+        "success": success,
+        "error": error_msg,
+        "tokens": tokens,
+    }
+
+    result_file = results_dir / f"{case_name}_{run_id}.json"
+    result_file.write_bytes(_dump_result(result))
+    log.info("benchmark_complete", case=case_name, score=result["score"])
+
+    if not quiet:
+        score_color = _GREEN if result["score"] >= 70 else (_YELLOW if result["score"] >= 40 else _RED)
+        status = f"{_GREEN}PASS{_RESET}" if success else f"{_RED}FAIL{_RESET}"
+        cost_str = f"${tokens.get('total_cost_usd', 0):.4f}" if tokens else "n/a"
+        print(
+            f"\n  {_BOLD}Result:{_RESET} {status}"
+            f"  {_BOLD}Score:{_RESET} {score_color}{result['score']:.0f}/100{_RESET}"
+            f"  {_DIM}Tools: {result['tool_calls']}  Time: {elapsed:.0f}s  Cost: {cost_str}{_RESET}"
+        )
+        if error_msg:
+            print(f"  {_RED}Error: {error_msg[:200]}{_RESET}")
+        print()
+
+    return result
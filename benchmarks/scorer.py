@@ -2,9 +2,24 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
+# Component -> (case-spec scoring override key, default weight)
+_WEIGHTS: dict[str, tuple[str, float]] = {
+    "setup_correctness": ("setup_correctness_weight", 0.30),
+    "convergence": ("convergence_weight", 0.25),
+    "mesh": ("mesh_passed_weight", 0.10),
+    "efficiency": ("efficiency_weight", 0.10),
+    "assumption_quality": ("assumption_quality_weight", 0.10),
+}
+
+_DEFAULT_TOTAL_WEIGHT = sum(default for _, default in _WEIGHTS.values())
+_DEFAULT_WEIGHTS: dict[str, float] = {
+    k: default / _DEFAULT_TOTAL_WEIGHT for k, (_, default) in _WEIGHTS.items()
+}
+
 
 def score_result(
     case_spec: dict,
@@ -29,15 +44,33 @@ def score_result(
     scoring = case_spec.get("scoring", {})
     max_tool_calls = case_spec.get("max_tool_calls", 50)
 
+    if final_state is None:
+        # Failed run: only efficiency and the mesh "not required" credit can be non-zero
+        scores = {
+            "setup_correctness": 0.0,
+            "convergence": 0.0,
+            "mesh": 0.0 if expected.get("mesh_passed") else 100.0,
+            "efficiency": _efficiency(tool_calls_used, max_tool_calls) * 100,
+            "assumption_quality": 50.0,
+        }
+        return _with_total(scores, scoring)
+
+    # Bind state attributes once; each is probed by one or more components below
+    case_dir = final_state.case_dir
+    convergence_data = final_state.convergence_data
+    mesh_quality = final_state.mesh_quality
+    assumptions = final_state.assumptions
+    phase = final_state.phase
+
     scores: dict[str, float] = {}
 
     # ── Setup correctness ─────────────────────────────────────────────────────
     setup_score = 0.0
-    if final_state is not None and final_state.case_dir:
-        case_path = Path(str(final_state.case_dir))
+    if case_dir:
+        case_path = Path(str(case_dir))
         files_present = expected.get("files_present", [])
         if files_present:
-            found = sum(1 for f in files_present if (case_path / f).exists())
+            found = _count_present(case_path, files_present)
             setup_score = found / len(files_present)
         else:
             setup_score = 1.0 if case_path.exists() else 0.0
@@ -46,50 +79,82 @@ def score_result(
     # ── Convergence ────────────────────────────────────────────────────────────
     convergence_score = 0.0
     if expected.get("converged"):
-        if final_state and final_state.convergence_data.get("converged"):
+        if convergence_data.get("converged"):
             convergence_score = 1.0
     elif not expected.get("converged"):
         # For transient cases: score based on completing without crash
-        if final_state and str(final_state.phase) != "error":
+        if str(phase) != "error":
             convergence_score = 1.0
     scores["convergence"] = convergence_score * 100
 
     # ── Mesh quality ───────────────────────────────────────────────────────────
     mesh_score = 0.0
     if expected.get("mesh_passed"):
-        if final_state and final_state.mesh_quality.get("passed"):
+        if mesh_quality.get("passed"):
             mesh_score = 1.0
     else:
         mesh_score = 1.0  # Mesh check not required
     scores["mesh"] = mesh_score * 100
 
     # ── Efficiency ─────────────────────────────────────────────────────────────
-    efficiency_score = 1.0
-    if max_tool_calls > 0:
-        usage_ratio = tool_calls_used / max_tool_calls
-        efficiency_score = max(0.0, 1.0 - max(0.0, usage_ratio - 0.5) * 2)
-    scores["efficiency"] = efficiency_score * 100
+    scores["efficiency"] = _efficiency(tool_calls_used, max_tool_calls) * 100
 
     # ── Assumption quality ─────────────────────────────────────────────────────
     assumption_score = 0.5  # Default: neutral
-    if final_state and final_state.assumptions:
+    if assumptions:
         # Having explicit assumptions is good
-        assumption_score = min(1.0, len(final_state.assumptions) / 3 * 0.8 + 0.2)
+        assumption_score = min(1.0, len(assumptions) / 3 * 0.8 + 0.2)
     scores["assumption_quality"] = assumption_score * 100
 
-    # ── Weighted total ─────────────────────────────────────────────────────────
-    weights = {
-        "setup_correctness": scoring.get("setup_correctness_weight", 0.30),
-        "convergence": scoring.get("convergence_weight", 0.25),
-        "mesh": scoring.get("mesh_passed_weight", 0.10),
-        "efficiency": scoring.get("efficiency_weight", 0.10),
-        "assumption_quality": scoring.get("assumption_quality_weight", 0.10),
-    }
-
-    # Normalize weights to sum to 1
-    total_weight = sum(weights.values())
-    if total_weight > 0:
-        weights = {k: v / total_weight for k, v in weights.items()}
+    return _with_total(scores, scoring)
+
+
+def _count_present(case_path: Path, files: list[str]) -> int:
+    """Count how many of *files* (relative to *case_path*) exist.
+
+    Short lists are checked with one stat each; longer lists read each distinct parent
+    directory once (e.g. 0/, constant/, system/) and test names against the listing.
+    """
+    if len(files) <= 3:
+        return sum(1 for f in files if (case_path / f).exists())
+
+    listings: dict[Path, set[str]] = {}
+    found = 0
+    for f in files:
+        rel = Path(f)
+        parent = case_path / rel.parent
+        names = listings.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+            listings[parent] = names
+        if rel.name in names:
+            found += 1
+    return found
+
+
+def _efficiency(tool_calls_used: int, max_tool_calls: int) -> float:
+    """Full credit up to half the tool-call budget, falling linearly to 0 at the budget."""
+    if max_tool_calls <= 0:
+        return 1.0
+    usage_ratio = tool_calls_used / max_tool_calls
+    return max(0.0, 1.0 - max(0.0, usage_ratio - 0.5) * 2)
+
+
+def _with_total(scores: dict[str, float], scoring: dict) -> dict:
+    """Add the weighted ``total_score`` and the normalised ``component_weights``."""
+    if not scoring or not any(key in scoring for key, _ in _WEIGHTS.values()):
+        weights = dict(_DEFAULT_WEIGHTS)
+    else:
+        weights = {k: scoring.get(key, default) for k, (key, default) in _WEIGHTS.items()}
+
+        # Normalize weights to sum to 1
+        total_weight = sum(weights.values())
+        if total_weight > 0:
+            weights = {k: v / total_weight for k, v in weights.items()}
 
     total = sum(scores.get(k, 0) * w for k, w in weights.items())
     scores["total_score"] = round(total, 1)
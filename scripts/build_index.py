@@ -11,6 +11,7 @@ Usage:
 import argparse
 import logging
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add src/ to path so we can import foampilot without installing
@@ -121,32 +122,32 @@ Examples:
     print(f"  Cases:     {len(entries)} tutorial cases indexed")
 
     if entries:
-        # Solver breakdown
-        solvers: dict[str, int] = {}
-        mesh_types: dict[str, int] = {}
-        physics: dict[str, int] = {}
-        has_turb = sum(1 for e in entries if e.turbulence_model)
-        has_emb = sum(1 for e in entries if e.embedding is not None)
+        # Solver breakdown — one pass over entries for all tallies
+        solvers: Counter[str] = Counter()
+        mesh_types: Counter[str] = Counter()
+        physics: Counter[str] = Counter()
+        has_turb = has_emb = 0
 
         for e in entries:
-            solvers[e.solver] = solvers.get(e.solver, 0) + 1
-            mesh_types[e.mesh_type] = mesh_types.get(e.mesh_type, 0) + 1
-            for tag in e.physics_tags:
-                physics[tag] = physics.get(tag, 0) + 1
+            solvers[e.solver] += 1
+            mesh_types[e.mesh_type] += 1
+            physics.update(e.physics_tags)
+            has_turb += bool(e.turbulence_model)
+            has_emb += e.embedding is not None
 
         print()
         print("  Solvers (top 10):")
-        for solver, count in sorted(solvers.items(), key=lambda x: -x[1])[:10]:
+        for solver, count in solvers.most_common(10):
             print(f"    {solver:<35} {count}")
 
         print()
         print("  Mesh types:")
-        for mtype, count in sorted(mesh_types.items(), key=lambda x: -x[1]):
+        for mtype, count in mesh_types.most_common():
             print(f"    {mtype:<35} {count}")
 
         print()
         print("  Physics tags:")
-        for tag, count in sorted(physics.items(), key=lambda x: -x[1]):
+        for tag, count in physics.most_common():
             print(f"    {tag:<35} {count}")
 
         print()
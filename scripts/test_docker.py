@@ -13,13 +13,25 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import io
+import json
+import os
 import shutil
 import sys
+import tarfile
 import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Daemon version + container inspect data from the last successful probe
+PROBE_CACHE_FILE = Path.home() / ".cache" / "foampilot" / "docker_probe.json"
+
 # ── Rich console setup ──────────────────────────────────────────────────────
 try:
     from rich.console import Console
@@ -32,34 +44,43 @@ except ImportError:
     RICH = False
 
     class Console:  # type: ignore
-        def print(self, *a, **kw): print(*a)
-        def rule(self, *a, **kw): print("─" * 60)
+        def __init__(self, file=None, **kw): self.file = file
+        def print(self, *a, **kw): print(*a, file=self.file)
+        def rule(self, *a, **kw): print("─" * 60, file=self.file)
     console = Console()
 
+# Steps running on worker threads print into a per-thread buffer (see _run_step)
+_local = threading.local()
+_print_lock = threading.Lock()
+
+
+def _console():
+    return getattr(_local, "console", None) or console
+
 
 def header(text: str) -> None:
     if RICH:
-        console.rule(f"[bold cyan]{text}[/]")
+        _console().rule(f"[bold cyan]{text}[/]")
     else:
-        print(f"\n{'─'*60}\n{text}\n{'─'*60}")
+        _console().print(f"\n{'─'*60}\n{text}\n{'─'*60}")
 
 
 def ok(label: str, detail: str = "") -> None:
     msg = f"[bold green]  PASS[/]  {label}"
     if detail:
         msg += f"  [dim]{detail}[/]"
-    console.print(msg)
+    _console().print(msg)
 
 
 def fail(label: str, detail: str = "") -> None:
     msg = f"[bold red]  FAIL[/]  {label}"
     if detail:
         msg += f"\n         [red]{detail}[/]"
-    console.print(msg)
+    _console().print(msg)
 
 
 def info(text: str) -> None:
-    console.print(f"  [dim]{text}[/]")
+    _console().print(f"  [dim]{text}[/]")
 
 
 def abort(reason: str) -> None:
@@ -67,18 +88,236 @@ def abort(reason: str) -> None:
     sys.exit(1)
 
 
+# ── Exec session ────────────────────────────────────────────────────────────
+
+class PersistentShell:
+    """One long-lived ``bash`` exec in the container that runs commands sequentially.
+
+    Each ``container.exec_run`` creates and starts a fresh exec instance (two API
+    round-trips plus process setup). This keeps a single non-TTY bash attached via the
+    exec socket and delimits each command's output with sentinel markers instead.
+
+    With *env_script* (e.g. the OpenFOAM bashrc) the script is sourced once when the
+    session starts, so later commands run in the already-prepared environment.
+    """
+
+    _STDOUT, _STDERR = 1, 2
+
+    def __init__(self, client, container, env_script: str | None = None) -> None:
+        exec_id = client.api.exec_create(container.id, ["bash"], stdin=True, tty=False)["Id"]
+        self._sock = client.api.exec_start(exec_id, socket=True)
+        # docker-py returns a SocketIO wrapper on unix sockets; send/recv need the raw socket
+        self._raw = getattr(self._sock, "_sock", self._sock)
+        self._count = 0
+        if env_script:
+            # Queued ahead of the first command; its output is discarded so no read is needed
+            self._raw.sendall(f"{_source_cmd(env_script)}\n".encode())
+
+    def run(self, cmd: str, tail: int | None = None) -> tuple[int, str, str]:
+        """Run *cmd* and return ``(exit_code, stdout, stderr)``.
+
+        The command runs in a brace group with stdin from /dev/null so it cannot swallow
+        the commands queued behind it. With *tail*, output is consumed as it streams in
+        and only the last *tail* non-blank lines of each stream are kept.
+        """
+        self._count += 1
+        marker = f"__FP_END_{self._count}__"
+        self._raw.sendall(
+            f"{{ {cmd}\n}} </dev/null; __fp_rc=$?; "
+            f"echo {marker}$__fp_rc; echo {marker} >&2\n".encode()
+        )
+
+        marker_b = marker.encode()
+        streams = {
+            self._STDOUT: _LineCollector(tail, marker_b),
+            self._STDERR: _LineCollector(tail, marker_b),
+        }
+        while not all(c.done for c in streams.values()):
+            stream, payload = self._read_frame()
+            if stream in streams:
+                streams[stream].feed(payload)
+
+        stdout, stderr = streams[self._STDOUT], streams[self._STDERR]
+        return int(stdout.trailer or b"-1"), stdout.text(), stderr.text()
+
+    def close(self) -> None:
+        try:
+            self._raw.sendall(b"exit\n")
+        finally:
+            self._sock.close()
+
+    def _read_frame(self) -> tuple[int, bytes]:
+        # Non-TTY exec output is multiplexed: 8-byte header (stream, 0, 0, 0, size BE u32)
+        header = self._read_exact(8)
+        size = int.from_bytes(header[4:], "big")
+        return header[0], self._read_exact(size)
+
+    def _read_exact(self, n: int) -> bytes:
+        buf = b""
+        while len(buf) < n:
+            chunk = self._raw.recv(n - len(buf))
+            if not chunk:
+                raise ConnectionError("exec session closed by the container")
+            buf += chunk
+        return buf
+
+
+class ExecRunShell:
+    """Fallback with the same ``run`` interface, issuing one exec per command.
+
+    Each exec is a fresh bash, so *env_script* is sourced again before every command.
+    """
+
+    def __init__(self, container, env_script: str | None = None) -> None:
+        self._container = container
+        self._prelude = f"{_source_cmd(env_script)}; " if env_script else ""
+
+    def run(self, cmd: str, tail: int | None = None) -> tuple[int, str, str]:
+        cmd = self._prelude + cmd
+        if tail is None:
+            r = self._container.exec_run(["bash", "-c", cmd], demux=True)
+            return r.exit_code, (r.output[0] or b"").decode(), (r.output[1] or b"").decode()
+
+        # Stream the output so only the tail is ever held in memory
+        api = self._container.client.api
+        exec_id = api.exec_create(self._container.id, ["bash", "-c", cmd])["Id"]
+        stdout, stderr = _LineCollector(tail), _LineCollector(tail)
+        for out_chunk, err_chunk in api.exec_start(exec_id, stream=True, demux=True):
+            if out_chunk:
+                stdout.feed(out_chunk)
+            if err_chunk:
+                stderr.feed(err_chunk)
+        stdout.flush()
+        stderr.flush()
+        exit_code = api.exec_inspect(exec_id)["ExitCode"]
+        return exit_code, stdout.text(), stderr.text()
+
+    def close(self) -> None:
+        pass
+
+
+class _LineCollector:
+    """Accumulates one output stream line by line, stopping at an end *marker*.
+
+    With *max_lines* set only the last ``max_lines`` non-blank lines are kept, so memory
+    stays bounded however much the command prints. Text after the marker on its line
+    is kept in :attr:`trailer` (the exit code, for stdout).
+    """
+
+    def __init__(self, max_lines: int | None = None, marker: bytes | None = None) -> None:
+        self._lines: deque[bytes] = deque(maxlen=max_lines)
+        self._bounded = max_lines is not None
+        self._marker = marker
+        self._pending = b""
+        self.done = False
+        self.trailer = b""
+
+    def feed(self, data: bytes) -> None:
+        self._pending += data
+        while not self.done:
+            nl = self._pending.find(b"\n")
+            if nl < 0:
+                return
+            line, self._pending = self._pending[: nl + 1], self._pending[nl + 1 :]
+            if self._marker is not None and self._marker in line:
+                before, _, after = line.partition(self._marker)
+                self._add(before)
+                self.trailer = after.strip()
+                self.done = True
+            else:
+                self._add(line)
+
+    def flush(self) -> None:
+        """Keep a final unterminated line (streams without a marker)."""
+        if self._pending:
+            self._add(self._pending)
+            self._pending = b""
+
+    def text(self) -> str:
+        return b"".join(self._lines).decode(errors="replace")
+
+    def _add(self, line: bytes) -> None:
+        if line and not (self._bounded and not line.strip()):
+            self._lines.append(line)
+
+
+def _source_cmd(env_script: str) -> str:
+    return f"[ -f {env_script} ] && source {env_script} >/dev/null 2>&1 </dev/null"
+
+
+def open_shell(client, container, env_script: str | None = None):
+    """Open a PersistentShell, falling back to per-command exec_run if attaching fails."""
+    try:
+        return PersistentShell(client, container, env_script)
+    except Exception as exc:
+        info(f"Persistent exec session unavailable ({exc}); using one exec per command")
+        return ExecRunShell(container, env_script)
+
+
+def _bashrc(version: str) -> str:
+    return f"/opt/openfoam{version}/etc/bashrc"
+
+
 # ───────────────────────────────────────────────────────────────────────────
 
-def test_docker_connection() -> object:
-    """Step 1 – Connect to the Docker daemon."""
+def _cached_daemon_info(client, container_name: str, ttl: float = 60) -> dict | None:
+    """Return the on-disk daemon/container probe for this client if younger than *ttl* s.
+
+    The cache is keyed by the client's base URL and the container name; a TTL of 0
+    disables it.
+    """
+    if ttl <= 0:
+        return None
+    try:
+        data = json.loads(PROBE_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        data.get("base_url") != client.api.base_url
+        or data.get("container") != container_name
+        or time.time() - data.get("timestamp", 0) > ttl
+    ):
+        return None
+    return data
+
+
+def _store_daemon_info(client, container_name: str, version: dict, container) -> None:
+    """Write the daemon version and container inspect data to the probe cache."""
+    try:
+        PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PROBE_CACHE_FILE.write_text(json.dumps({
+            "base_url": client.api.base_url,
+            "container": container_name,
+            "timestamp": time.time(),
+            "version": version,
+            "container_attrs": container.attrs,
+        }))
+    except (OSError, TypeError):
+        pass  # caching is best-effort
+
+
+def test_docker_connection(
+    container_name: str, cache_ttl: float,
+) -> tuple[object, dict, dict | None]:
+    """Step 1 – Connect to the Docker daemon.
+
+    Returns the client, the daemon version info and, when a fresh probe cache exists,
+    its contents; the ping/version round-trips are skipped in that case.
+    """
     header("Step 1: Docker daemon connection")
     try:
         from foampilot.docker.client import _connect_docker
         client = _connect_docker()
+        cached = _cached_daemon_info(client, container_name, cache_ttl)
+        if cached is not None:
+            ok("Docker daemon reachable", "cached probe")
+            info(f"Server version: {cached['version']['Version']}")
+            return client, cached["version"], cached
         client.ping()
         ok("Docker daemon reachable")
-        info(f"Server version: {client.version()['Version']}")
-        return client
+        version = client.version()
+        info(f"Server version: {version['Version']}")
+        return client, version, None
     except Exception as exc:
         fail("Cannot connect to Docker daemon", str(exc))
         abort(
@@ -87,9 +326,27 @@ def test_docker_connection() -> object:
         )
 
 
-def test_container_running(client, container_name: str) -> object:
+def _image_label(container) -> str:
+    """Image name from the container's inspect data (``container.image`` costs an API call)."""
+    attrs = container.attrs
+    return attrs.get("Config", {}).get("Image") or attrs.get("Image", "?")[:19]
+
+
+def test_container_running(
+    client,
+    container_name: str,
+    version: dict,
+    cached: dict | None = None,
+) -> object:
     """Step 2 – Confirm the OpenFOAM container is running."""
     header(f"Step 2: Container '{container_name}' status")
+    if cached is not None:
+        # Rebuild the container model from the cached inspect data (no API call)
+        container = client.containers.prepare_model(cached["container_attrs"])
+        ok("Container is running", f"id={container.short_id}, cached probe")
+        info(f"Image: {_image_label(container)}")
+        return container
+
     try:
         container = client.containers.get(container_name)
     except Exception as exc:
@@ -105,55 +362,73 @@ def test_container_running(client, container_name: str) -> object:
         abort("Run:  docker-compose up -d")
 
     ok(f"Container is running", f"id={container.short_id}")
-    info(f"Image: {container.image.tags[0] if container.image.tags else container.image.short_id}")
+    info(f"Image: {_image_label(container)}")
+    _store_daemon_info(client, container_name, version, container)
     return container
 
 
-def test_basic_exec(container) -> None:
+def test_basic_exec(shell) -> None:
     """Step 3 – Run a trivial command to confirm exec works."""
     header("Step 3: Basic exec (echo)")
-    result = container.exec_run("echo foampilot_test_ok", demux=True)
-    stdout = (result.output[0] or b"").decode().strip()
-    if result.exit_code == 0 and "foampilot_test_ok" in stdout:
-        ok("exec_run works", f"got: {stdout!r}")
+    exit_code, stdout, _ = shell.run("echo foampilot_test_ok")
+    stdout = stdout.strip()
+    if exit_code == 0 and "foampilot_test_ok" in stdout:
+        ok("exec works", f"got: {stdout!r}")
     else:
-        fail("exec_run failed", f"exit={result.exit_code}, stdout={stdout!r}")
+        fail("exec failed", f"exit={exit_code}, stdout={stdout!r}")
+
+
+def _exec_script(shell, script: str) -> dict[str, str]:
+    """Run *script* in a subshell and parse its ``KEY=value`` output lines."""
+    exit_code, stdout, _ = shell.run(f"(\n{script}\n)")
+    values = dict(line.split("=", 1) for line in stdout.splitlines() if "=" in line)
+    values["EXIT_CODE"] = str(exit_code)
+    return values
 
 
-def test_openfoam_env(container, version: str) -> None:
-    """Step 4 – Source the OpenFOAM bashrc and run foamVersion."""
+def test_openfoam_env(shell, version: str) -> None:
+    """Step 4 – Check the OpenFOAM bashrc and run foamVersion.
+
+    *shell* must have been opened with the bashrc as its ``env_script``.
+    """
     header(f"Step 4: OpenFOAM v{version} environment")
-    bashrc = f"/opt/openfoam{version}/etc/bashrc"
+    bashrc = _bashrc(version)
+    platforms = f"/opt/openfoam{version}/platforms"
+
+    # bashrc check, foamVersion and the solver lookup share a single exec round-trip
+    probe = _exec_script(
+        shell,
+        f"if [ ! -f {bashrc} ]; then echo BASHRC_OK=0; exit 0; fi\n"
+        "echo BASHRC_OK=1\n"
+        "out=$(foamVersion 2>&1); echo FOAM_VERSION_RC=$?\n"
+        'echo "FOAM_VERSION=$(echo "$out" | tr \'\\n\' \' \')"\n'
+        # The solver sits at a fixed path for the default build; only search if it moved
+        f"sf={platforms}/linux64GccDPInt32Opt/bin/simpleFoam\n"
+        f'[ -x "$sf" ] || sf=$(find {platforms} -name simpleFoam -type f -executable '
+        "-print -quit 2>/dev/null)\n"
+        'echo "SIMPLE_FOAM=$sf"\n',
+    )
 
-    # Check bashrc exists
-    r = container.exec_run(f"test -f {bashrc}", demux=True)
-    if r.exit_code != 0:
+    if probe.get("BASHRC_OK") != "1":
         fail(f"bashrc not found at {bashrc}")
         info("The image may be for a different OpenFOAM version.")
         return
     ok(f"bashrc found", bashrc)
 
-    # Source and run foamVersion
-    cmd = f"bash -c 'source {bashrc} && foamVersion'"
-    r = container.exec_run(cmd, demux=True)
-    stdout = (r.output[0] or b"").decode().strip()
-    stderr = (r.output[1] or b"").decode().strip()
-    if r.exit_code == 0:
-        ok("foamVersion executed", stdout or "(no output)")
+    foam_version = probe.get("FOAM_VERSION", "").strip()
+    if probe.get("FOAM_VERSION_RC") == "0":
+        ok("foamVersion executed", foam_version or "(no output)")
     else:
-        fail("foamVersion failed", stderr or stdout)
+        fail("foamVersion failed", foam_version)
 
-    # Check that a key solver binary exists
-    solver_cmd = f"bash -c 'source {bashrc} && which simpleFoam'"
-    r = container.exec_run(solver_cmd, demux=True)
-    path = (r.output[0] or b"").decode().strip()
-    if r.exit_code == 0 and path:
+    path = probe.get("SIMPLE_FOAM", "").strip()
+    if path:
         ok("simpleFoam binary found", path)
     else:
-        fail("simpleFoam not found after sourcing bashrc")
+        fail(f"simpleFoam not found under {platforms}")
 
 
-def test_volume_mount(container, host_cases_dir: Path, container_cases_dir: str) -> None:
+def test_volume_mount(shell, host_cases_dir: Path, container_cases_dir: str) -> None:
     """Step 5 – Verify the volume mount (host ↔ container)."""
     header("Step 5: Volume mount (host ↔ container)")
     sentinel_name = ".foampilot_mount_test"
@@ -162,20 +437,32 @@ def test_volume_mount(container, host_cases_dir: Path, container_cases_dir: str)
     sentinel_host = host_cases_dir / sentinel_name
     try:
         host_cases_dir.mkdir(parents=True, exist_ok=True)
-        sentinel_host.write_text("mount_ok")
+        # Raw fd write + fsync: the container must see the data when it reads the file
+        fd = os.open(sentinel_host, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, b"mount_ok")
+            os.fsync(fd)
+        finally:
+            os.close(fd)
     except Exception as exc:
         fail("Cannot write to host cases dir", str(exc))
         return
 
-    # Check it's visible in the container
+    # Read the host file and write one back from the container in a single exec
     container_path = f"{container_cases_dir}/{sentinel_name}"
-    r = container.exec_run(f"cat {container_path}", demux=True)
-    content = (r.output[0] or b"").decode().strip()
+    host_write_path = host_cases_dir / ".foampilot_container_write"
+    probe = _exec_script(
+        shell,
+        f'echo "SENTINEL=$(cat {container_path} 2>/dev/null)"\n'
+        f"echo container_write_ok > {container_cases_dir}/.foampilot_container_write"
+        " && sync && echo WRITE_OK=1 || echo WRITE_OK=0\n",
+    )
     sentinel_host.unlink(missing_ok=True)
 
-    if r.exit_code == 0 and content == "mount_ok":
+    if probe.get("SENTINEL", "").strip() == "mount_ok":
         ok("Host→container visible", f"{host_cases_dir} → {container_cases_dir}")
     else:
+        host_write_path.unlink(missing_ok=True)
         fail(
             "Host files NOT visible in container",
             f"Container path: {container_path}\n"
@@ -183,13 +470,8 @@ def test_volume_mount(container, host_cases_dir: Path, container_cases_dir: str)
         )
         return
 
-    # Write from container, check on host
-    host_write_path = host_cases_dir / ".foampilot_container_write"
-    r = container.exec_run(
-        f"bash -c 'echo container_write_ok > {container_cases_dir}/.foampilot_container_write'",
-        demux=True,
-    )
-    if r.exit_code == 0 and host_write_path.exists():
+    # Check the container's write on the host
+    if probe.get("WRITE_OK") == "1" and host_write_path.exists():
         content = host_write_path.read_text().strip()
         host_write_path.unlink(missing_ok=True)
         ok("Container→host write works", f"read back: {content!r}")
@@ -198,35 +480,14 @@ def test_volume_mount(container, host_cases_dir: Path, container_cases_dir: str)
         fail("Container cannot write to mounted volume")
 
 
-def test_blockmesh(
-    container,
-    host_cases_dir: Path,
-    container_cases_dir: str,
-    version: str,
-) -> None:
-    """Step 6 – Run blockMesh on a minimal 2D cavity case."""
-    header("Step 6: blockMesh end-to-end")
-
-    test_case_name = "foampilot_docker_test"
-    host_case = host_cases_dir / test_case_name
-    container_case = f"{container_cases_dir}/{test_case_name}"
-
-    # Clean up any leftover from a previous run
-    if host_case.exists():
-        shutil.rmtree(host_case)
-
-    # Write a minimal cavity blockMeshDict
-    (host_case / "system").mkdir(parents=True)
-    (host_case / "constant").mkdir(parents=True)
-    (host_case / "0").mkdir(parents=True)
-
-    (host_case / "system" / "controlDict").write_text(
+# Minimal 2D cavity case used by the blockMesh step
+_CAVITY_FILES = {
+    "system/controlDict": (
         'FoamFile { version 2.0; format ascii; class dictionary; object controlDict; }\n'
         'application icoFoam;\nstartFrom startTime;\nstartTime 0;\n'
         'stopAt endTime;\nendTime 0.1;\ndeltaT 0.005;\nwriteControl timeStep;\nwriteInterval 20;\n'
-    )
-
-    (host_case / "system" / "blockMeshDict").write_text(
+    ),
+    "system/blockMeshDict": (
         'FoamFile { version 2.0; format ascii; class dictionary; object blockMeshDict; }\n'
         'scale 0.1;\n'
         'vertices\n(\n'
@@ -241,18 +502,92 @@ def test_blockmesh(
         '    fixedWalls  { type wall; faces ((0 4 7 3) (2 6 5 1) (1 5 4 0)); }\n'
         '    frontAndBack { type empty; faces ((0 3 2 1) (4 5 6 7)); }\n'
         ');\n'
-    )
+    ),
+}
+_CAVITY_DIRS = ("system", "constant", "0")
+
+
+def _case_archive(case_name: str) -> bytes:
+    """Build an in-memory tar of the cavity case rooted at *case_name*/."""
+    buf = io.BytesIO()
+    now = time.time()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        # Directories are world-writable: the archive is extracted as root, while
+        # blockMesh (container user) must write constant/polyMesh and the host
+        # must be able to clean the case up afterwards
+        for d in ("", *_CAVITY_DIRS):
+            ti = tarfile.TarInfo(f"{case_name}/{d}".rstrip("/"))
+            ti.type, ti.mode, ti.mtime = tarfile.DIRTYPE, 0o777, now
+            tar.addfile(ti)
+        for rel, text in _CAVITY_FILES.items():
+            data = text.encode()
+            ti = tarfile.TarInfo(f"{case_name}/{rel}")
+            ti.size, ti.mode, ti.mtime = len(data), 0o666, now
+            tar.addfile(ti, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _remove_case(case_dir: Path) -> None:
+    """Delete the test case by emptying its known subdirectories, deepest first.
+
+    Avoids a blind recursive walk of the bind mount; anything unexpected left behind
+    is handed to shutil.rmtree.
+    """
+    for sub in ("constant/polyMesh", "system", "0", "constant", ""):
+        path = os.path.join(case_dir, sub) if sub else str(case_dir)
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        os.unlink(entry.path)
+            os.rmdir(path)
+        except FileNotFoundError:
+            continue
+        except OSError:
+            shutil.rmtree(case_dir, ignore_errors=True)
+            return
+
+
+def test_blockmesh(
+    shell,
+    container,
+    host_cases_dir: Path,
+    container_cases_dir: str,
+) -> None:
+    """Step 6 – Run blockMesh on a minimal 2D cavity case.
+
+    *shell* must have been opened with the OpenFOAM bashrc as its ``env_script``.
+    """
+    header("Step 6: blockMesh end-to-end")
+
+    test_case_name = "foampilot_docker_test"
+    host_case = host_cases_dir / test_case_name
+    container_case = f"{container_cases_dir}/{test_case_name}"
+
+    # Clean up any leftover from a previous run (rmtree no-ops on a missing dir)
+    shutil.rmtree(host_case, ignore_errors=True)
+
+    # Upload the case as one tar archive (a single API call) rather than creating
+    # each directory and file on the host through the bind mount
+    try:
+        uploaded = container.put_archive(container_cases_dir, _case_archive(test_case_name))
+    except Exception as exc:
+        info(f"put_archive failed ({exc}); writing the case on the host instead")
+        uploaded = False
+    if not uploaded:
+        for d in _CAVITY_DIRS:
+            (host_case / d).mkdir(parents=True, exist_ok=True)
+        for rel, text in _CAVITY_FILES.items():
+            (host_case / rel).write_text(text)
 
     info(f"Created test case at {host_case}")
     info(f"Running: blockMesh in container at {container_case}")
 
-    bashrc = f"/opt/openfoam{version}/etc/bashrc"
-    cmd = f"bash -c 'source {bashrc} && cd {container_case} && blockMesh'"
-    r = container.exec_run(cmd, demux=True)
-    stdout = (r.output[0] or b"").decode()
-    stderr = (r.output[1] or b"").decode()
+    # The shell has already sourced the bashrc. Only the tail is displayed, so stream
+    # the output rather than buffering all of it
+    exit_code, stdout, stderr = shell.run(f"(cd {container_case} && blockMesh)", tail=10)
 
-    if r.exit_code == 0:
+    if exit_code == 0:
         ok("blockMesh succeeded", f"exit_code=0")
         # Check that constant/polyMesh was created
         poly_mesh = host_case / "constant" / "polyMesh"
@@ -266,7 +601,7 @@ def test_blockmesh(
         for line in tail:
             info(f"  {line}")
     else:
-        fail("blockMesh failed", f"exit_code={r.exit_code}")
+        fail("blockMesh failed", f"exit_code={exit_code}")
         if stderr:
             info("stderr:")
             for line in stderr.splitlines()[-10:]:
@@ -277,27 +612,67 @@ def test_blockmesh(
                 info(f"  {line}")
 
     # Clean up test case
-    shutil.rmtree(host_case, ignore_errors=True)
+    _remove_case(host_case)
     info(f"Test case cleaned up.")
 
 
-def print_summary(results: dict[str, bool]) -> None:
-    """Print a final pass/fail table."""
+def _run_step(fail_label: str, fn, *args) -> tuple[bool, str]:
+    """Run one step with its console output captured; returns ``(passed, output)``."""
+    buf = io.StringIO()
+    if RICH:
+        _local.console = Console(
+            file=buf, force_terminal=console.is_terminal, width=console.width,
+        )
+    else:
+        _local.console = Console(file=buf)
+    try:
+        fn(*args)
+        return True, buf.getvalue()
+    except Exception as exc:
+        fail(fail_label, str(exc))
+        return False, buf.getvalue()
+    finally:
+        _local.console = None
+
+
+class Check(IntEnum):
+    """Index of each check in the results list, in the order they run."""
+
+    DAEMON = 0
+    CONTAINER = 1
+    EXEC = 2
+    OPENFOAM_ENV = 3
+    VOLUME_MOUNT = 4
+    BLOCKMESH = 5
+
+
+CHECK_NAMES = (
+    "Docker daemon connection",
+    "Container running",
+    "Basic exec (echo)",
+    "OpenFOAM environment",
+    "Volume mount (host↔container)",
+    "blockMesh end-to-end",
+)
+
+
+def print_summary(results: list[bool]) -> None:
+    """Print a final pass/fail table; ``results`` is indexed by :class:`Check`."""
     header("Summary")
     if RICH:
         table = Table(box=box.ROUNDED, show_header=True, header_style="bold")
         table.add_column("Test", style="cyan")
         table.add_column("Result", justify="center")
-        for name, passed in results.items():
+        for name, passed in zip(CHECK_NAMES, results):
             icon = "[bold green]PASS[/]" if passed else "[bold red]FAIL[/]"
             table.add_row(name, icon)
         console.print(table)
     else:
-        for name, passed in results.items():
+        for name, passed in zip(CHECK_NAMES, results):
             status = "PASS" if passed else "FAIL"
             print(f"  {status}  {name}")
 
-    all_passed = all(results.values())
+    all_passed = all(results)
     if all_passed:
         console.print("\n[bold green]All checks passed. Docker is ready for FoamPilot.[/]\n")
     else:
@@ -325,6 +700,11 @@ def main() -> None:
         "--container-cases-dir", default="/home/openfoam/cases",
         help="Container-side cases directory (default: /home/openfoam/cases)",
     )
+    parser.add_argument(
+        "--probe-cache-ttl", type=float, default=60,
+        help="Reuse the cached daemon/container probe for this many seconds; 0 disables "
+             "(default: 60)",
+    )
     args = parser.parse_args()
 
     host_cases_dir = Path(args.host_cases_dir)
@@ -341,47 +721,57 @@ def main() -> None:
     else:
         print("FoamPilot — Docker Connectivity Test")
 
-    results: dict[str, bool] = {}
+    results = [False] * len(Check)
 
     # Step 1
-    client = test_docker_connection()
-    results["Docker daemon connection"] = True
+    client, version, cached = test_docker_connection(args.container, args.probe_cache_ttl)
+    results[Check.DAEMON] = True
 
     # Step 2
-    container = test_container_running(client, args.container)
-    results["Container running"] = True
-
-    # Step 3
-    try:
-        test_basic_exec(container)
-        results["Basic exec (echo)"] = True
-    except Exception as exc:
-        fail("Basic exec exception", str(exc))
-        results["Basic exec (echo)"] = False
-
-    # Step 4
+    container = test_container_running(client, args.container, version, cached)
+    results[Check.CONTAINER] = True
+
+    # Steps 3-5 are independent and mostly wait on the Docker API, so they run
+    # concurrently, each on its own exec session. Output is buffered per step and
+    # printed in step order.
+    # The two shells that run OpenFOAM commands source its bashrc once, up front
+    bashrc = _bashrc(args.version)
+    shells = [open_shell(client, container, env) for env in (bashrc, bashrc, None)]
     try:
-        test_openfoam_env(container, args.version)
-        results["OpenFOAM environment"] = True
-    except Exception as exc:
-        fail("OpenFOAM env exception", str(exc))
-        results["OpenFOAM environment"] = False
-
-    # Step 5
-    try:
-        test_volume_mount(container, host_cases_dir, args.container_cases_dir)
-        results["Volume mount (host↔container)"] = True
-    except Exception as exc:
-        fail("Volume mount exception", str(exc))
-        results["Volume mount (host↔container)"] = False
-
-    # Step 6
-    try:
-        test_blockmesh(container, host_cases_dir, args.container_cases_dir, args.version)
-        results["blockMesh end-to-end"] = True
-    except Exception as exc:
-        fail("blockMesh exception", str(exc))
-        results["blockMesh end-to-end"] = False
+        concurrent_steps = [
+            (Check.EXEC, "Basic exec exception",
+             test_basic_exec, (shells[0],)),
+            (Check.OPENFOAM_ENV, "OpenFOAM env exception",
+             test_openfoam_env, (shells[1], args.version)),
+            (Check.VOLUME_MOUNT, "Volume mount exception",
+             test_volume_mount, (shells[2], host_cases_dir, args.container_cases_dir)),
+        ]
+        with ThreadPoolExecutor(max_workers=len(concurrent_steps)) as pool:
+            futures = [
+                (check, pool.submit(_run_step, fail_label, fn, *fn_args))
+                for check, fail_label, fn, fn_args in concurrent_steps
+            ]
+            for check, future in futures:
+                passed, output = future.result()
+                with _print_lock:
+                    sys.stdout.write(output)
+                    sys.stdout.flush()
+                results[check] = passed
+
+        # Step 6 depends on the volume mount, so it runs after steps 3-5
+        try:
+            test_blockmesh(shells[0], container, host_cases_dir, args.container_cases_dir)
+            results[Check.BLOCKMESH] = True
+        except Exception as exc:
+            fail("blockMesh exception", str(exc))
+    finally:
+        for shell in shells:
+            shell.close()
+
+    if cached is not None and not all(results):
+        # The cached probe may be stale; make the next run re-check the daemon and container
+        PROBE_CACHE_FILE.unlink(missing_ok=True)
+        info("Probe cache cleared; re-run to re-check the daemon and container.")
 
     print_summary(results)
 
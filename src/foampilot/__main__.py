@@ -4,7 +4,39 @@ import argparse
 import sys
 
 
+def _parse_run_fast(argv: list[str]) -> tuple[str | None, bool] | None:
+    """Parse the common ``foampilot [run [request] [-v]]`` forms without argparse.
+
+    Returns ``(request, verbose)``, or None when *argv* needs the full parser
+    (other subcommands, --help, unknown flags, more than one request argument).
+    """
+    if not argv:
+        return None, False
+    if argv[0] != "run":
+        return None
+
+    request: str | None = None
+    verbose = False
+    for arg in argv[1:]:
+        if arg in ("--verbose", "-v"):
+            verbose = True
+        elif arg.startswith("-") or request is not None:
+            return None
+        else:
+            request = arg
+    return request, verbose
+
+
 def main() -> None:
+    # Fast path for the common interactive/one-shot run: skip building the parser
+    fast = _parse_run_fast(sys.argv[1:])
+    if fast is not None:
+        request, verbose = fast
+        from foampilot.logging_setup import configure_logging
+        configure_logging(verbose=verbose)
+        _run_terminal(request, verbose=verbose)
+        return
+
     parser = argparse.ArgumentParser(
         prog="foampilot",
         description="AI agent for OpenFOAM CFD simulations",
@@ -24,6 +56,12 @@ def main() -> None:
     eval_parser = subparsers.add_parser("eval", help="Run benchmark evaluation")
     eval_parser.add_argument("--case", help="Specific benchmark case to run")
     eval_parser.add_argument("--suite", choices=["tier1", "tier2", "tier3"], help="Benchmark tier")
+    eval_parser.add_argument(
+        "--parallel", action="store_true", help="Run the cases of each tier concurrently",
+    )
+    eval_parser.add_argument(
+        "--workers", type=int, default=4, help="Worker processes with --parallel (default: 4)",
+    )
     eval_parser.add_argument("--verbose", "-v", action="store_true", help="Show DEBUG logs")
 
     # Build tutorial index
@@ -74,13 +112,13 @@ def _run_eval(args: argparse.Namespace) -> None:
         sys.path.insert(0, str(project_root))
 
     from benchmarks.runner import BenchmarkRunner
-    runner = BenchmarkRunner()
+    runner = BenchmarkRunner(parallel=args.parallel)
     if args.case:
         runner.run_case(args.case)
     elif args.suite:
-        runner.run_suite(args.suite)
+        runner.run_suite(args.suite, max_workers=args.workers)
     else:
-        runner.run_all()
+        runner.run_all(max_workers=args.workers)
 
 
 def _run_web(args: argparse.Namespace) -> None:
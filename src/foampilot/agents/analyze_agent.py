@@ -47,6 +47,7 @@ class AnalyzeAgent(BaseAgent):
             max_turns=20,
             event_callback=self._event_cb,
             approval_callback=self._approval_cb,
+            permission_checker=self._permission,
         )
 
         solver = state.simulation_spec.get("solver", "unknown") if state.simulation_spec else "unknown"
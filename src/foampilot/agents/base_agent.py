@@ -2,14 +2,81 @@
 
 from __future__ import annotations
 
+import json
+import re
 from typing import Any
 
+from foampilot.core.permissions import PermissionChecker
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json path below is equivalent
+    orjson = None
+
+_RE_JSON_FENCE = re.compile(r"```json\s*([\s\S]+?)\s*```")
+
+
+def pretty_json(obj: Any) -> str:
+    """Serialize *obj* as 2-space indented JSON for an agent task prompt."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def extract_json(text: str, fenced: bool = True) -> Any | None:
+    """Extract the first JSON object from an LLM response.
+
+    A ```json fenced block is preferred (when *fenced* is True). Otherwise the text is
+    scanned once for balanced top-level ``{...}`` spans — braces inside JSON strings
+    are ignored — and the first span that parses is returned. The scan is linear in
+    the length of the text, unlike a greedy first-brace-to-last-brace regex.
+
+    Returns:
+        The decoded value, or None if nothing parses.
+    """
+    if fenced:
+        match = _RE_JSON_FENCE.search(text)
+        if match:
+            try:
+                return json.loads(match.group(1))
+            except json.JSONDecodeError:
+                pass
+
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif depth == 0:
+            continue
+        elif ch == '"':
+            in_string = True
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                try:
+                    return json.loads(text[start : i + 1])
+                except json.JSONDecodeError:
+                    continue
+    return None
+
 
 class BaseAgent:
     """Common constructor shared by all pipeline agents.
 
-    Provides ``docker_client``, ``event_callback``, and ``approval_callback``
-    as instance attributes so every subclass has a consistent interface and
+    Provides ``docker_client``, ``event_callback``, ``approval_callback`` and
+    ``permission_checker`` as instance attributes so every subclass has a consistent interface and
     the orchestrator can safely pass ``**docker_kwargs`` to any agent without
     a crash.
     """
@@ -19,7 +86,10 @@ class BaseAgent:
         docker_client: Any | None = None,
         event_callback: Any | None = None,
         approval_callback: Any | None = None,
+        permission_checker: PermissionChecker | None = None,
     ) -> None:
         self._docker = docker_client
         self._event_cb = event_callback
         self._approval_cb = approval_callback
+        # None lets each agent loop build one from config.PERMISSION_MODE
+        self._permission = permission_checker
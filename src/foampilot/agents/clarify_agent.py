@@ -20,6 +20,10 @@ from foampilot import config
 
 log = structlog.get_logger(__name__)
 
+_RE_CONFIRM_BLOCK = re.compile(r"```confirm\s*([\s\S]+?)\s*```")
+_RE_CONFIRM_STRIP = re.compile(r"```confirm[\s\S]*?```")
+_RE_MARKUP_TAG = re.compile(r"\[.*?\]")
+
 MAX_CLARIFY_TURNS = 5
 
 CLARIFY_SYSTEM_PROMPT = """\
@@ -107,7 +111,7 @@ class ClarifyAgent:
             if has_confirm:
                 params = self._extract_confirm(assistant_text)
                 # Strip the confirm block from displayed text
-                display_text = re.sub(r"```confirm[\s\S]*?```", "", assistant_text).strip()
+                display_text = _RE_CONFIRM_STRIP.sub("", assistant_text).strip()
             else:
                 display_text = assistant_text
 
@@ -175,7 +179,7 @@ class ClarifyAgent:
 
     def _extract_confirm(self, text: str) -> dict:
         """Extract the JSON object from a ```confirm ... ``` block."""
-        match = re.search(r"```confirm\s*([\s\S]+?)\s*```", text)
+        match = _RE_CONFIRM_BLOCK.search(text)
         if match:
             try:
                 return json.loads(match.group(1))
@@ -239,5 +243,4 @@ class ClarifyAgent:
         try:
             console.print(markup)
         except Exception:
-            import re as _re
-            print(_re.sub(r"\[.*?\]", "", markup))
+            print(_RE_MARKUP_TAG.sub("", markup))
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-import json
-import re
 from typing import Any
 
 import structlog
 
-from foampilot.agents.base_agent import BaseAgent
+from foampilot.agents.base_agent import BaseAgent, extract_json
 from foampilot.core.subagent import SubagentConfig, run_subagent
 from foampilot.prompts.consult import get_consult_prompt
 from foampilot.tools.registry import ToolRegistry
@@ -38,6 +36,7 @@ class ConsultAgent(BaseAgent):
             max_turns=10,
             event_callback=self._event_cb,
             approval_callback=self._approval_cb,
+            permission_checker=self._permission,
         )
 
         task = (
@@ -54,21 +53,9 @@ class ConsultAgent(BaseAgent):
 
     def _extract_json(self, text: str) -> dict:
         """Extract a JSON object from the LLM response text."""
-        # Try to find a ```json ... ``` block
-        match = re.search(r"```json\s*([\s\S]+?)\s*```", text)
-        if match:
-            try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        # Try to find a raw { ... } block
-        match = re.search(r"\{[\s\S]+\}", text)
-        if match:
-            try:
-                return json.loads(match.group(0))
-            except json.JSONDecodeError:
-                pass
+        spec = extract_json(text)
+        if isinstance(spec, dict):
+            return spec
 
         log.warning("consult_json_extraction_failed", text_preview=text[:200])
         # Return minimal spec as fallback
@@ -7,7 +7,7 @@ from typing import Any
 
 import structlog
 
-from foampilot.agents.base_agent import BaseAgent
+from foampilot.agents.base_agent import BaseAgent, extract_json
 from foampilot.core.subagent import SubagentConfig, run_subagent
 from foampilot.prompts.mesh import get_mesh_prompt
 from foampilot.tools.foam.check_mesh import CheckMeshTool
@@ -46,6 +46,7 @@ class MeshAgent(BaseAgent):
             max_turns=20,
             event_callback=self._event_cb,
             approval_callback=self._approval_cb,
+            permission_checker=self._permission,
         )
 
         task = (
@@ -58,13 +59,9 @@ class MeshAgent(BaseAgent):
         result = run_subagent(cfg, task)
 
         # Try to extract structured mesh quality from response
-        import json, re
-        match = re.search(r"\{[\s\S]+\}", result.final_response)
-        if match:
-            try:
-                return json.loads(match.group(0))
-            except json.JSONDecodeError:
-                pass
+        mesh_result = extract_json(result.final_response, fenced=False)
+        if mesh_result is not None:
+            return mesh_result
 
         return {
             "passed": False,
@@ -2,23 +2,44 @@
 
 from __future__ import annotations
 
-import json
-import re
 from pathlib import Path
 from typing import Any
 
 import structlog
 
-from foampilot.agents.base_agent import BaseAgent
+from foampilot import config
+from foampilot.agents.base_agent import BaseAgent, extract_json, pretty_json
+from foampilot.core.permissions import PermissionChecker, PermissionDeniedError
 from foampilot.core.subagent import SubagentConfig, run_subagent
+from foampilot.docker.session import open_exec_session
 from foampilot.prompts.run import get_run_prompt
 from foampilot.tools.foam.edit_foam_dict import EditFoamDictTool
 from foampilot.tools.foam.parse_log import ParseLogTool
 from foampilot.tools.foam.read_foam_file import ReadFoamFileTool
 from foampilot.tools.foam.run_foam_cmd import RunFoamCmdTool
+from foampilot.tools.general.submit_result import SubmitResultTool
+from foampilot.version.registry import VersionRegistry
 
 log = structlog.get_logger(__name__)
 
+_RUN_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "converged": {"type": "boolean"},
+        "final_residuals": {
+            "type": "object",
+            "additionalProperties": {"type": "number"},
+            "description": "Final initial residual per field, e.g. {\"p\": 1e-5}",
+        },
+        "iterations": {"type": "integer"},
+        "continuity_error": {"type": ["number", "null"]},
+        "execution_time_s": {"type": ["number", "null"]},
+        "fixes_applied": {"type": "array", "items": {"type": "string"}},
+        "issues": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["converged", "final_residuals", "issues"],
+}
+
 
 class RunAgent(BaseAgent):
     """Executes the OpenFOAM solver and monitors convergence."""
@@ -35,41 +56,138 @@ class RunAgent(BaseAgent):
         """
         solver = simulation_spec.get("solver", "simpleFoam")
 
+        # Solver runs and retries reuse one exec session with the bashrc sourced once
+        session = None
+        if self._docker is not None:
+            version = VersionRegistry.get().active().VERSION
+            session = open_exec_session(
+                self._docker, env_script=f"/opt/openfoam{version}/etc/bashrc",
+            )
+
         tools = {
-            "run_foam_cmd": RunFoamCmdTool(docker_client=self._docker),
+            "run_foam_cmd": RunFoamCmdTool(docker_client=self._docker, exec_session=session),
             "parse_log": ParseLogTool(docker_client=self._docker),
             "read_foam_file": ReadFoamFileTool(),
             "edit_foam_dict": EditFoamDictTool(),
+            "submit_result": SubmitResultTool(
+                _RUN_RESULT_SCHEMA, "the run's convergence status and final residuals",
+            ),
         }
 
-        cfg = SubagentConfig(
-            name="run",
-            system_prompt=get_run_prompt(case_dir=case_dir.resolve()),
-            tools=tools,
-            max_turns=20,
-            event_callback=self._event_cb,
-            approval_callback=self._approval_cb,
-        )
-
-        task = (
-            f"Execute {solver} for the OpenFOAM case at: {case_dir}\n\n"
-            f"Simulation spec:\n```json\n{json.dumps(simulation_spec, indent=2)}\n```\n\n"
-            "Run the solver, then use parse_log to analyze convergence. "
-            "If it diverges, diagnose and attempt to fix. "
-            "Return a JSON summary with convergence status and final residuals."
-        )
-
-        result = run_subagent(cfg, task)
-
-        match = re.search(r"\{[\s\S]+\}", result.final_response)
-        if match:
-            try:
-                return json.loads(match.group(0))
-            except json.JSONDecodeError:
-                pass
+        # The fast path and the agent loop share one checker, so both honour the same mode
+        permission = self._permission or PermissionChecker()
+        try:
+            fast_result = None
+            if config.FAST_PATH_SIMPLE_TASKS:
+                try:
+                    fast_result = self._run_fast_path(case_dir, solver, tools, permission)
+                except PermissionDeniedError as exc:
+                    return {"converged": False, "final_residuals": {}, "issues": [str(exc)]}
+                if fast_result is not None and fast_result["converged"]:
+                    return fast_result
+
+            cfg = SubagentConfig(
+                name="run",
+                system_prompt=get_run_prompt(case_dir=case_dir.resolve()),
+                tools=tools,
+                max_turns=20,
+                event_callback=self._event_cb,
+                approval_callback=self._approval_cb,
+                permission_checker=permission,
+            )
+
+            task = (
+                f"Execute {solver} for the OpenFOAM case at: {case_dir}\n\n"
+                f"Simulation spec:\n```json\n{pretty_json(simulation_spec)}\n```\n\n"
+                "Run the solver, then use parse_log to analyze convergence. "
+                "If it diverges, diagnose and attempt to fix. "
+                "Finish by calling submit_result with the convergence status and final residuals."
+            )
+            if fast_result is not None:
+                # Start the agent from the failed run's log instead of re-running blind
+                task += (
+                    f"\n\n{solver} has already been run once and did not converge. "
+                    f"Its log is at {case_dir.resolve()}/log.{solver}; start by parsing it."
+                )
+
+            result = run_subagent(cfg, task)
+        finally:
+            if session is not None:
+                session.close()
+
+        run_result = result.result or extract_json(result.final_response, fenced=False)
+        if run_result is not None:
+            return run_result
 
         return {
             "converged": False,
             "final_residuals": {},
             "issues": ["Could not extract run result from agent response"],
         }
+
+    def _run_fast_path(
+        self, case_dir: Path, solver: str, tools: dict, permission: PermissionChecker,
+    ) -> dict | None:
+        """Run the solver and parse its log directly, without an LLM turn.
+
+        Most runs need no reasoning: execute the solver, read the residuals. The
+        same permission checks and UI events as the agent loop apply.
+
+        Returns:
+            A RunResult dict (converged or not) once the solver has run, or None
+            if it could not be run here and the agent should handle it.
+
+        Raises:
+            PermissionDeniedError: If the user denies one of the tool calls.
+        """
+        case_path = str(case_dir.resolve())
+        calls = [
+            ("run_foam_cmd", {
+                "command": solver, "case_dir": case_path, "log_file": f"log.{solver}",
+            }),
+            ("parse_log", {"log_path": f"{case_path}/log.{solver}"}),
+        ]
+        results = []
+        for tool_name, tool_input in calls:
+            tool = tools[tool_name]
+            if permission.requires_approval(tool.permission_level):
+                self._emit("approval_required", {"tool": tool_name, "input": tool_input})
+                if self._approval_cb and not self._approval_cb(tool_name, tool_input):
+                    raise PermissionDeniedError(f"User denied execution of tool '{tool_name}'")
+            if permission.should_notify(tool.permission_level):
+                self._emit("tool_notify", {"tool": tool_name, "input": tool_input})
+            self._emit("tool_call", {"tool": tool_name, "input": tool_input})
+            result = tool.execute(**tool_input)
+            self._emit("tool_result", {
+                "tool": tool_name, "success": result.success,
+                "data": result.data, "error": result.error,
+            })
+            if not result.success:
+                log.info("run_fast_path_fallback", tool=tool_name, error=result.error)
+                if tool_name == "run_foam_cmd":
+                    return None
+                return {"converged": False, "final_residuals": {}, "issues": [result.error]}
+            results.append(result.data)
+
+        run_data, log_data = results
+        converged = run_data.get("exit_code") == 0 and log_data.get("converged", False)
+        log.info("run_fast_path", solver=solver, converged=converged)
+        issues = [log_data["likely_issue"]] if log_data.get("likely_issue") else []
+        if run_data.get("exit_code") != 0:
+            issues.append(f"{solver} exited with code {run_data.get('exit_code')}")
+        # Same RunResult shape the agent submits through submit_result
+        return {
+            "converged": converged,
+            "final_residuals": log_data.get("final_residuals", {}),
+            "iterations": log_data.get("iterations", 0),
+            "continuity_error": log_data.get("continuity_error"),
+            "execution_time_s": (
+                log_data.get("execution_time_s") or run_data.get("execution_time_s")
+            ),
+            "fixes_applied": [],
+            "issues": issues,
+        }
+
+    def _emit(self, event_type: str, data: dict) -> None:
+        if self._event_cb:
+            self._event_cb({"type": event_type, "data": data})
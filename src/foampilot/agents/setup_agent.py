@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-import json
-import re
 from pathlib import Path
 from typing import Any
 
 import structlog
 
-from foampilot.agents.base_agent import BaseAgent
+from foampilot.agents.base_agent import BaseAgent, extract_json, pretty_json
 from foampilot.core.subagent import SubagentConfig, run_subagent
 from foampilot.prompts.setup import get_setup_prompt
 from foampilot.tools.foam.copy_tutorial import CopyTutorialTool
@@ -19,9 +17,32 @@ from foampilot.tools.foam.search_tutorials import SearchTutorialsTool
 from foampilot.tools.foam.write_foam_file import WriteFoamFileTool
 from foampilot.tools.general.read_file import ReadFileTool
 from foampilot.tools.general.str_replace import StrReplaceTool
+from foampilot.tools.general.submit_result import SubmitResultTool
 
 log = structlog.get_logger(__name__)
 
+_SETUP_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "tutorial_source": {"type": "string"},
+        "case_dir": {"type": "string"},
+        "files_modified": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string"},
+                    "action": {"type": "string"},
+                    "description": {"type": "string"},
+                },
+                "required": ["path", "action", "description"],
+            },
+        },
+        "assumptions": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["tutorial_source", "case_dir", "files_modified", "assumptions"],
+}
+
 
 class SetupAgent(BaseAgent):
     """Finds the best tutorial template and adapts it for the simulation spec."""
@@ -44,6 +65,9 @@ class SetupAgent(BaseAgent):
             "write_foam_file": WriteFoamFileTool(),
             "read_file": ReadFileTool(),
             "str_replace": StrReplaceTool(),
+            "submit_result": SubmitResultTool(
+                _SETUP_RESULT_SCHEMA, "the tutorial used and every file modification",
+            ),
         }
 
         cfg = SubagentConfig(
@@ -53,33 +77,27 @@ class SetupAgent(BaseAgent):
             max_turns=30,
             event_callback=self._event_cb,
             approval_callback=self._approval_cb,
+            permission_checker=self._permission,
         )
 
         task = (
             f"Set up an OpenFOAM case for the following simulation specification:\n\n"
-            f"```json\n{json.dumps(simulation_spec, indent=2)}\n```\n\n"
+            f"```json\n{pretty_json(simulation_spec)}\n```\n\n"
             f"Target case directory: {case_dir}\n\n"
-            "Use search_tutorials to find the best matching template, copy it, then modify it."
+            "Use search_tutorials to find the best matching template, copy it, then modify it. "
+            "Finish by calling submit_result."
         )
 
         result = run_subagent(cfg, task)
+        if result.result is not None:
+            return result.result
         return self._extract_result(result.final_response, str(case_dir))
 
     def _extract_result(self, text: str, case_dir: str) -> dict:
         """Extract setup result JSON from the agent response."""
-        match = re.search(r"```json\s*([\s\S]+?)\s*```", text)
-        if match:
-            try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        match = re.search(r"\{[\s\S]+\}", text)
-        if match:
-            try:
-                return json.loads(match.group(0))
-            except json.JSONDecodeError:
-                pass
+        setup_result = extract_json(text)
+        if setup_result is not None:
+            return setup_result
 
         return {
             "case_dir": case_dir,
@@ -35,6 +35,16 @@ MODEL: str = os.environ.get("FOAMPILOT_MODEL", "claude-sonnet-4-5-20250929")
 # Model for complex reasoning tasks (compaction, difficult diagnosis)
 MODEL_COMPLEX: str = os.environ.get("FOAMPILOT_MODEL_COMPLEX", "claude-opus-4-5")
 
+# Sampling temperature for agent and compaction calls. At 0 responses are
+# deterministic and repeated requests are served from the LLM response cache.
+LLM_TEMPERATURE: float = float(os.environ.get("FOAMPILOT_TEMPERATURE", "1.0"))
+
+# Max responses kept by the in-memory LLM cache
+LLM_CACHE_SIZE: int = int(os.environ.get("FOAMPILOT_LLM_CACHE_SIZE", "256"))
+
+# Optional Redis URL for sharing the LLM cache across processes (needs `redis`)
+LLM_CACHE_REDIS_URL: str = os.environ.get("FOAMPILOT_LLM_CACHE_REDIS_URL", "")
+
 # ── Agent Behavior ─────────────────────────────────────────────────────────────
 MAX_TURNS: int = int(os.environ.get("FOAMPILOT_MAX_TURNS", "100"))
 
@@ -43,6 +53,18 @@ COMPACTION_THRESHOLD: float = float(
     os.environ.get("FOAMPILOT_COMPACTION_THRESHOLD", "0.70")
 )
 
+# Transcripts estimated below this many tokens are compacted with MODEL;
+# larger ones use MODEL_COMPLEX
+COMPACTION_MODEL_THRESHOLD: int = int(
+    os.environ.get("FOAMPILOT_COMPACTION_MODEL_THRESHOLD", "20000")
+)
+
+# Run the solver and parse its log directly, without an LLM turn; the RunAgent
+# loop is only started if that run does not converge
+FAST_PATH_SIMPLE_TASKS: bool = os.environ.get(
+    "FOAMPILOT_FAST_PATH_SIMPLE_TASKS", "false"
+).lower() in ("1", "true", "yes")
+
 # "standard" | "auto_approve" | "strict"
 PERMISSION_MODE: str = os.environ.get("FOAMPILOT_PERMISSION_MODE", "standard")
 
@@ -4,6 +4,9 @@ Implements the core decide → act → observe → repeat cycle.
 Handles tool dispatch, token tracking, compaction, and permission checks.
 """
 
+import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,12 +15,88 @@ from anthropic import Anthropic
 from anthropic.types import Message, ToolUseBlock
 
 from foampilot import config
-from foampilot.core.compaction import compact_conversation
+from foampilot.core.compaction import summarize_conversation, summary_message
+from foampilot.core.llm_cache import cache_key, get_llm_cache, is_cacheable
 from foampilot.core.permissions import PermissionChecker, PermissionDeniedError
 from foampilot.core.token_tracker import TokenTracker
+from foampilot.tools.general.submit_result import SUBMIT_RESULT
 
 log = structlog.get_logger(__name__)
 
+# Prompt-cache breakpoint: the request prefix up to and including the marked block is cached
+_EPHEMERAL = {"type": "ephemeral"}
+
+# Tool results older than this many tool turns have their bodies replaced by a stub
+_KEEP_TOOL_TURNS = 5
+# Results shorter than this are kept as-is; the stub would save next to nothing
+_TRUNCATE_MIN_CHARS = 500
+# Tool results are read by the model, not people: no indentation, spaces or \u escapes
+_COMPACT_JSON = {"separators": (",", ":"), "ensure_ascii": False}
+# Rough characters-per-token ratio for estimating truncation savings
+_CHARS_PER_TOKEN = 4
+
+
+def _usage_count(usage: Any, name: str) -> int:
+    """Read an optional usage counter (absent or None when prompt caching is unused)."""
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _is_tool_turn(message: dict) -> bool:
+    content = message.get("content")
+    return (
+        message.get("role") == "user"
+        and isinstance(content, list)
+        and any(isinstance(b, dict) and b.get("type") == "tool_result" for b in content)
+    )
+
+
+class _StaleToolResults:
+    """Stubs out tool result bodies older than the last *keep_last_k* tool turns.
+
+    The tool_use blocks are left intact, so the model still sees which calls were
+    made. Truncated messages are replaced, not mutated. The tool turns not yet
+    truncated are tracked as messages are appended, so each message is examined
+    once and a turn with nothing stale costs O(1). Use a fresh instance whenever
+    the message list is replaced.
+    """
+
+    def __init__(self, keep_last_k: int = _KEEP_TOOL_TURNS) -> None:
+        self._keep_last_k = keep_last_k
+        self._pending: deque[int] = deque()  # Untruncated tool turns, oldest first
+        self._scanned = 0
+
+    def truncate(self, messages: list[dict]) -> int:
+        """Truncate the tool turns that became stale and return the characters saved."""
+        for i in range(self._scanned, len(messages)):
+            if _is_tool_turn(messages[i]):
+                self._pending.append(i)
+        self._scanned = len(messages)
+
+        saved = 0
+        while len(self._pending) > self._keep_last_k:
+            i = self._pending.popleft()
+            content = []
+            for block in messages[i]["content"]:
+                is_result = isinstance(block, dict) and block.get("type") == "tool_result"
+                body = block.get("content") if is_result else None
+                if isinstance(body, str) and len(body) > _TRUNCATE_MIN_CHARS:
+                    stub = f"[truncated — older tool output, {len(body)} chars]"
+                    saved += len(body) - len(stub)
+                    block = {**block, "content": stub}
+                content.append(block)
+            messages[i] = {**messages[i], "content": content}
+        return saved
+
+
+def _cache_breakpoint(message: dict) -> dict:
+    """Return *message* with a prompt-cache breakpoint on its (text) content."""
+    content = message["content"]
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    *head, last = content
+    return {**message, "content": [*head, {**last, "cache_control": _EPHEMERAL}]}
+
 
 @dataclass
 class AgentLoopResult:
@@ -27,6 +106,7 @@ class AgentLoopResult:
     turn_count: int
     token_summary: dict
     stopped_reason: str  # "end_turn" | "max_turns" | "error" | "permission_denied"
+    result: dict | None = None  # Input of the submit_result call, if the agent made one
 
 
 class AgentLoop:
@@ -41,6 +121,7 @@ class AgentLoop:
             Receives (tool_name, tool_input) and must return True to proceed.
         event_callback: Optional callable for UI event streaming.
             Called with event dicts: {"type": ..., "data": ...}
+        max_turns: Turn limit for this loop (defaults to config.MAX_TURNS).
     """
 
     def __init__(
@@ -51,53 +132,177 @@ class AgentLoop:
         permission_checker: PermissionChecker | None = None,
         approval_callback: Any | None = None,
         event_callback: Any | None = None,
+        max_turns: int | None = None,
     ) -> None:
         self._system_prompt = system_prompt
         self._tools = tools
+        # The tool set is fixed for the loop's lifetime, so the schemas are serialized once
+        self._anthropic_tools_cached = self._build_anthropic_tools()
         self._client = client or Anthropic(api_key=config.ANTHROPIC_API_KEY)
         self._permission = permission_checker or PermissionChecker()
         self._approval_callback = approval_callback
         self._event_cb = event_callback
+        self._max_turns = max_turns or config.MAX_TURNS
         self._token_tracker = TokenTracker()
+        self._pool: ThreadPoolExecutor | None = None
+        # Tool calls started while the response was still streaming, by tool_use id
+        self._started: dict[str, Future] = {}
+        self._can_start_early = False
+        # Latest compaction summary; while set, messages[0] is the message carrying it
+        self._summary: str | None = None
 
     def _emit(self, event_type: str, data: dict) -> None:
         if self._event_cb:
             self._event_cb({"type": event_type, "data": data})
 
-    def _anthropic_tools(self) -> list[dict]:
-        return [t.to_anthropic_tool() for t in self._tools.values()]
+    def _anthropic_tools(self) -> tuple[dict, ...]:
+        return self._anthropic_tools_cached
+
+    def _build_anthropic_tools(self) -> tuple[dict, ...]:
+        tools = [t.to_anthropic_tool() for t in self._tools.values()]
+        if tools:
+            # Tools come first in the prompt, so this caches them even if the system prompt changes
+            tools[-1] = {**tools[-1], "cache_control": _EPHEMERAL}
+        return tuple(tools)
 
     def _call_llm(self, messages: list[dict], turn: int) -> Message:
-        response = self._client.messages.create(
-            model=config.MODEL,
-            max_tokens=8192,
-            system=self._system_prompt,
-            tools=self._anthropic_tools(),
-            messages=messages,
-        )
+        """Stream one response, emitting text as it arrives and starting tools early."""
+        self._started = {}
+        self._can_start_early = True
+        request = {
+            "model": config.MODEL,
+            "max_tokens": 8192,
+            "temperature": config.LLM_TEMPERATURE,
+            "system": [{"type": "text", "text": self._system_prompt, "cache_control": _EPHEMERAL}],
+            "tools": self._anthropic_tools(),
+            "messages": messages,
+        }
+
+        key = None
+        if is_cacheable(config.LLM_TEMPERATURE):
+            key = cache_key(**request)
+            cached = get_llm_cache().get(key)
+            if cached is not None:
+                # No tokens were spent, so nothing is recorded with the tracker
+                log.info("llm_cache_hit", turn=turn)
+                return cached
+
+        with self._client.messages.stream(**request) as stream:
+            for event in stream:
+                if event.type == "text":
+                    self._emit("llm_token", {"turn": turn, "text": event.text})
+                elif event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                    self._start_early(event.content_block)
+            response = stream.get_final_message()
+        if key is not None:
+            get_llm_cache().set(key, response)
         self._token_tracker.record(
             turn=turn,
             model=config.MODEL,
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
+            cache_read_tokens=_usage_count(response.usage, "cache_read_input_tokens"),
+            cache_write_tokens=_usage_count(response.usage, "cache_creation_input_tokens"),
         )
         return response
 
     def _execute_tool(self, tool_use: ToolUseBlock, messages: list[dict]) -> dict:
         """Execute a single tool call and return the tool_result message dict."""
         tool_name = tool_use.name
-        tool_input = tool_use.input
 
         tool = self._tools.get(tool_name)
         if tool is None:
-            result_content = f"Error: Unknown tool '{tool_name}'"
-            self._emit("tool_error", {"tool": tool_name, "error": result_content})
-            return {
-                "type": "tool_result",
-                "tool_use_id": tool_use.id,
-                "content": result_content,
-                "is_error": True,
-            }
+            return self._error_result(tool_use, f"Unknown tool '{tool_name}'")
+
+        self._authorize_tool(tool, tool_use)
+        return self._tool_result(tool_use, tool.execute(**tool_use.input))
+
+    def _start_early(self, tool_use: ToolUseBlock) -> None:
+        """Start a tool call whose block has closed while the response is still streaming.
+
+        Only the leading run of parallel-safe calls that need no approval qualifies, so
+        nothing starts ahead of a call it would have waited for.
+        """
+        tool = self._tools.get(tool_use.name)
+        if (
+            not self._can_start_early
+            or tool is None
+            or not tool.is_parallel_safe
+            or self._permission.requires_approval(tool.permission_level)
+        ):
+            self._can_start_early = False
+            return
+        self._started[tool_use.id] = self._pool.submit(tool.execute, **tool_use.input)
+
+    def _execute_parallel(self, tool_uses: list[ToolUseBlock]) -> list[dict]:
+        """Execute parallel-safe tool calls concurrently, returning results in call order.
+
+        Permission checks and events stay on the calling thread; only
+        ``tool.execute`` runs in the worker threads. Calls already started while
+        streaming are picked up rather than run again.
+        """
+        futures = []
+        for tool_use in tool_uses:
+            tool = self._tools[tool_use.name]
+            self._authorize_tool(tool, tool_use)
+            future = self._started.pop(tool_use.id, None)
+            if future is None:
+                future = self._pool.submit(tool.execute, **tool_use.input)
+            futures.append(future)
+        return [
+            self._tool_result(tool_use, future.result())
+            for tool_use, future in zip(tool_uses, futures)
+        ]
+
+    def _execute_tools(self, tool_uses: list[ToolUseBlock], messages: list[dict]) -> list[dict]:
+        """Execute one turn's tool calls and return their tool_result dicts in order.
+
+        Consecutive calls to parallel-safe tools run together; any other call runs on
+        its own, so writes stay ordered with respect to the reads around them.
+        """
+        results: list[dict] = []
+        batch: list[ToolUseBlock] = []
+        for tool_use in tool_uses:
+            tool = self._tools.get(tool_use.name)
+            if tool is not None and tool.is_parallel_safe:
+                batch.append(tool_use)
+                continue
+            results.extend(self._execute_parallel(batch))
+            batch = []
+            results.append(self._execute_tool(tool_use, messages))
+        results.extend(self._execute_parallel(batch))
+        return results
+
+    def _check_submission(
+        self, submits: list[ToolUseBlock], others: list[ToolUseBlock],
+    ) -> str | None:
+        """Return why a turn's submit_result call can't end the run, or None if it can."""
+        if others or len(submits) > 1:
+            return (
+                "submit_result must be the only tool call in its turn. The other calls "
+                "have run; check their results, then call submit_result again on its own."
+            )
+        required = self._tools[SUBMIT_RESULT].input_schema.get("required", [])
+        missing = [key for key in required if key not in submits[0].input]
+        if missing:
+            return f"submit_result is missing required field(s): {', '.join(missing)}"
+        return None
+
+    def _error_result(self, tool_use: ToolUseBlock, message: str) -> dict:
+        """Emit a tool_error event and build an error tool_result for *tool_use*."""
+        content = f"Error: {message}"
+        self._emit("tool_error", {"tool": tool_use.name, "error": content})
+        return {
+            "type": "tool_result",
+            "tool_use_id": tool_use.id,
+            "content": content,
+            "is_error": True,
+        }
+
+    def _authorize_tool(self, tool: Any, tool_use: ToolUseBlock) -> None:
+        """Run the permission check for a call and emit its pre-execution events."""
+        tool_name = tool_use.name
+        tool_input = tool_use.input
 
         # Permission check
         if self._permission.requires_approval(tool.permission_level):
@@ -113,17 +318,16 @@ class AgentLoop:
 
         self._emit("tool_call", {"tool": tool_name, "input": tool_input})
 
-        result = tool.execute(**tool_input)
-
+    def _tool_result(self, tool_use: ToolUseBlock, result: Any) -> dict:
+        """Emit the tool_result event and build the tool_result message dict."""
         self._emit("tool_result", {
-            "tool": tool_name, "success": result.success,
+            "tool": tool_use.name, "success": result.success,
             "data": result.data, "error": result.error,
         })
 
         content = result.data if result.success else f"Error: {result.error}"
         if isinstance(content, dict):
-            import json
-            content = json.dumps(content)
+            content = json.dumps(content, **_COMPACT_JSON)
 
         return {
             "type": "tool_result",
@@ -148,69 +352,106 @@ class AgentLoop:
         turn = 0
         final_response = ""
         stopped_reason = "end_turn"
-
-        while turn < config.MAX_TURNS:
-            turn += 1
-            log.info("agent_turn_start", turn=turn)
-
-            # Compact if context is getting large
-            if self._token_tracker.should_compact() and len(messages) > 1:
-                log.info("compaction_triggered", turn=turn)
-                self._emit("compaction", {"turn": turn})
-                messages = compact_conversation(messages, client=self._client)
-
-            try:
-                response = self._call_llm(messages, turn)
-            except Exception as exc:
-                log.error("llm_call_failed", turn=turn, error=str(exc))
-                self._emit("llm_error", {"turn": turn, "error": str(exc)})
-                stopped_reason = "error"
-                final_response = f"LLM call failed: {exc}"
-                break
-
-            text_content = " ".join(
-                b.text for b in response.content if hasattr(b, "text") and b.text  # type: ignore[attr-defined]
-            )
-            self._emit("llm_response", {
-                "turn": turn,
-                "stop_reason": response.stop_reason,
-                "has_tool_calls": any(isinstance(b, ToolUseBlock) for b in response.content),
-                "text": text_content,
-            })
-
-            # Extract text content and tool calls
-            text_blocks = [b for b in response.content if hasattr(b, "text")]
-            tool_use_blocks = [b for b in response.content if isinstance(b, ToolUseBlock)]
-
-            if text_blocks:
-                final_response = text_blocks[-1].text  # type: ignore[attr-defined]
-
-            # Append assistant message
-            messages.append({"role": "assistant", "content": response.content})
-
-            # No tool calls → agent is done
-            if not tool_use_blocks or response.stop_reason == "end_turn":
-                stopped_reason = "end_turn"
-                break
-
-            # Execute all tool calls, collect results
-            tool_results = []
-            try:
-                for tool_use in tool_use_blocks:
-                    result_dict = self._execute_tool(tool_use, messages)
-                    tool_results.append(result_dict)
-            except PermissionDeniedError as exc:
-                log.warning("permission_denied", error=str(exc))
-                stopped_reason = "permission_denied"
-                final_response = str(exc)
-                break
-
-            # Append tool results as user message
-            messages.append({"role": "user", "content": tool_results})
-
-        else:
-            stopped_reason = "max_turns"
-            log.warning("max_turns_reached", max_turns=config.MAX_TURNS)
+        submitted: dict | None = None
+        self._summary = None
+        stale_results = _StaleToolResults()
+        self._pool = ThreadPoolExecutor(thread_name_prefix="foampilot-tool")
+
+        try:
+            while turn < self._max_turns:
+                turn += 1
+                log.info("agent_turn_start", turn=turn)
+
+                # Cheaply drop old tool output first; compaction is only needed if that
+                # isn't enough
+                saved_chars = stale_results.truncate(messages)
+                if saved_chars:
+                    self._token_tracker.record_truncation(saved_chars // _CHARS_PER_TOKEN)
+
+                # Compact if context is getting large
+                if self._token_tracker.should_compact() and len(messages) > 1:
+                    log.info("compaction_triggered", turn=turn)
+                    self._emit("compaction", {"turn": turn})
+                    # After the first compaction only the messages since the summary are sent
+                    self._summary = summarize_conversation(
+                        messages[1:] if self._summary is not None else messages,
+                        client=self._client,
+                        previous_summary=self._summary,
+                    )
+                    # Cache the summary too, so later turns reuse it with the system prompt
+                    messages = [_cache_breakpoint(summary_message(self._summary))]
+                    stale_results = _StaleToolResults()
+
+                try:
+                    response = self._call_llm(messages, turn)
+                except Exception as exc:
+                    log.error("llm_call_failed", turn=turn, error=str(exc))
+                    self._emit("llm_error", {"turn": turn, "error": str(exc)})
+                    stopped_reason = "error"
+                    final_response = f"LLM call failed: {exc}"
+                    break
+
+                text_content = " ".join(
+                    b.text  # type: ignore[attr-defined]
+                    for b in response.content if hasattr(b, "text") and b.text
+                )
+                self._emit("llm_response", {
+                    "turn": turn,
+                    "stop_reason": response.stop_reason,
+                    "has_tool_calls": any(isinstance(b, ToolUseBlock) for b in response.content),
+                    "text": text_content,
+                })
+
+                # Extract text content and tool calls
+                text_blocks = [b for b in response.content if hasattr(b, "text")]
+                tool_use_blocks = [b for b in response.content if isinstance(b, ToolUseBlock)]
+
+                if text_blocks:
+                    final_response = text_blocks[-1].text  # type: ignore[attr-defined]
+
+                # Append assistant message
+                messages.append({"role": "assistant", "content": response.content})
+
+                # No tool calls → agent is done
+                if not tool_use_blocks or response.stop_reason == "end_turn":
+                    stopped_reason = "end_turn"
+                    break
+
+                # A valid submit_result call on its own is the final answer; the loop ends
+                # without another turn. Otherwise the other calls run and the submit is
+                # rejected, so the model resubmits once it has seen their results.
+                submits = [b for b in tool_use_blocks if b.name == SUBMIT_RESULT]
+                rejected: list[ToolUseBlock] = []
+                if submits and SUBMIT_RESULT in self._tools:
+                    others = [b for b in tool_use_blocks if b.name != SUBMIT_RESULT]
+                    rejection = self._check_submission(submits, others)
+                    if rejection is None:
+                        submitted = dict(submits[0].input)
+                        self._emit("tool_call", {"tool": SUBMIT_RESULT, "input": submitted})
+                        stopped_reason = "end_turn"
+                        break
+                    rejected, tool_use_blocks = submits, others
+
+                # Execute all tool calls, collect results
+                try:
+                    tool_results = self._execute_tools(tool_use_blocks, messages)
+                except PermissionDeniedError as exc:
+                    log.warning("permission_denied", error=str(exc))
+                    stopped_reason = "permission_denied"
+                    final_response = str(exc)
+                    break
+                tool_results += [self._error_result(b, rejection) for b in rejected]
+
+                # Append tool results as user message
+                messages.append({"role": "user", "content": tool_results})
+
+            else:
+                stopped_reason = "max_turns"
+                log.warning("max_turns_reached", max_turns=self._max_turns)
+
+        finally:
+            # Also reached when a tool or compaction raises: cancel calls started early
+            self._pool.shutdown(wait=False, cancel_futures=True)
 
         self._emit("agent_done", {
             "stopped_reason": stopped_reason,
@@ -223,4 +464,5 @@ class AgentLoop:
             turn_count=turn,
             token_summary=self._token_tracker.summary(),
             stopped_reason=stopped_reason,
+            result=submitted,
         )
@@ -0,0 +1,88 @@
+"""Run several independent simulation requests (e.g. a parameter sweep) at once.
+
+Each request gets its own Orchestrator session and case directory. Sessions run
+concurrently on a thread pool. Nearly all of a session's time is spent waiting on
+the LLM API or on Docker, so N cases take about as long as the slowest one
+instead of the sum of all of them. The Docker connection is shared.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from foampilot.core.orchestrator import Orchestrator
+from foampilot.core.state import SimulationState
+
+log = structlog.get_logger(__name__)
+
+
+def _tagged(event_callback: Any | None, index: int) -> Any | None:
+    """Wrap *event_callback* so each event says which batch entry it came from."""
+    if event_callback is None:
+        return None
+
+    def _forward(event: dict) -> None:
+        event_callback({**event, "batch_index": index})
+
+    return _forward
+
+
+def run_batch(
+    requests: list[str],
+    confirmed_params: list[dict | None] | None = None,
+    cases_dir: Path | None = None,
+    event_callback: Any | None = None,
+    approval_callback: Any | None = None,
+    max_workers: int = 4,
+) -> list[SimulationState]:
+    """Run each request through its own Orchestrator session concurrently.
+
+    Args:
+        requests: Natural language simulation requests, one per case.
+        confirmed_params: Optional per-request confirmed parameters (same length
+            as *requests*); entries may be None.
+        cases_dir: Base directory where simulation cases live.
+        event_callback: Optional callable for UI events. Called from worker
+            threads; each event carries a ``batch_index`` key.
+        approval_callback: Called when an APPROVE-level tool needs confirmation.
+            Must be thread-safe, since sessions may ask concurrently.
+        max_workers: Maximum number of sessions running at once.
+
+    Returns:
+        Final SimulationState for each request, in request order.
+    """
+    if not requests:
+        return []
+    if confirmed_params is None:
+        confirmed_params = [None] * len(requests)
+    if len(confirmed_params) != len(requests):
+        raise ValueError("confirmed_params must have one entry per request")
+
+    orchestrators: list[Orchestrator] = []
+    docker_client = None
+    for index in range(len(requests)):
+        orch = Orchestrator(
+            cases_dir=cases_dir,
+            event_callback=_tagged(event_callback, index),
+            approval_callback=approval_callback,
+            docker_client=docker_client,
+        )
+        # The first session connects to Docker; the rest reuse its client
+        docker_client = orch.docker_client
+        orchestrators.append(orch)
+
+    log.info("batch_start", cases=len(requests), max_workers=max_workers)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as pool:
+        futures = [
+            pool.submit(orch.run, request, params)
+            for orch, request, params in zip(orchestrators, requests, confirmed_params)
+        ]
+        states = [future.result() for future in futures]
+    log.info(
+        "batch_complete",
+        cases=len(states),
+        phases=[state.phase.value for state in states],
+    )
+    return states
@@ -3,13 +3,20 @@
 When triggered, makes a separate LLM call to summarize the conversation while
 preserving: original task, key decisions + rationale, current file state, outstanding issues.
 The message history is then replaced with the summary.
+
+Compaction is incremental: once a summary exists, only the messages added since
+are sent, together with the previous summary, and the model merges the two.
 """
 
+import io
+from typing import Any
+
 from anthropic import Anthropic
 
 import structlog
 
 from foampilot import config
+from foampilot.core.llm_cache import cache_key, get_llm_cache, is_cacheable
 
 log = structlog.get_logger(__name__)
 
@@ -30,74 +37,156 @@ Include ALL of the following:
 Format as structured markdown. Be precise and technical. Do NOT omit file paths or numerical values.
 """
 
+# Rough characters-per-token ratio for sizing the transcript without an API call
+_CHARS_PER_TOKEN = 4
+# Summary budget bounds; the budget scales with the transcript between them
+_MIN_SUMMARY_TOKENS = 1024
+_MAX_SUMMARY_TOKENS = 4096
 
-def compact_conversation(
+_SUMMARY_HEADER = "[CONVERSATION SUMMARY — history compacted to save context]\n\n"
+
+
+def _compaction_params(n_chars: int) -> tuple[str, int]:
+    """Pick the model and max_tokens for summarizing *n_chars* of input.
+
+    Small transcripts don't need the complex model, and their summaries are short.
+    """
+    est_tokens = n_chars // _CHARS_PER_TOKEN
+    model = config.MODEL if est_tokens < config.COMPACTION_MODEL_THRESHOLD else config.MODEL_COMPLEX
+    max_tokens = min(max(est_tokens // 4, _MIN_SUMMARY_TOKENS), _MAX_SUMMARY_TOKENS)
+    return model, max_tokens
+
+
+def _block_text(block: Any) -> str | None:
+    """Render one content block for the transcript (None for unsupported blocks)."""
+    if not isinstance(block, dict):
+        # Assistant turns hold SDK content blocks rather than dicts
+        if not hasattr(block, "model_dump"):
+            return None
+        block = block.model_dump()
+    block_type = block.get("type")
+    if block_type == "text":
+        return block.get("text", "")
+    if block_type == "tool_use":
+        return f"[TOOL_CALL: {block.get('name')} input={block.get('input')}]"
+    if block_type == "tool_result":
+        return f"[TOOL_RESULT: {block.get('content')}]"
+    return None
+
+
+def _build_transcript(messages: list[dict]) -> str:
+    """Build a plain-text representation of *messages* for the summarizer."""
+    out = io.StringIO()
+    for i, msg in enumerate(messages):
+        if i:
+            out.write("\n\n")
+        out.write(f"--- {msg.get('role', 'unknown').upper()} ---\n")
+        content = msg.get("content", "")
+        if isinstance(content, list):
+            # Tool use / tool result blocks
+            parts = (_block_text(block) for block in content)
+            out.write("\n".join(p for p in parts if p is not None))
+        else:
+            out.write(str(content))
+    return out.getvalue()
+
+
+def summarize_conversation(
     messages: list[dict],
     client: Anthropic | None = None,
-) -> list[dict]:
-    """Summarize the conversation and return a single-message replacement history.
+    previous_summary: str | None = None,
+) -> str:
+    """Summarize *messages* and return the summary text.
 
     Args:
-        messages: The full message history to compact.
+        messages: The messages to summarize. With *previous_summary*, only the
+            messages added since that summary.
         client: Optional Anthropic client (creates one if not provided).
+        previous_summary: Summary of the conversation before *messages*, merged
+            into the new summary.
 
     Returns:
-        A new message list containing only a single user message with the summary.
+        The summary text.
     """
     if client is None:
         client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
 
-    log.info("compaction_start", message_count=len(messages))
+    log.info(
+        "compaction_start",
+        message_count=len(messages),
+        incremental=previous_summary is not None,
+    )
 
-    # Build a plain-text representation for the summarizer
-    transcript_parts = []
-    for msg in messages:
-        role = msg.get("role", "unknown")
-        content = msg.get("content", "")
-        if isinstance(content, list):
-            # Tool use / tool result blocks
-            parts = []
-            for block in content:
-                if isinstance(block, dict):
-                    if block.get("type") == "text":
-                        parts.append(block.get("text", ""))
-                    elif block.get("type") == "tool_use":
-                        parts.append(
-                            f"[TOOL_CALL: {block.get('name')} input={block.get('input')}]"
-                        )
-                    elif block.get("type") == "tool_result":
-                        parts.append(f"[TOOL_RESULT: {block.get('content')}]")
-            content = "\n".join(parts)
-        transcript_parts.append(f"--- {role.upper()} ---\n{content}")
-
-    transcript = "\n\n".join(transcript_parts)
-
-    response = client.messages.create(
-        model=config.MODEL_COMPLEX,
-        max_tokens=4096,
-        system=_COMPACTION_SYSTEM_PROMPT,
-        messages=[
+    transcript = _build_transcript(messages)
+    if previous_summary is None:
+        content: str | list[dict] = f"Summarize this FoamPilot conversation:\n\n{transcript}"
+        n_chars = len(transcript)
+    else:
+        content = [
             {
-                "role": "user",
-                "content": f"Summarize this FoamPilot conversation:\n\n{transcript}",
-            }
-        ],
-    )
+                "type": "text",
+                "text": f"Summary of the FoamPilot conversation so far:\n\n{previous_summary}",
+                "cache_control": {"type": "ephemeral"},
+            },
+            {
+                "type": "text",
+                "text": (
+                    f"Conversation since that summary:\n\n{transcript}\n\n"
+                    "Write an updated summary that merges both. It will replace the "
+                    "previous summary."
+                ),
+            },
+        ]
+        n_chars = len(previous_summary) + len(transcript)
+    model, max_tokens = _compaction_params(n_chars)
+
+    request = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": config.LLM_TEMPERATURE,
+        "system": _COMPACTION_SYSTEM_PROMPT,
+        "messages": [{"role": "user", "content": content}],
+    }
+
+    # Compaction inputs are large and fully determined by the history, so at
+    # temperature 0 a repeated compaction is answered from the cache
+    key = cache_key(**request) if is_cacheable(config.LLM_TEMPERATURE) else None
+    response = get_llm_cache().get(key) if key is not None else None
+    if response is None:
+        response = client.messages.create(**request)
+        if key is not None:
+            get_llm_cache().set(key, response)
 
     summary_text = response.content[0].text  # type: ignore[index]
 
     log.info(
         "compaction_complete",
         original_messages=len(messages),
+        model=model,
         summary_tokens=response.usage.output_tokens,
     )
+    return summary_text
+
+
+def summary_message(summary_text: str) -> dict:
+    """Return the user message that replaces the compacted history."""
+    return {"role": "user", "content": f"{_SUMMARY_HEADER}{summary_text}"}
+
+
+def compact_conversation(
+    messages: list[dict],
+    client: Anthropic | None = None,
+    previous_summary: str | None = None,
+) -> list[dict]:
+    """Summarize the conversation and return a single-message replacement history.
 
-    # Replace history with a single user message containing the summary
-    return [
-        {
-            "role": "user",
-            "content": (
-                f"[CONVERSATION SUMMARY — history compacted to save context]\n\n{summary_text}"
-            ),
-        }
-    ]
+    Args:
+        messages: The message history to compact (see :func:`summarize_conversation`).
+        client: Optional Anthropic client (creates one if not provided).
+        previous_summary: Summary of the conversation before *messages*, if any.
+
+    Returns:
+        A new message list containing only a single user message with the summary.
+    """
+    summary_text = summarize_conversation(messages, client, previous_summary)
+    return [summary_message(summary_text)]
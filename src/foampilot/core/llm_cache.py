@@ -0,0 +1,127 @@
+"""Content-addressed cache for deterministic LLM responses.
+
+Only requests sent at temperature 0 are cached: the response is then a function
+of the request, so an identical (model, system, tools, messages) request — as in
+resumed sessions or benchmark reruns — can be answered without an API call.
+
+The default backend is an in-process LRU. Set FOAMPILOT_LLM_CACHE_REDIS_URL to
+share entries across processes (requires the optional ``redis`` package).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import structlog
+from anthropic.types import Message
+
+from foampilot import config
+
+log = structlog.get_logger(__name__)
+
+_REDIS_KEY_PREFIX = "foampilot:llm:"
+
+_cache: LLMCache | None = None
+
+
+def _jsonable(obj: Any) -> Any:
+    # Assistant turns carry SDK content blocks (pydantic models) rather than dicts
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json", exclude_none=True)
+    raise TypeError(f"Cannot hash {type(obj).__name__} in an LLM request")
+
+
+def cache_key(**request: Any) -> str:
+    """Return a stable hash of the request keyword arguments."""
+    payload = json.dumps(request, sort_keys=True, default=_jsonable)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_cacheable(temperature: float) -> bool:
+    """Return True if responses sampled at *temperature* may be cached."""
+    return temperature == 0
+
+
+class _MemoryBackend:
+    """Thread-safe in-process LRU of serialized responses."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class _RedisBackend:
+    """Redis-backed store, shared by every process pointed at the same server."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    def get(self, key: str) -> str | None:
+        value = self._client.get(_REDIS_KEY_PREFIX + key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str) -> None:
+        self._client.set(_REDIS_KEY_PREFIX + key, value)
+
+
+class LLMCache:
+    """Maps request hashes (see :func:`cache_key`) to Anthropic ``Message`` responses.
+
+    Backend failures are logged and treated as misses; the cache never fails a call.
+    """
+
+    def __init__(self, backend: Any | None = None) -> None:
+        self._backend = backend or _MemoryBackend(config.LLM_CACHE_SIZE)
+
+    def get(self, key: str) -> Message | None:
+        try:
+            raw = self._backend.get(key)
+        except Exception as exc:
+            log.warning("llm_cache_get_failed", error=str(exc))
+            return None
+        if raw is None:
+            return None
+        return Message.model_validate_json(raw)
+
+    def set(self, key: str, message: Message) -> None:
+        try:
+            self._backend.set(key, message.model_dump_json())
+        except Exception as exc:
+            log.warning("llm_cache_set_failed", error=str(exc))
+
+
+def get_llm_cache() -> LLMCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        backend = None
+        if config.LLM_CACHE_REDIS_URL:
+            try:
+                import redis
+                backend = _RedisBackend(redis.Redis.from_url(config.LLM_CACHE_REDIS_URL))
+            except ImportError:
+                log.warning(
+                    "redis_not_installed",
+                    detail="Install with: pip install redis (using in-memory LLM cache)",
+                )
+        _cache = LLMCache(backend)
+    return _cache
@@ -6,6 +6,7 @@ Manages state persistence and error recovery.
 
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -13,11 +14,59 @@ from typing import Any
 import structlog
 
 from foampilot import config
-from foampilot.core.state import SimulationPhase, SimulationState, StateManager
+from foampilot.core.state import (
+    AsyncStateWriter,
+    SimulationPhase,
+    SimulationState,
+    StateManager,
+)
 
 log = structlog.get_logger(__name__)
 
 
+def _prefetch_tutorial_index() -> None:
+    """Load the tutorial index ahead of SetupAgent's first search_tutorials call."""
+    from foampilot.index.searcher import get_searcher
+    from foampilot.version.registry import VersionRegistry
+
+    try:
+        get_searcher(index_dir=config.INDEX_DIR, version=VersionRegistry.get().active().VERSION)
+    except Exception as exc:
+        log.warning("index_prefetch_failed", error=str(exc))
+
+
+def init_docker(session_id: str) -> Any | None:
+    """Connect to the Docker daemon and ensure the container is running.
+
+    Returns:
+        The Docker SDK client, or None if the daemon is unreachable.
+    """
+    try:
+        from foampilot.docker.client import get_shared_docker_sdk
+        client = get_shared_docker_sdk()
+        log.info("docker_connected", session=session_id)
+    except Exception as exc:
+        log.warning(
+            "docker_unavailable",
+            error=str(exc),
+            hint="Docker tools (blockMesh, solvers) will be disabled",
+        )
+        return None
+
+    try:
+        from foampilot.docker.manager import ContainerManager
+        ContainerManager(docker_sdk=client).ensure_running()
+        log.info("docker_container_ready", session=session_id)
+    except Exception as exc:
+        log.warning(
+            "docker_container_not_ready",
+            error=str(exc),
+            hint="Container will be auto-started on first foam command",
+        )
+
+    return client
+
+
 class _CaseLogger:
     """Writes LLM reasoning and tool events to a per-session case.log file.
 
@@ -152,6 +201,7 @@ class Orchestrator:
         cases_dir: Base directory where simulation cases live.
         event_callback: Optional callable for streaming UI events.
         approval_callback: Called when APPROVE-level tool needs user confirmation.
+        docker_client: Existing Docker client to reuse instead of connecting anew.
     """
 
     def __init__(
@@ -159,42 +209,20 @@ class Orchestrator:
         cases_dir: Path | None = None,
         event_callback: Any | None = None,
         approval_callback: Any | None = None,
+        docker_client: Any | None = None,
     ) -> None:
         self._cases_dir = cases_dir or config.CASES_DIR
         self._event_cb = event_callback
         self._approval_cb = approval_callback
         self._session_id = str(uuid.uuid4())[:8]
         self._token_acc = _TokenAccumulator()
-        self._docker = self._init_docker()
+        self._docker = docker_client or init_docker(self._session_id)
         # Set by TerminalUI before run() so ClarifyAgent can print to the real console
         self._console_ref: Any = None
 
-    def _init_docker(self):
-        """Connect to the Docker daemon and ensure the container is running."""
-        try:
-            from foampilot.docker.client import _connect_docker
-            client = _connect_docker()
-            log.info("docker_connected", session=self._session_id)
-        except Exception as exc:
-            log.warning(
-                "docker_unavailable",
-                error=str(exc),
-                hint="Docker tools (blockMesh, solvers) will be disabled",
-            )
-            return None
-
-        try:
-            from foampilot.docker.manager import ContainerManager
-            ContainerManager(docker_sdk=client).ensure_running()
-            log.info("docker_container_ready", session=self._session_id)
-        except Exception as exc:
-            log.warning(
-                "docker_container_not_ready",
-                error=str(exc),
-                hint="Container will be auto-started on first foam command",
-            )
-
-        return client
+    @property
+    def docker_client(self) -> Any | None:
+        return self._docker
 
     def _emit(self, event_type: str, data: dict) -> None:
         if self._event_cb:
@@ -242,19 +270,28 @@ class Orchestrator:
 
         self._emit("session_start", {"session_id": self._session_id, "request": user_request})
 
+        # Saves within the pipeline are written off the main thread; every
+        # snapshot is on disk by the time run() returns
+        writer = AsyncStateWriter(state_manager)
         try:
-            state = self._run_phases(
-                state, state_manager, case_dir, user_request, confirmed_params
-            )
-        except Exception as exc:
-            log.error("orchestrator_error", error=str(exc), session=self._session_id)
-            state.set_phase(SimulationPhase.ERROR)
-            state.add_issue(f"Orchestrator error: {exc}")
-            state_manager.save(state)
-            self._emit("session_error", {"error": str(exc)})
+            try:
+                state = self._run_phases(
+                    state, writer, case_dir, user_request, confirmed_params
+                )
+            except Exception as exc:
+                log.error("orchestrator_error", error=str(exc), session=self._session_id)
+                state.set_phase(SimulationPhase.ERROR)
+                state.add_issue(f"Orchestrator error: {exc}")
+                writer.save(state)
+                writer.flush()
+                self._emit("session_error", {"error": str(exc)})
+
+            state.token_usage = self._token_acc.summary()
+            writer.save(state)
+        finally:
+            # Also on Ctrl-C, so an interrupted session can resume from its last phase
+            writer.close()
 
-        state.token_usage = self._token_acc.summary()
-        state_manager.save(state)
         self._emit("session_token_summary", state.token_usage)
 
         return state
@@ -262,7 +299,7 @@ class Orchestrator:
     def _run_phases(
         self,
         state: SimulationState,
-        state_manager: StateManager,
+        state_manager: StateManager | AsyncStateWriter,
         case_dir: Path,
         user_request: str,
         confirmed_params: dict | None = None,
@@ -282,6 +319,17 @@ class Orchestrator:
         }
         docker_kwargs = {**agent_kwargs, "docker_client": self._docker}
 
+        # Setup depends on Consult's spec and Mesh on Setup's files, so the phases
+        # themselves stay sequential. Loading the tutorial index only needs the
+        # version, so it runs while Clarify and Consult wait on the LLM; Setup's
+        # search blocks on the searcher cache until it is done.
+        if state.phase in (
+            SimulationPhase.IDLE, SimulationPhase.CLARIFYING, SimulationPhase.CONSULTING,
+        ):
+            prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="index-prefetch")
+            prefetch.submit(_prefetch_tutorial_index)
+            prefetch.shutdown(wait=False)
+
         # Phase 0: Clarify
         if state.phase == SimulationPhase.IDLE:
             state.set_phase(SimulationPhase.CLARIFYING)
@@ -0,0 +1,76 @@
+"""Orchestrator for multi-case studies that fans phase agents out concurrently.
+
+Unlike Orchestrator, which drives one case through a fixed phase sequence, the
+ParallelOrchestrator gives a top-level AgentLoop the phase agents as tools
+(see foampilot.tools.agent_tools). The model decides the cases, and when it
+issues one agent call per case in a single turn, AgentLoop runs them
+concurrently, each with its own loop, message history and case directory.
+"""
+
+import uuid
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from foampilot import config
+from foampilot.core.agent_loop import AgentLoopResult
+from foampilot.core.orchestrator import init_docker
+from foampilot.core.subagent import SubagentConfig, run_subagent
+from foampilot.prompts.parallel import get_parallel_prompt
+from foampilot.tools.agent_tools import CaseRegistry, build_agent_tools
+
+log = structlog.get_logger(__name__)
+
+
+class ParallelOrchestrator:
+    """Runs a study of several related cases with concurrent per-case agents.
+
+    Args:
+        cases_dir: Base directory; the study's cases go in a ``study_<id>`` subdirectory.
+        event_callback: Optional callable for UI events. Called from worker
+            threads; events from a case agent carry a ``case`` key.
+        approval_callback: Called when an APPROVE-level tool needs confirmation.
+            Must be thread-safe, since case agents may ask concurrently.
+        docker_client: Existing Docker client to reuse instead of connecting anew.
+        max_turns: Turn limit for the coordinating loop.
+    """
+
+    def __init__(
+        self,
+        cases_dir: Path | None = None,
+        event_callback: Any | None = None,
+        approval_callback: Any | None = None,
+        docker_client: Any | None = None,
+        max_turns: int = 30,
+    ) -> None:
+        self._session_id = str(uuid.uuid4())[:8]
+        self._study_dir = (cases_dir or config.CASES_DIR) / f"study_{self._session_id}"
+        self._event_cb = event_callback
+        self._approval_cb = approval_callback
+        self._docker = docker_client or init_docker(self._session_id)
+        self._max_turns = max_turns
+
+    @property
+    def study_dir(self) -> Path:
+        return self._study_dir
+
+    def run(self, user_request: str) -> AgentLoopResult:
+        """Plan and run every case of the study described by *user_request*."""
+        self._study_dir.mkdir(parents=True, exist_ok=True)
+        tools = build_agent_tools(
+            CaseRegistry(self._study_dir),
+            docker_client=self._docker,
+            event_callback=self._event_cb,
+            approval_callback=self._approval_cb,
+        )
+        cfg = SubagentConfig(
+            name="study",
+            system_prompt=get_parallel_prompt(study_dir=self._study_dir.resolve()),
+            tools=tools,
+            max_turns=self._max_turns,
+            event_callback=self._event_cb,
+            approval_callback=self._approval_cb,
+        )
+        log.info("study_start", session=self._session_id, study_dir=str(self._study_dir))
+        return run_subagent(cfg, user_request)
@@ -21,23 +21,30 @@ class PermissionDeniedError(Exception):
     """Raised when a user denies approval for a tool call."""
 
 
+# One bit per level; each mode is resolved to a mask of the levels it applies to
+_LEVEL_BIT = {
+    PermissionLevel.AUTO: 0b001,
+    PermissionLevel.NOTIFY: 0b010,
+    PermissionLevel.APPROVE: 0b100,
+}
+
+_APPROVAL_MASK = {"auto_approve": 0b000, "strict": 0b110, "standard": 0b100}
+_NOTIFY_MASK = {"auto_approve": 0b000, "strict": 0b110, "standard": 0b110}
+
+
 class PermissionChecker:
     """Evaluates whether a tool call may proceed given the current permission mode."""
 
     def __init__(self, mode: str | None = None) -> None:
         self._mode = mode or config.PERMISSION_MODE
+        # Unknown modes behave like standard
+        self._approval_mask = _APPROVAL_MASK.get(self._mode, _APPROVAL_MASK["standard"])
+        self._notify_mask = _NOTIFY_MASK.get(self._mode, _NOTIFY_MASK["standard"])
 
     def requires_approval(self, level: PermissionLevel) -> bool:
         """Return True if this level requires interactive approval in the current mode."""
-        if self._mode == "auto_approve":
-            return False
-        if self._mode == "strict":
-            return level in (PermissionLevel.NOTIFY, PermissionLevel.APPROVE)
-        # standard mode
-        return level == PermissionLevel.APPROVE
+        return bool(self._approval_mask & _LEVEL_BIT[level])
 
     def should_notify(self, level: PermissionLevel) -> bool:
         """Return True if the UI should display this action even without blocking."""
-        if self._mode == "auto_approve":
-            return False
-        return level in (PermissionLevel.NOTIFY, PermissionLevel.APPROVE)
+        return bool(self._notify_mask & _LEVEL_BIT[level])
@@ -4,16 +4,43 @@ Manages foampilot_state.json (machine-readable) and FOAMPILOT.md (human-readable
 State tracks: current phase, simulation spec, files modified, assumptions, issues.
 """
 
+import copy
+import io
 import json
-from dataclasses import asdict, dataclass, field
+import os
+import threading
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json path below is equivalent
+    orjson = None
+
 log = structlog.get_logger(__name__)
 
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize *obj* (dataclasses and enums included) as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+    if isinstance(obj, SimulationState):
+        obj = _to_dict(obj)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _pretty(obj: Any) -> str:
+    return _dumps(obj).decode()
+
 
 class SimulationPhase(str, Enum):
     IDLE = "idle"
@@ -27,7 +54,7 @@ class SimulationPhase(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileModification:
     path: str
     action: str  # "created" | "edited" | "deleted"
@@ -55,16 +82,27 @@ class SimulationState:
     created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
+    def __post_init__(self) -> None:
+        # Membership indexes for the dedup in add_assumption/add_issue. Plain
+        # attributes, not fields, so they stay out of equality and serialization.
+        self._assumption_set = set(self.assumptions)
+        self._issue_set = set(self.issues)
+
     def record_modification(self, path: str, action: str, description: str) -> None:
-        self.files_modified.append(FileModification(path=path, action=action, description=description))
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc).isoformat()
+        self.files_modified.append(
+            FileModification(path=path, action=action, description=description, timestamp=now)
+        )
+        self.updated_at = now
 
     def add_assumption(self, assumption: str) -> None:
-        if assumption not in self.assumptions:
+        if assumption not in self._assumption_set:
+            self._assumption_set.add(assumption)
             self.assumptions.append(assumption)
 
     def add_issue(self, issue: str) -> None:
-        if issue not in self.issues:
+        if issue not in self._issue_set:
+            self._issue_set.add(issue)
             self.issues.append(issue)
 
     def set_phase(self, phase: SimulationPhase) -> None:
@@ -73,27 +111,103 @@ class SimulationState:
         log.info("phase_transition", phase=phase.value, session=self.session_id)
 
 
+_STATE_FIELDS = tuple(f.name for f in fields(SimulationState))
+_MOD_FIELDS = tuple(f.name for f in fields(FileModification))
+
+
+def _to_dict(state: SimulationState) -> dict:
+    """Shallow equivalent of ``asdict(state)`` for serialization.
+
+    asdict deep-copies every nested dict and list; json.dumps only reads them,
+    so the containers are passed through as they are.
+    """
+    data = {name: getattr(state, name) for name in _STATE_FIELDS}
+    data["files_modified"] = [
+        {name: getattr(mod, name) for name in _MOD_FIELDS} for mod in state.files_modified
+    ]
+    return data
+
+
+_MD_HEADER = """\
+# FoamPilot Session Log
+
+**Session ID:** {session_id}
+**Phase:** {phase}
+**Created:** {created_at}
+**Updated:** {updated_at}
+
+## Original Request
+
+{request}
+
+"""
+
+
+def _md_json(title: str, data: dict) -> str:
+    return f"## {title}\n\n```json\n{_pretty(data)}\n```\n\n"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to a sibling temp file and rename it over *path*.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 class StateManager:
-    """Persists and loads SimulationState to/from disk."""
+    """Persists and loads SimulationState to/from disk.
+
+    The JSON file is written on every save. FOAMPILOT.md is only for people, so
+    it is regenerated at most once per *markdown_interval* seconds; a skipped
+    regeneration is caught up by the next save after the interval or by
+    ``flush_markdown()``.
+    """
 
-    def __init__(self, case_dir: Path) -> None:
+    def __init__(self, case_dir: Path, markdown_interval: float = 5.0) -> None:
         self._case_dir = case_dir
         self._state_file = case_dir / "foampilot_state.json"
         self._md_file = case_dir / "FOAMPILOT.md"
+        self._md_interval = markdown_interval
+        self._md_written_at: float | None = None
+        self._md_pending: SimulationState | None = None
+        self._lock = threading.Lock()
 
-    def save(self, state: SimulationState) -> None:
-        """Persist state to JSON and regenerate FOAMPILOT.md."""
-        self._case_dir.mkdir(parents=True, exist_ok=True)
-        data = asdict(state)
-        self._state_file.write_text(json.dumps(data, indent=2))
-        self._write_markdown(state)
+    def save(self, state: SimulationState, force_markdown: bool = False) -> None:
+        """Persist state to JSON and, unless debounced, regenerate FOAMPILOT.md."""
+        with self._lock:
+            self._case_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self._state_file, _dumps(state))
+            now = time.monotonic()
+            if (
+                force_markdown
+                or self._md_written_at is None
+                or now - self._md_written_at >= self._md_interval
+            ):
+                self._write_markdown(state)
+                self._md_written_at = now
+                self._md_pending = None
+            else:
+                self._md_pending = state
         log.info("state_saved", path=str(self._state_file))
 
+    def flush_markdown(self) -> None:
+        """Write FOAMPILOT.md for the last save if it was debounced."""
+        with self._lock:
+            if self._md_pending is None:
+                return
+            self._write_markdown(self._md_pending)
+            self._md_written_at = time.monotonic()
+            self._md_pending = None
+
     def load(self) -> SimulationState | None:
         """Load state from disk. Returns None if no state file exists."""
         if not self._state_file.exists():
             return None
-        data = json.loads(self._state_file.read_text())
+        raw = self._state_file.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         # Convert nested dicts back to dataclass instances
         data["phase"] = SimulationPhase(data["phase"])
         mods = [FileModification(**m) for m in data.get("files_modified", [])]
@@ -103,48 +217,109 @@ class StateManager:
         return SimulationState(**data)
 
     def _write_markdown(self, state: SimulationState) -> None:
-        lines = [
-            "# FoamPilot Session Log",
-            "",
-            f"**Session ID:** {state.session_id}",
-            f"**Phase:** {state.phase.value}",
-            f"**Created:** {state.created_at}",
-            f"**Updated:** {state.updated_at}",
-            "",
-            "## Original Request",
-            "",
-            state.original_request or "_Not yet captured._",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(_MD_HEADER.format_map({
+            "session_id": state.session_id,
+            "phase": state.phase.value,
+            "created_at": state.created_at,
+            "updated_at": state.updated_at,
+            "request": state.original_request or "_Not yet captured._",
+        }))
 
         if state.simulation_spec:
-            lines += ["## Simulation Specification", "", "```json",
-                      json.dumps(state.simulation_spec, indent=2), "```", ""]
+            buf.write(_md_json("Simulation Specification", state.simulation_spec))
 
         if state.assumptions:
-            lines += ["## Assumptions", ""]
-            for a in state.assumptions:
-                lines.append(f"- {a}")
-            lines.append("")
+            buf.write("## Assumptions\n\n")
+            buf.writelines(f"- {a}\n" for a in state.assumptions)
+            buf.write("\n")
 
         if state.files_modified:
-            lines += ["## Files Modified", ""]
-            for m in state.files_modified:
-                lines.append(f"- `{m.path}` — **{m.action}**: {m.description}")
-            lines.append("")
+            buf.write("## Files Modified\n\n")
+            buf.writelines(
+                f"- `{m.path}` — **{m.action}**: {m.description}\n" for m in state.files_modified
+            )
+            buf.write("\n")
 
         if state.issues:
-            lines += ["## Issues Encountered", ""]
-            for i in state.issues:
-                lines.append(f"- {i}")
-            lines.append("")
+            buf.write("## Issues Encountered\n\n")
+            buf.writelines(f"- {i}\n" for i in state.issues)
+            buf.write("\n")
 
         if state.mesh_quality:
-            lines += ["## Mesh Quality", "", "```json",
-                      json.dumps(state.mesh_quality, indent=2), "```", ""]
+            buf.write(_md_json("Mesh Quality", state.mesh_quality))
 
         if state.convergence_data:
-            lines += ["## Convergence", "", "```json",
-                      json.dumps(state.convergence_data, indent=2), "```", ""]
+            buf.write(_md_json("Convergence", state.convergence_data))
+
+        # Sections end in a blank line; drop the last one so the file ends in one newline.
+        # Explicit UTF-8 bytes: write_text would use the locale encoding, and the log has "—"
+        _write_atomic(self._md_file, buf.getvalue()[:-1].encode())
+
+
+class AsyncStateWriter:
+    """Persists SimulationState on a background thread, coalescing bursts of saves.
+
+    ``save()`` snapshots the state on the calling thread (so later mutations
+    can't race the writer) and returns; the thread writes only the newest
+    snapshot, so several saves in quick succession cost one disk write.
+    Call ``close()`` (or ``flush()``) before relying on the files on disk.
+
+    Args:
+        manager: StateManager that does the actual writing.
+    """
+
+    def __init__(self, manager: StateManager) -> None:
+        self._manager = manager
+        self._pending: SimulationState | None = None
+        self._writing = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._worker, name="state-writer", daemon=True)
+        self._thread.start()
+
+    def save(self, state: SimulationState) -> None:
+        """Queue a snapshot of *state*, replacing any snapshot not yet written."""
+        snapshot = copy.deepcopy(state)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("AsyncStateWriter is closed")
+            self._pending = snapshot
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every queued snapshot has been written, FOAMPILOT.md included."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending is None and not self._writing)
+        self._flush_markdown()
+
+    def close(self) -> None:
+        """Write any queued snapshot and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._flush_markdown()
+
+    def _flush_markdown(self) -> None:
+        try:
+            self._manager.flush_markdown()
+        except Exception as exc:
+            log.error("state_save_failed", error=str(exc))
 
-        self._md_file.write_text("\n".join(lines))
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                state, self._pending = self._pending, None
+                self._writing = True
+            try:
+                self._manager.save(state)
+            except Exception as exc:
+                log.error("state_save_failed", error=str(exc))
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
@@ -40,21 +40,15 @@ def run_subagent(cfg: SubagentConfig, task: str) -> AgentLoopResult:
     """
     log.info("subagent_start", name=cfg.name, task_preview=task[:80])
 
-    import foampilot.config as c
-    original_max = c.MAX_TURNS
-    c.MAX_TURNS = cfg.max_turns
-
-    try:
-        loop = AgentLoop(
-            system_prompt=cfg.system_prompt,
-            tools=cfg.tools,
-            permission_checker=cfg.permission_checker,
-            event_callback=cfg.event_callback,
-            approval_callback=cfg.approval_callback,
-        )
-        result = loop.run(task)
-    finally:
-        c.MAX_TURNS = original_max
+    loop = AgentLoop(
+        system_prompt=cfg.system_prompt,
+        tools=cfg.tools,
+        permission_checker=cfg.permission_checker,
+        event_callback=cfg.event_callback,
+        approval_callback=cfg.approval_callback,
+        max_turns=cfg.max_turns,
+    )
+    result = loop.run(task)
 
     log.info(
         "subagent_done",
@@ -21,6 +21,16 @@ _COST_PER_M_OUTPUT = {
     "claude-sonnet-4-5-20250929": 15.00,
     "claude-opus-4-5": 75.00,
 }
+# Prompt-cache reads and writes are billed as multiples of the input rate
+_CACHE_READ_MULTIPLIER = 0.10
+_CACHE_WRITE_MULTIPLIER = 1.25
+
+# Per-token (input, output) rates, derived once from the tables above
+_RATES: dict[str, tuple[float, float]] = {
+    model: (_COST_PER_M_INPUT[model] / 1_000_000, _COST_PER_M_OUTPUT[model] / 1_000_000)
+    for model in _COST_PER_M_INPUT
+}
+_DEFAULT_RATES = (3.00 / 1_000_000, 15.00 / 1_000_000)
 
 
 @dataclass
@@ -32,11 +42,19 @@ class TurnUsage:
     cache_read_tokens: int = 0
     cache_write_tokens: int = 0
 
+    @property
+    def prompt_tokens(self) -> int:
+        """Full prompt size; ``input_tokens`` excludes the cached part of the prompt."""
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+
     @property
     def cost_usd(self) -> float:
-        in_cost = _COST_PER_M_INPUT.get(self.model, 3.00) * self.input_tokens / 1_000_000
-        out_cost = _COST_PER_M_OUTPUT.get(self.model, 15.00) * self.output_tokens / 1_000_000
-        return in_cost + out_cost
+        in_rate, out_rate = _RATES.get(self.model, _DEFAULT_RATES)
+        return in_rate * (
+            self.input_tokens
+            + self.cache_read_tokens * _CACHE_READ_MULTIPLIER
+            + self.cache_write_tokens * _CACHE_WRITE_MULTIPLIER
+        ) + out_rate * self.output_tokens
 
 
 @dataclass
@@ -46,6 +64,14 @@ class TokenTracker:
     _turns: list[TurnUsage] = field(default_factory=list)
     _context_window: int = field(default_factory=lambda: config.CONTEXT_WINDOW_TOKENS)
     _threshold: float = field(default_factory=lambda: config.COMPACTION_THRESHOLD)
+    # Tokens removed from the history since the latest turn was recorded
+    _pending_savings: int = 0
+    _total_truncated: int = 0
+    # Running totals, updated in record() so the summary properties are O(1)
+    _total_input: int = 0
+    _total_output: int = 0
+    _total_cache_read: int = 0
+    _total_cost: float = 0.0
 
     def record(
         self,
@@ -65,34 +91,55 @@ class TokenTracker:
             cache_read_tokens=cache_read_tokens,
             cache_write_tokens=cache_write_tokens,
         )
+        cost = usage.cost_usd
         self._turns.append(usage)
+        self._pending_savings = 0
+        self._total_input += input_tokens
+        self._total_output += output_tokens
+        self._total_cache_read += cache_read_tokens
+        self._total_cost += cost
         log.info(
             "token_usage",
             turn=turn,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
-            cost_usd=round(usage.cost_usd, 5),
+            cache_read_tokens=cache_read_tokens,
+            cost_usd=round(cost, 5),
             context_pct=round(self.context_utilization * 100, 1),
         )
 
     @property
     def total_input_tokens(self) -> int:
-        return sum(t.input_tokens for t in self._turns)
+        return self._total_input
 
     @property
     def total_output_tokens(self) -> int:
-        return sum(t.output_tokens for t in self._turns)
+        return self._total_output
+
+    @property
+    def total_cache_read_tokens(self) -> int:
+        return self._total_cache_read
+
+    def record_truncation(self, saved_tokens: int) -> None:
+        """Record tokens dropped from the history without a compaction.
+
+        The savings count against the latest prompt size until the next turn is
+        recorded, so should_compact() sees them straight away.
+        """
+        self._pending_savings += saved_tokens
+        self._total_truncated += saved_tokens
+        log.info("history_truncated", saved_tokens=saved_tokens)
 
     @property
     def total_cost_usd(self) -> float:
-        return sum(t.cost_usd for t in self._turns)
+        return self._total_cost
 
     @property
     def context_utilization(self) -> float:
-        """Fraction of context window used based on latest turn's input tokens."""
+        """Fraction of context window used based on latest turn's prompt size."""
         if not self._turns:
             return 0.0
-        latest_input = self._turns[-1].input_tokens
+        latest_input = max(self._turns[-1].prompt_tokens - self._pending_savings, 0)
         return min(latest_input / self._context_window, 1.0)
 
     def should_compact(self) -> bool:
@@ -104,6 +151,8 @@ class TokenTracker:
             "turns": len(self._turns),
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
+            "total_cache_read_tokens": self.total_cache_read_tokens,
+            "total_truncated_tokens": self._total_truncated,
             "total_cost_usd": round(self.total_cost_usd, 4),
             "context_utilization_pct": round(self.context_utilization * 100, 1),
         }
@@ -5,9 +5,12 @@ Provides exec_command(), stream_command(), and file transfer methods.
 
 from __future__ import annotations
 
+import codecs
+import shutil
 import tarfile
 import tempfile
-from io import BytesIO
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, AsyncIterator, Iterator
 
@@ -17,6 +20,10 @@ from foampilot import config
 
 log = structlog.get_logger(__name__)
 
+# Tar archives for file transfer are kept in memory up to this size, then spill to disk
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+_COPY_BUFSIZE = 64 * 1024
+
 # Candidate socket paths in priority order.
 # Docker Desktop on macOS does not create /var/run/docker.sock by default.
 _DOCKER_SOCKET_CANDIDATES = [
@@ -27,18 +34,32 @@ _DOCKER_SOCKET_CANDIDATES = [
     str(Path.home() / "Library" / "Containers" / "com.docker.docker" / "Data" / "docker.sock"),
 ]
 
+# Socket that _connect_docker() fell back to last time, tried first on later calls
+_resolved_socket: str | None = None
+
+_shared_sdk: Any | None = None
+_shared_sdk_lock = threading.Lock()
+
 
 def _connect_docker():
     """Return a docker.DockerClient, trying several socket paths on macOS.
 
     Tries DOCKER_HOST / docker.from_env() first (respects the env var),
     then falls back through known macOS Docker Desktop socket locations.
+    A socket found by the fallback is remembered and used directly next time.
 
     Raises:
         RuntimeError: If no working Docker connection can be found.
     """
+    global _resolved_socket
     import docker
 
+    if _resolved_socket is not None:
+        try:
+            return docker.DockerClient(base_url=f"unix://{_resolved_socket}")
+        except Exception:
+            _resolved_socket = None
+
     # First try the standard environment-based resolution
     try:
         client = docker.from_env()
@@ -54,6 +75,7 @@ def _connect_docker():
                 client = docker.DockerClient(base_url=f"unix://{socket_path}")
                 client.ping()
                 log.info("docker_connected", method="socket_fallback", socket=socket_path)
+                _resolved_socket = socket_path
                 return client
             except Exception:
                 continue
@@ -64,6 +86,42 @@ def _connect_docker():
     )
 
 
+class _ChunkReader:
+    """File-like read() over an iterator of byte chunks, for tarfile stream mode."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buf = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buf) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buf += chunk
+        if size < 0:
+            size = len(self._buf)
+        data = bytes(self._buf[:size])
+        del self._buf[:size]
+        return data
+
+
+def get_shared_docker_sdk():
+    """Return the process-wide docker.DockerClient, connecting on first use.
+
+    DockerClient and ContainerManager default to this instance, so every
+    component talks to the daemon over one connection pool.
+
+    Raises:
+        RuntimeError: If no working Docker connection can be found.
+    """
+    global _shared_sdk
+    with _shared_sdk_lock:
+        if _shared_sdk is None:
+            _shared_sdk = _connect_docker()
+        return _shared_sdk
+
+
 class ExecResult:
     """Result of a docker exec command."""
 
@@ -85,7 +143,7 @@ class DockerClient:
 
     Args:
         docker_sdk: An initialized docker.DockerClient instance.
-            If None, a new one is created from the environment.
+            If None, the shared instance from get_shared_docker_sdk() is used.
         container_name: Name of the OpenFOAM container.
     """
 
@@ -95,13 +153,34 @@ class DockerClient:
         container_name: str | None = None,
     ) -> None:
         if docker_sdk is None:
-            docker_sdk = _connect_docker()
+            docker_sdk = get_shared_docker_sdk()
         self._sdk = docker_sdk
         self._container_name = container_name or config.OPENFOAM_CONTAINER
+        self._container_cache = None
 
     def _get_container(self):
-        """Get the OpenFOAM container object."""
-        return self._sdk.containers.get(self._container_name)
+        """Get the OpenFOAM container object, looked up once per client."""
+        if self._container_cache is None:
+            self._container_cache = self._sdk.containers.get(self._container_name)
+        return self._container_cache
+
+    def invalidate_container(self) -> None:
+        """Forget the cached container so the next call looks it up again."""
+        self._container_cache = None
+
+    def _container_call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call *method* on the container, dropping the cache if Docker reports NotFound.
+
+        A removed or recreated container keeps its name but not its ID, so the
+        cached object goes stale; the next call then fetches the current one.
+        """
+        from docker.errors import NotFound
+
+        try:
+            return getattr(self._get_container(), method)(*args, **kwargs)
+        except NotFound:
+            self.invalidate_container()
+            raise
 
     def exec_command(
         self,
@@ -119,8 +198,6 @@ class DockerClient:
         Returns:
             Dict with keys: stdout, stderr, exit_code.
         """
-        container = self._get_container()
-
         if case_dir and "cd" not in cmd:
             full_cmd = f"bash -c 'cd {case_dir} && {cmd}'"
         else:
@@ -128,7 +205,8 @@ class DockerClient:
 
         log.info("docker_exec", container=self._container_name, cmd=cmd[:100])
 
-        result = container.exec_run(
+        result = self._container_call(
+            "exec_run",
             full_cmd,
             demux=True,
             workdir=case_dir,
@@ -163,19 +241,26 @@ class DockerClient:
         Yields:
             Lines of output from stdout.
         """
-        container = self._get_container()
-
         if case_dir:
             full_cmd = f"bash -c 'cd {case_dir} && {cmd}'"
         else:
             full_cmd = cmd
 
-        _, stream = container.exec_run(full_cmd, stream=True, demux=False)
+        _, stream = self._container_call("exec_run", full_cmd, stream=True, demux=False)
+        # Chunks can end mid-line or mid-character: the decoder holds back partial
+        # UTF-8 sequences and the unterminated tail is carried into the next chunk
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        carry = ""
         for chunk in stream:
-            if chunk:
-                text = chunk.decode("utf-8", errors="replace")
-                for line in text.splitlines():
-                    yield line
+            if not chunk:
+                continue
+            carry += decoder.decode(chunk)
+            *lines, carry = carry.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        carry += decoder.decode(b"", final=True)
+        if carry:
+            yield carry.rstrip("\r")
 
     def copy_to_container(self, local_path: Path, container_path: str) -> None:
         """Copy a file from the host into the container.
@@ -184,18 +269,45 @@ class DockerClient:
             local_path: Path to the file on the host.
             container_path: Destination path inside the container.
         """
-        container = self._get_container()
-
-        # Create a tar archive in memory
-        buf = BytesIO()
-        with tarfile.open(fileobj=buf, mode="w") as tar:
-            tar.add(str(local_path), arcname=local_path.name)
-        buf.seek(0)
-
         dest_dir = str(Path(container_path).parent)
-        container.put_archive(dest_dir, buf.getvalue())
+
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as spool:
+            # tar.add already streams the file via gettarinfo + addfile; only the
+            # copy buffer is raised from tarfile's 16 KiB default
+            with tarfile.open(fileobj=spool, mode="w", copybufsize=_COPY_BUFSIZE) as tar:
+                tar.add(str(local_path), arcname=local_path.name)
+            size = spool.tell()
+            spool.seek(0)
+            # Small archives go up as bytes; large ones have spilled to disk and the
+            # request body is streamed from the file instead of held in memory
+            data = spool.read() if size <= _SPOOL_MAX_BYTES else spool
+            self._container_call("put_archive", dest_dir, data)
         log.info("copied_to_container", local=str(local_path), container=container_path)
 
+    def copy_many_to_container(
+        self, pairs: list[tuple[Path, str]], max_workers: int = 8
+    ) -> None:
+        """Copy several files into the container, uploading concurrently.
+
+        Each upload mostly waits on the Docker socket, so running them on a
+        thread pool overlaps the round-trips.
+
+        Args:
+            pairs: (local_path, container_path) for each file.
+            max_workers: Maximum number of uploads in flight.
+
+        Raises:
+            Exception: The first upload error, after all uploads have finished.
+        """
+        if not pairs:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pairs)), thread_name_prefix="docker-copy"
+        ) as pool:
+            futures = [pool.submit(self.copy_to_container, *pair) for pair in pairs]
+        for future in futures:
+            future.result()
+
     def copy_from_container(self, container_path: str, local_path: Path) -> None:
         """Copy a file from the container to the host.
 
@@ -203,19 +315,18 @@ class DockerClient:
             container_path: Path inside the container.
             local_path: Destination on the host.
         """
-        container = self._get_container()
-        stream, _ = container.get_archive(container_path)
-
-        buf = BytesIO()
-        for chunk in stream:
-            buf.write(chunk)
-        buf.seek(0)
-
-        with tarfile.open(fileobj=buf) as tar:
-            members = tar.getmembers()
-            if members:
-                f = tar.extractfile(members[0])
-                if f:
-                    local_path.parent.mkdir(parents=True, exist_ok=True)
-                    local_path.write_bytes(f.read())
+        stream, _ = self._container_call("get_archive", container_path)
+
+        # Stream mode reads the archive front to back straight off the response,
+        # so neither the archive nor the file is ever held whole. The loop runs to
+        # the end of the archive so the response is fully consumed.
+        copied = False
+        with tarfile.open(fileobj=_ChunkReader(stream), mode="r|") as tar:
+            for member in tar:
+                if copied or not member.isfile():
+                    continue
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                with local_path.open("wb") as out:
+                    shutil.copyfileobj(tar.extractfile(member), out, _COPY_BUFSIZE)
+                copied = True
         log.info("copied_from_container", container=container_path, local=str(local_path))
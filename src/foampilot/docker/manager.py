@@ -16,15 +16,13 @@ class ContainerManager:
 
     Args:
         docker_sdk: Initialized docker.DockerClient instance.
+            If None, the shared instance from get_shared_docker_sdk() is used.
     """
 
     def __init__(self, docker_sdk: Any | None = None) -> None:
         if docker_sdk is None:
-            try:
-                import docker
-                docker_sdk = docker.from_env()
-            except Exception as exc:
-                raise RuntimeError(f"Docker not available: {exc}") from exc
+            from foampilot.docker.client import get_shared_docker_sdk
+            docker_sdk = get_shared_docker_sdk()
         self._sdk = docker_sdk
 
     def ensure_running(self) -> str:
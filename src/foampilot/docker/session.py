@@ -0,0 +1,182 @@
+"""Long-lived exec session for running a sequence of commands in the OpenFOAM container.
+
+Each ``DockerClient.exec_command`` looks up the container, creates and starts a
+fresh exec instance, and starts a new bash that re-sources the OpenFOAM bashrc.
+An ExecSession keeps one non-TTY bash attached over the exec socket, sources the
+bashrc once, and delimits each command's output with sentinel markers instead.
+"""
+
+from __future__ import annotations
+
+import secrets
+from typing import Any
+
+import structlog
+
+from foampilot import config
+from foampilot.docker.client import ExecResult
+
+log = structlog.get_logger(__name__)
+
+_STDOUT, _STDERR = 1, 2
+
+
+class ExecSessionError(ConnectionError):
+    """The exec session died or timed out; it must not be used again."""
+
+
+class ExecSessionInterrupted(ExecSessionError):
+    """The session died after the command was sent, so it may still be running."""
+
+
+class ExecSession:
+    """One persistent ``bash`` exec in the OpenFOAM container.
+
+    Commands run one at a time, each in a subshell so ``cd`` and variables don't
+    leak into the next command. Not thread-safe.
+
+    Args:
+        docker_sdk: An initialized docker.DockerClient instance.
+        container_name: Name of the OpenFOAM container.
+        env_script: Script sourced once when the session starts (e.g. the
+            OpenFOAM bashrc).
+    """
+
+    def __init__(
+        self,
+        docker_sdk: Any,
+        container_name: str | None = None,
+        env_script: str | None = None,
+    ) -> None:
+        container = docker_sdk.containers.get(container_name or config.OPENFOAM_CONTAINER)
+        api = docker_sdk.api
+        exec_id = api.exec_create(container.id, ["bash"], stdin=True, tty=False)["Id"]
+        self._sock = api.exec_start(exec_id, socket=True)
+        # docker-py returns a SocketIO wrapper on unix sockets; send/recv need the raw socket
+        self._raw = getattr(self._sock, "_sock", self._sock)
+        self._token = secrets.token_hex(4)
+        self._count = 0
+        self.closed = False
+        if env_script:
+            # Queued ahead of the first command; its output is discarded so no read is needed
+            self._send(f"[ -f {env_script} ] && source {env_script} >/dev/null 2>&1 </dev/null\n")
+        log.info("exec_session_open", container=container_name or config.OPENFOAM_CONTAINER)
+
+    def run(self, cmd: str, workdir: str | None = None, timeout: float | None = None) -> dict:
+        """Run *cmd* and return a dict with keys: stdout, stderr, exit_code.
+
+        Args:
+            cmd: The command string to execute.
+            workdir: If provided, cd to this directory first.
+            timeout: Give up (and close the session) if no output arrives for this
+                many seconds.
+
+        Raises:
+            ExecSessionError: If the session is closed or dies before *cmd* is sent.
+            ExecSessionInterrupted: If the session dies or times out after *cmd*
+                was sent.
+        """
+        if self.closed:
+            raise ExecSessionError("exec session is closed")
+        self._count += 1
+        marker = f"__FOAMPILOT_END_{self._token}_{self._count}__".encode()
+        body = f"cd {workdir} && {cmd}" if workdir else cmd
+        log.info("exec_session_run", cmd=cmd[:100])
+
+        # stdin from /dev/null so the command cannot swallow the commands queued behind it
+        try:
+            self._send(
+                f"( {body}\n) </dev/null; __fp_rc=$?; "
+                f"echo; echo {marker.decode()}$__fp_rc; echo >&2; echo {marker.decode()} >&2\n"
+            )
+        except OSError as exc:
+            self.close()
+            raise ExecSessionError(f"exec session failed: {exc}") from exc
+        self._raw.settimeout(timeout)
+        try:
+            stdout, stderr = self._collect(marker)
+        except (OSError, ConnectionError) as exc:
+            self.close()
+            raise ExecSessionInterrupted(f"exec session failed: {exc}") from exc
+
+        # The newline echoed ahead of each marker is consumed by the split
+        out, _, trailer = stdout.rpartition(b"\n" + marker)
+        err = stderr.rpartition(b"\n" + marker)[0]
+        try:
+            exit_code = int(trailer.strip() or b"-1")
+        except ValueError:
+            exit_code = -1
+        return ExecResult(
+            stdout=out.decode("utf-8", errors="replace"),
+            stderr=err.decode("utf-8", errors="replace"),
+            exit_code=exit_code,
+        ).to_dict()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._send("exit\n")
+        except OSError:
+            pass
+        finally:
+            self._sock.close()
+
+    def __enter__(self) -> ExecSession:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _send(self, text: str) -> None:
+        self._raw.sendall(text.encode())
+
+    def _collect(self, marker: bytes) -> tuple[bytes, bytes]:
+        """Read frames until both streams have printed *marker* on its own line."""
+        bufs = {_STDOUT: bytearray(), _STDERR: bytearray()}
+        done = {_STDOUT: False, _STDERR: False}
+        needle = b"\n" + marker
+        while not all(done.values()):
+            stream, payload = self._read_frame()
+            if stream not in bufs or done[stream]:
+                continue
+            buf = bufs[stream]
+            # Only the tail can contain a marker that straddles frames
+            start = max(0, len(buf) - len(needle))
+            buf += payload
+            pos = buf.find(needle, start)
+            if pos >= 0 and buf.find(b"\n", pos + len(needle)) >= 0:
+                done[stream] = True
+        return bytes(bufs[_STDOUT]), bytes(bufs[_STDERR])
+
+    def _read_frame(self) -> tuple[int, bytes]:
+        # Non-TTY exec output is multiplexed: 8-byte header (stream, 0, 0, 0, size BE u32)
+        header = self._read_exact(8)
+        size = int.from_bytes(header[4:], "big")
+        return header[0], self._read_exact(size)
+
+    def _read_exact(self, n: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < n:
+            try:
+                chunk = self._raw.recv(n - len(buf))
+            except TimeoutError as exc:
+                raise ExecSessionError("no output before the timeout") from exc
+            if not chunk:
+                raise ExecSessionError("exec session closed by the container")
+            buf += chunk
+        return bytes(buf)
+
+
+def open_exec_session(
+    docker_sdk: Any,
+    container_name: str | None = None,
+    env_script: str | None = None,
+) -> ExecSession | None:
+    """Open an ExecSession, or return None (callers fall back to one exec per command)."""
+    try:
+        return ExecSession(docker_sdk, container_name, env_script)
+    except Exception as exc:
+        log.warning("exec_session_unavailable", error=str(exc))
+        return None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 import structlog
@@ -54,36 +55,26 @@ class VolumeManager:
         oddities, or alternative representations never silently return the
         host path into the Docker container.
         """
-        resolved = host_path.resolve()
-        try:
-            rel = resolved.relative_to(self._host_cases_dir)
-            return f"{self._container_cases_dir}/{rel}"
-        except ValueError:
-            pass
-
-        m = _RE_CASE_SEGMENT.search(str(resolved))
-        if m:
-            log.warning(
-                "host_to_container_fallback",
+        # Resolved here, outside the cache: the result depends on the cwd and symlinks
+        resolved = str(host_path.resolve())
+        container_path, extracted = _host_to_container(
+            resolved, self._host_cases_dir, self._container_cases_dir,
+        )
+        if container_path is None:
+            log.error(
+                "host_to_container_failed",
                 host_path=str(host_path),
-                extracted=m.group(1),
+                cases_dir=str(self._host_cases_dir),
+                hint="Path is not under the cases directory and does not match case_<id> pattern",
             )
-            return f"{self._container_cases_dir}/{m.group(1)}"
-
-        log.error(
-            "host_to_container_failed",
-            host_path=str(host_path),
-            cases_dir=str(self._host_cases_dir),
-            hint="Path is not under the cases directory and does not match case_<id> pattern",
-        )
-        return str(host_path)
+            return str(host_path)
+        if extracted is not None:
+            log.warning("host_to_container_fallback", host_path=str(host_path), extracted=extracted)
+        return container_path
 
     def container_to_host(self, container_path: str) -> Path:
         """Translate a container path to the equivalent host path."""
-        if container_path.startswith(self._container_cases_dir):
-            rel = container_path[len(self._container_cases_dir):].lstrip("/")
-            return self._host_cases_dir / rel
-        return Path(container_path)
+        return _container_to_host(container_path, self._host_cases_dir, self._container_cases_dir)
 
     def ensure_writable(self, path: Path) -> None:
         """Ensure a case directory exists and is writable."""
@@ -94,3 +85,35 @@ class VolumeManager:
             test_file.unlink()
         except OSError as exc:
             raise OSError(f"Case directory is not writable: {path}: {exc}") from exc
+
+
+# Tools build a fresh VolumeManager per call, so the translations are cached at
+# module level, keyed on the mount layout as well as the path. Only pure string
+# mappings are cached; resolving and logging stay with the caller.
+@lru_cache(maxsize=4096)
+def _host_to_container(
+    resolved: str, host_cases_dir: Path, container_cases_dir: str,
+) -> tuple[str | None, str | None]:
+    """Map a resolved host path to ``(container_path, extracted_case_segment)``.
+
+    The segment is set only when the ``cases/case_<id>`` fallback was used;
+    ``container_path`` is None when neither rule applies.
+    """
+    try:
+        rel = Path(resolved).relative_to(host_cases_dir)
+        return f"{container_cases_dir}/{rel}", None
+    except ValueError:
+        pass
+
+    m = _RE_CASE_SEGMENT.search(resolved)
+    if m:
+        return f"{container_cases_dir}/{m.group(1)}", m.group(1)
+    return None, None
+
+
+@lru_cache(maxsize=4096)
+def _container_to_host(container_path: str, host_cases_dir: Path, container_cases_dir: str) -> Path:
+    if container_path.startswith(container_cases_dir):
+        rel = container_path[len(container_cases_dir):].lstrip("/")
+        return host_cases_dir / rel
+    return Path(container_path)
@@ -8,19 +8,65 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict, dataclass
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import structlog
 from tqdm import tqdm
 
-from foampilot.index.parser import FoamFileParser, parse_foam_file
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json writes the same structure
+    orjson = None
+
+from foampilot.index.parser import FoamDict, FoamFileParser
 
 log = structlog.get_logger(__name__)
 
 _parser = FoamFileParser()
 
 
+@lru_cache(maxsize=256)
+def _parse_cached(path_str: str, mtime_ns: int) -> FoamDict:
+    return _parser.parse_file(Path(path_str))
+
+
+def _parse(path: Path) -> FoamDict:
+    """Parse *path*, reusing the result while the file is unchanged.
+
+    Several extractors read the same dictionary of a case (turbulenceProperties
+    twice, for one). The FoamDict is shared, so callers must not modify it.
+    """
+    return _parse_cached(str(path), path.stat().st_mtime_ns)
+
+
+_RE_RUNNER_KEY = re.compile(
+    r'^[ \t]*(application|solver)[ \t]+"?([^\s;"{}]+)"?[ \t]*;', re.MULTILINE,
+)
+
+
+def _read_runner_keys(path: Path) -> dict[str, str]:
+    """Return the top-level ``application``/``solver`` of a controlDict without parsing it.
+
+    Only these two keys are needed from the controlDict, and its functions
+    sub-dictionary is often the bulk of the file, so a regex over the
+    comment-stripped text replaces the full parse. Matches inside braces are
+    ignored, which keeps function-object entries from shadowing the top level.
+    """
+    text = _parser._strip_comments(path.read_text(encoding="utf-8", errors="replace"))
+    keys: dict[str, str] = {}
+    for match in _RE_RUNNER_KEY.finditer(text):
+        key = match.group(1)
+        head = text[:match.start()]
+        if key not in keys and head.count("{") == head.count("}"):
+            keys[key] = match.group(2)
+    return keys
+
+
 @dataclass
 class TutorialEntry:
     """Structured metadata for a single OpenFOAM tutorial case."""
@@ -36,7 +82,14 @@ class TutorialEntry:
     has_multiphase: bool
     mesh_type: str                     # "blockMesh" | "snappyHexMesh" | "external"
     description: str                   # Human-readable one-liner
-    embedding: list[float] | None = None
+    embedding: Any = None              # Row view of the builder's float32 embedding matrix
+
+
+# 0/ fields tried first when reading boundary patches, most common first
+_PREFERRED_FIELDS = {name: rank for rank, name in enumerate(("U", "p", "T", "alpha.water"))}
+
+# Fields written to the JSON index; embeddings go to a separate .npy file
+_INDEX_FIELDS = tuple(f.name for f in fields(TutorialEntry) if f.name != "embedding")
 
 
 class IndexBuilder:
@@ -50,11 +103,13 @@ class IndexBuilder:
     def __init__(self, version: str = "11", output_dir: Path | None = None) -> None:
         self._version = version
         self._output_dir = output_dir or (Path(__file__).parent / "data")
+        self._embedding_matrix = None  # (len(entries), dim) float32, set by _add_embeddings
 
     def build(
         self,
         tutorials_path: str | Path | None = None,
         generate_embeddings: bool = False,
+        workers: int | None = None,
     ) -> list[TutorialEntry]:
         """Build the index from the given tutorials directory.
 
@@ -62,6 +117,8 @@ class IndexBuilder:
             tutorials_path: Path to the OpenFOAM tutorials directory.
                 Defaults to /opt/openfoam{version}/tutorials.
             generate_embeddings: Whether to compute semantic embeddings.
+            workers: Processes used to extract case metadata (default: CPU count).
+                1 extracts in this process.
 
         Returns:
             List of TutorialEntry objects.
@@ -93,17 +150,29 @@ class IndexBuilder:
         failed = 0
         skipped = 0
 
-        for case_dir in tqdm(case_dirs, desc="Indexing cases", unit="case"):
-            rel_path = str(case_dir.relative_to(tutorials_path))
-            try:
-                entry = self._extract_entry(case_dir, tutorials_path)
-                if entry is not None:
-                    entries.append(entry)
-                else:
-                    skipped += 1
-            except Exception as exc:
+        workers = workers or os.cpu_count() or 1
+        jobs = [(self, case_dir, tutorials_path) for case_dir in case_dirs]
+        if workers > 1 and len(jobs) > 1:
+            # Cases are independent and parsing is CPU-bound, so they are spread
+            # over worker processes rather than threads
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                results = list(tqdm(
+                    pool.map(_extract_job, jobs, chunksize=16),
+                    total=len(jobs), desc="Indexing cases", unit="case",
+                ))
+        else:
+            results = [
+                _extract_job(job) for job in tqdm(jobs, desc="Indexing cases", unit="case")
+            ]
+
+        for rel_path, entry, error in results:
+            if error is not None:
                 failed += 1
-                log.warning("case_extraction_failed", case=rel_path, error=str(exc))
+                log.warning("case_extraction_failed", case=rel_path, error=error)
+            elif entry is not None:
+                entries.append(entry)
+            else:
+                skipped += 1
 
         log.info(
             "extraction_complete",
@@ -114,6 +183,7 @@ class IndexBuilder:
         )
 
         # ── Stage 3: Semantic embeddings (optional) ─────────────────────────
+        self._embedding_matrix = None
         if generate_embeddings:
             self._add_embeddings(entries)
 
@@ -128,9 +198,8 @@ class IndexBuilder:
     def _find_cases(self, tutorials_path: Path):
         """Yield directories that look like OpenFOAM cases (have system/controlDict)."""
         for root, dirs, _files in os.walk(tutorials_path):
-            root_path = Path(root)
-            if (root_path / "system" / "controlDict").exists():
-                yield root_path
+            if os.path.exists(os.path.join(root, "system", "controlDict")):
+                yield Path(root)
                 dirs.clear()  # Don't recurse into sub-cases
 
     # ── Per-case metadata extraction ───────────────────────────────────────────
@@ -144,17 +213,20 @@ class IndexBuilder:
 
         control_dict_path = case_dir / "system" / "controlDict"
         try:
-            control_dict = parse_foam_file(control_dict_path)
+            runner_keys = _read_runner_keys(control_dict_path)
+            if "application" not in runner_keys:
+                # Unusual layout (macro, #include, ...): let the full parser decide
+                runner_keys = _parse(control_dict_path).data
         except Exception as exc:
             log.warning("controlDict_parse_failed", case=rel_path, error=str(exc))
             return None
 
-        application = str(control_dict.data.get("application", "unknown")).strip()
+        application = str(runner_keys.get("application", "unknown")).strip()
 
         # OpenFOAM-11 uses foamRun/foamMultiRun as runner with a separate 'solver'
         # key that names the actual physics module (e.g., incompressibleFluid).
         if application in self._MODULAR_RUNNERS:
-            physics_module = str(control_dict.data.get("solver", "")).strip()
+            physics_module = str(runner_keys.get("solver", "")).strip()
             solver = physics_module if physics_module else application
             log.debug(
                 "v11_modular_solver",
@@ -165,14 +237,11 @@ class IndexBuilder:
         else:
             solver = application
 
-        all_files = []
-        for root, _, fnames in os.walk(case_dir):
-            for fname in fnames:
-                fpath = Path(root) / fname
-                all_files.append(str(fpath.relative_to(case_dir)))
+        case_str = str(case_dir)
+        all_files = [path[len(case_str) + 1:] for path in _walk_files(case_str)]
 
         boundary_patches = self._extract_boundary_patches(case_dir)
-        physics_tags = self._infer_physics_tags(case_dir, solver, control_dict)
+        physics_tags = self._infer_physics_tags(case_dir, solver)
         turbulence_model = self._extract_turbulence_model(case_dir)
         mesh_type = self._detect_mesh_type(case_dir)
         has_heat_transfer = self._has_heat_transfer(case_dir, physics_tags)
@@ -203,9 +272,15 @@ class IndexBuilder:
         if not zero_dir.exists():
             return patches
 
-        for field_file in (f for f in zero_dir.iterdir() if f.is_file()):
+        # Probe the fields nearly every case has first, so one parse usually
+        # suffices; the rest are only tried if none of those has patches
+        field_files = sorted(
+            (f for f in zero_dir.iterdir() if f.is_file()),
+            key=lambda f: _PREFERRED_FIELDS.get(f.name, len(_PREFERRED_FIELDS)),
+        )
+        for field_file in field_files:
             try:
-                foam = parse_foam_file(field_file)
+                foam = _parse(field_file)
                 bf = foam.data.get("boundaryField", {})
                 if not isinstance(bf, dict):
                     continue
@@ -240,9 +315,19 @@ class IndexBuilder:
         "isothermalfilm": ["multiphase"],
     }
 
-    def _infer_physics_tags(
-        self, case_dir: Path, solver: str, control_dict,
-    ) -> list[str]:
+    # Classic (v6–v10) solver-name substrings → tag, one compiled alternation per
+    # tag so each is a single regex scan instead of a chain of `in` tests
+    _CLASSIC_SOLVER_TAGS: tuple[tuple[str, re.Pattern], ...] = tuple(
+        (tag, re.compile("|".join(substrings)))
+        for tag, substrings in (
+            ("incompressible", ("icofoam", "simplefoam", "pimplefoam", "srf", "incompressible")),
+            ("compressible", ("rho", "sonic", "compressible", "central")),
+            ("multiphase", ("inter", "multiphase", "vof", "drift")),
+            ("heat_transfer", ("buoyant", "cht", "heat")),
+        )
+    )
+
+    def _infer_physics_tags(self, case_dir: Path, solver: str) -> list[str]:
         """Infer physics tags from solver name and case structure."""
         tags: list[str] = []
         solver_lower = solver.lower()
@@ -252,23 +337,13 @@ class IndexBuilder:
             tags.extend(self._V11_MODULE_TAGS[solver_lower])
         else:
             # Classic solver name patterns (v6–v10)
-            if any(s in solver_lower for s in ["icofoam", "simplefoam", "pimplefoam", "srf",
-                                                "incompressible"]):
-                tags.append("incompressible")
-
-            if any(s in solver_lower for s in ["rho", "sonic", "compressible", "central"]):
-                tags.append("compressible")
-
-            if any(s in solver_lower for s in ["inter", "multiphase", "vof", "drift"]):
-                tags.append("multiphase")
-
-            if any(s in solver_lower for s in ["buoyant", "cht", "heat"]):
-                tags.append("heat_transfer")
+            tags.extend(tag for tag, pattern in self._CLASSIC_SOLVER_TAGS
+                        if pattern.search(solver_lower))
 
         fv_schemes_path = case_dir / "system" / "fvSchemes"
         if fv_schemes_path.exists():
             try:
-                fv = parse_foam_file(fv_schemes_path)
+                fv = _parse(fv_schemes_path)
                 ddt = fv.data.get("ddtSchemes", {})
                 if isinstance(ddt, dict):
                     default_ddt = str(ddt.get("default", "")).lower()
@@ -282,7 +357,7 @@ class IndexBuilder:
         turb_path = case_dir / "constant" / "turbulenceProperties"
         if turb_path.exists():
             try:
-                turb = parse_foam_file(turb_path)
+                turb = _parse(turb_path)
                 sim_type = str(turb.data.get("simulationType", "")).lower()
                 if sim_type in ("ras", "les"):
                     tags.append("turbulent")
@@ -300,7 +375,7 @@ class IndexBuilder:
             return None
 
         try:
-            turb = parse_foam_file(turb_path)
+            turb = _parse(turb_path)
             for section in ("RAS", "LES"):
                 if section in turb.data and isinstance(turb.data[section], dict):
                     model = str(turb.data[section].get("turbulenceModel", ""))
@@ -332,7 +407,7 @@ class IndexBuilder:
         transport_path = case_dir / "constant" / "transportProperties"
         if transport_path.exists():
             try:
-                tp = parse_foam_file(transport_path)
+                tp = _parse(transport_path)
                 if "phases" in tp.data:
                     return True
             except Exception:
@@ -359,10 +434,12 @@ class IndexBuilder:
         from foampilot.index.embeddings import embed_batch
 
         texts = [e.description for e in entries]
-        embeddings = embed_batch(texts)
-        if embeddings:
-            for entry, emb in zip(entries, embeddings):
-                entry.embedding = emb
+        matrix = embed_batch(texts)
+        if matrix is not None:
+            # Entries get row views; the matrix itself is what _save writes
+            self._embedding_matrix = matrix
+            for entry, row in zip(entries, matrix):
+                entry.embedding = row
         else:
             log.error("embeddings_failed", reason="embed_batch returned None")
 
@@ -373,23 +450,62 @@ class IndexBuilder:
         self._output_dir.mkdir(parents=True, exist_ok=True)
         index_path = self._output_dir / f"tutorial_index_v{self._version}.json"
 
-        index_data = []
-        embeddings_data = []
-        for entry in entries:
-            d = asdict(entry)
-            emb = d.pop("embedding", None)
-            index_data.append(d)
-            embeddings_data.append(emb)
-
-        json_text = json.dumps(index_data, indent=2)
-        index_path.write_text(json_text)
-        size_kb = len(json_text.encode()) / 1024
+        # Shallow projection instead of asdict(), which deep-copies every files
+        # list and patch dict only for them to be serialized and dropped
+        index_data = [{name: getattr(entry, name) for name in _INDEX_FIELDS} for entry in entries]
+
+        if orjson is not None:
+            payload = orjson.dumps(index_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(index_data, indent=2).encode()
+        index_path.write_bytes(payload)
+        size_kb = len(payload) / 1024
         log.info("index_saved", path=str(index_path), entries=len(entries), size_kb=round(size_kb, 1))
 
-        has_embeddings = any(e is not None for e in embeddings_data)
-        if has_embeddings:
+        if self._embedding_matrix is not None:
             import numpy as np
             emb_path = self._output_dir / f"tutorial_embeddings_v{self._version}.npy"
-            valid = [e for e in embeddings_data if e is not None]
-            np.save(emb_path, np.array(valid, dtype=np.float32))
-            log.info("embeddings_saved", path=str(emb_path), count=len(valid))
+            np.save(emb_path, self._embedding_matrix)
+            log.info("embeddings_saved", path=str(emb_path), count=len(self._embedding_matrix))
+
+
+def _walk_files(root: str):
+    """Yield the paths of all files under *root*, in os.walk order.
+
+    Works on DirEntry path strings so no Path objects are built per file.
+    Like os.walk, symlinked directories are neither listed nor followed and
+    unreadable directories are skipped.
+    """
+    subdirs = []
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return  # unreadable directory: skipped, as os.walk does
+    with it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield entry.path
+            elif not entry.is_symlink():
+                subdirs.append(entry.path)
+    for subdir in subdirs:
+        yield from _walk_files(subdir)
+
+
+def _extract_job(
+    job: tuple[IndexBuilder, Path, Path],
+) -> tuple[str, TutorialEntry | None, str | None]:
+    """Extract one case; module-level so ProcessPoolExecutor can pickle it.
+
+    Returns:
+        (relative case path, entry or None if skipped, error message or None).
+    """
+    builder, case_dir, tutorials_root = job
+    rel_path = str(case_dir.relative_to(tutorials_root))
+    try:
+        return rel_path, builder._extract_entry(case_dir, tutorials_root), None
+    except Exception as exc:
+        return rel_path, None, str(exc)
@@ -6,6 +6,8 @@ No external API calls.
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import structlog
 
@@ -33,66 +35,74 @@ def _get_model():
     return _model
 
 
-def embed_text(text: str) -> list[float] | None:
+def embed_text(text: str) -> np.ndarray | None:
     """Compute an embedding vector for a single text string.
 
     Args:
         text: Text to embed.
 
     Returns:
-        List of floats (384-dimensional), or None if model unavailable.
+        float32 vector (384-dimensional), or None if model unavailable.
     """
     model = _get_model()
     if model is None:
         return None
-    vec = model.encode(text, normalize_embeddings=True)
-    return vec.tolist()
+    vec = model.encode(text, normalize_embeddings=True, convert_to_numpy=True)
+    return vec.astype(np.float32, copy=False)
 
 
-def embed_batch(texts: list[str]) -> list[list[float]] | None:
+def embed_batch(texts: list[str]) -> np.ndarray | None:
     """Compute embeddings for a batch of texts.
 
     Args:
         texts: List of strings.
 
     Returns:
-        List of embedding vectors, or None if model unavailable.
+        (len(texts), 384) float32 matrix, one row per text, or None if model unavailable.
     """
     model = _get_model()
     if model is None:
         return None
-    vecs = model.encode(texts, normalize_embeddings=True, batch_size=32, show_progress_bar=False)
-    return vecs.tolist()
+    vecs = model.encode(
+        texts, normalize_embeddings=True, batch_size=32,
+        show_progress_bar=False, convert_to_numpy=True,
+    )
+    return vecs.astype(np.float32, copy=False)
 
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
+def cosine_similarity(a: list[float] | np.ndarray, b: list[float] | np.ndarray) -> float:
     """Compute cosine similarity between two normalized embedding vectors."""
-    va = np.array(a, dtype=np.float32)
-    vb = np.array(b, dtype=np.float32)
-    dot = float(np.dot(va, vb))
-    norm = float(np.linalg.norm(va) * np.linalg.norm(vb))
-    return dot / norm if norm > 0 else 0.0
+    va = np.asarray(a, dtype=np.float32)
+    vb = np.asarray(b, dtype=np.float32)
+    # Three dot products; np.linalg.norm costs more dispatch than the math
+    norm_sq = float(va @ va) * float(vb @ vb)
+    return float(va @ vb) / math.sqrt(norm_sq) if norm_sq > 0 else 0.0
 
 
 def top_k_similar(
-    query_embedding: list[float],
-    embeddings: list[list[float]],
+    query_embedding: list[float] | np.ndarray,
+    embeddings: list[list[float]] | np.ndarray,
     k: int = 10,
 ) -> list[tuple[int, float]]:
     """Find the top-k most similar embeddings to a query.
 
     Args:
         query_embedding: Query vector.
-        embeddings: List of candidate vectors.
+        embeddings: Candidate vectors, as a list or an (N, dim) array.
         k: Number of results.
 
     Returns:
         List of (index, similarity_score) sorted by descending similarity.
     """
-    if not embeddings:
+    if len(embeddings) == 0 or k <= 0:
         return []
-    q = np.array(query_embedding, dtype=np.float32)
-    matrix = np.array(embeddings, dtype=np.float32)
+    q = np.asarray(query_embedding, dtype=np.float32)
+    matrix = np.asarray(embeddings, dtype=np.float32)
     scores = matrix @ q  # dot product (vectors are normalized)
-    top_indices = np.argsort(scores)[::-1][:k]
+    if k >= scores.shape[0]:
+        top_indices = np.argsort(-scores, kind="stable")
+    else:
+        # Select the k best in O(N), then sort only those
+        part = np.argpartition(-scores, k - 1)[:k]
+        top_indices = part[np.argsort(-scores[part], kind="stable")]
     return [(int(i), float(scores[i])) for i in top_indices]
@@ -33,8 +33,8 @@ _RE_DIMENSION = re.compile(r"\[\s*[-\d\.\s]+\]")
 # Uniform vector/tensor: uniform (1 0 0)
 _RE_UNIFORM_VECTOR = re.compile(r"uniform\s*\([^)]+\)")
 
-# Number
-_RE_NUMBER = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+# First character of an unsigned number
+_NUMBER_START = frozenset("0123456789.")
 
 
 @dataclass
@@ -139,12 +139,13 @@ class FoamFileParser:
         text = _RE_COMMENT_SINGLE.sub("", text)
         return text
 
-    # Token regex: quoted strings first, then single-char delimiters, then bare words.
-    # This ensures "(U|k|epsilon)" is kept as one token and not split on the parens.
+    # Token regex: bare words, single-char delimiters and quoted strings start with
+    # disjoint characters, so the order only affects speed: the most common kind is
+    # tried first. A quoted "(U|k|epsilon)" is still kept as one token.
     _RE_TOKEN = re.compile(
-        r'"[^"]*"'          # double-quoted string (kept whole)
+        r"[^\s{}();\"]+"    # bare word / number / keyword
         r"|[{}();]"         # single-char structural delimiters
-        r"|[^\s{}();\"]+",  # bare word / number / keyword
+        r'|"[^"]*"',        # double-quoted string (kept whole)
     )
 
     # ── Private: tokenizer ─────────────────────────────────────────────────────
@@ -164,8 +165,9 @@ class FoamFileParser:
             (new_pos, dict_of_entries)
         """
         entries: dict = {}
+        n = len(tokens)
 
-        while pos < len(tokens):
+        while pos < n:
             tok = tokens[pos]
 
             if tok == "}":
@@ -179,7 +181,7 @@ class FoamFileParser:
             if tok.startswith("#include"):
                 # #include "filename" — skip for now (we don't resolve files)
                 pos += 1
-                if pos < len(tokens):
+                if pos < n:
                     pos += 1  # skip filename
                 continue
 
@@ -187,7 +189,7 @@ class FoamFileParser:
             key = tok.strip('"')
             pos += 1
 
-            if pos >= len(tokens):
+            if pos >= n:
                 break
 
             next_tok = tokens[pos]
@@ -196,7 +198,7 @@ class FoamFileParser:
                 # Sub-dictionary
                 pos += 1  # consume {
                 pos, sub_dict = self._parse_block_contents(tokens, pos)
-                if pos < len(tokens) and tokens[pos] == "}":
+                if pos < n and tokens[pos] == "}":
                     pos += 1  # consume }
                 entries[key] = sub_dict
 
@@ -206,7 +208,7 @@ class FoamFileParser:
                 pos, lst = self._parse_list(tokens, pos)
                 entries[key] = lst
                 # Consume optional semicolon
-                if pos < len(tokens) and tokens[pos] == ";":
+                if pos < n and tokens[pos] == ";":
                     pos += 1
 
             elif next_tok == ";":
@@ -219,7 +221,7 @@ class FoamFileParser:
                 pos, value = self._parse_value(tokens, pos)
                 entries[key] = value
                 # Consume semicolon
-                if pos < len(tokens) and tokens[pos] == ";":
+                if pos < n and tokens[pos] == ";":
                     pos += 1
 
         return pos, entries
@@ -231,8 +233,9 @@ class FoamFileParser:
         multi-token strings, and $references.
         """
         value_parts: list[str] = []
+        n = len(tokens)
 
-        while pos < len(tokens) and tokens[pos] not in (";", "}", "{"):
+        while pos < n and tokens[pos] not in (";", "}", "{"):
             tok = tokens[pos]
             if tok == "(":
                 # Embedded list (e.g. dimensional value or vector)
@@ -253,8 +256,9 @@ class FoamFileParser:
         The closing ) is consumed here.
         """
         items: list = []
+        n = len(tokens)
 
-        while pos < len(tokens) and tokens[pos] != ")":
+        while pos < n and tokens[pos] != ")":
             tok = tokens[pos]
             if tok == "(":
                 pos += 1
@@ -263,7 +267,7 @@ class FoamFileParser:
             elif tok == "{":
                 pos += 1
                 pos, sub_dict = self._parse_block_contents(tokens, pos)
-                if pos < len(tokens) and tokens[pos] == "}":
+                if pos < n and tokens[pos] == "}":
                     pos += 1
                 items.append(sub_dict)
             elif tok == ";":
@@ -272,7 +276,7 @@ class FoamFileParser:
                 items.append(self._coerce(tok))
                 pos += 1
 
-        if pos < len(tokens):
+        if pos < n:
             pos += 1  # consume )
 
         return pos, items
@@ -281,25 +285,30 @@ class FoamFileParser:
         """Convert a raw string token to the most appropriate Python type."""
         if not raw:
             return raw
+        c0 = raw[0]
         # Strip surrounding quotes
-        if raw.startswith('"') and raw.endswith('"'):
+        if c0 == '"' and raw[-1] == '"':
             return raw[1:-1]
-        # Boolean-like
-        if raw.lower() in ("true", "on", "yes"):
-            return True
-        if raw.lower() in ("false", "off", "no"):
-            return False
-        # Number
-        if _RE_NUMBER.match(raw):
-            try:
-                if "." in raw or "e" in raw.lower():
-                    return float(raw)
-                return int(raw)
-            except ValueError:
-                pass
-        # $reference — return as-is (prefixed)
-        if raw.startswith("$"):
+        # Number: only tokens that start like one reach int()/float(), which
+        # keeps out "inf"/"nan" spellings; "_" is refused as int() allows "1_000"
+        if c0 in _NUMBER_START or (
+            c0 in "+-" and len(raw) > 1 and raw[1] in _NUMBER_START
+        ):
+            if "_" not in raw:
+                is_float = "." in raw or "e" in raw or "E" in raw
+                try:
+                    return float(raw) if is_float else int(raw)
+                except ValueError:
+                    pass
             return raw
+        # Boolean-like (the longest spelling is 5 characters)
+        if len(raw) <= 5:
+            low = raw.lower()
+            if low in ("true", "on", "yes"):
+                return True
+            if low in ("false", "off", "no"):
+                return False
+        # $reference and everything else — returned as-is
         return raw
 
 
@@ -8,6 +8,7 @@ Two-stage search:
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -24,6 +25,10 @@ _W_KEYWORD = 0.20
 _W_SEMANTIC = 0.10
 
 
+_searchers: dict[tuple[Path, str], TutorialSearcher] = {}
+_searchers_lock = threading.Lock()
+
+
 @dataclass
 class SearchResult:
     """A single search result with its relevance score."""
@@ -49,7 +54,7 @@ class TutorialSearcher:
         self._index_dir = index_dir or (Path(__file__).parent / "data")
         self._version = version
         self._entries: list[TutorialEntry] | None = None
-        self._embeddings: list[list[float]] | None = None
+        self._embeddings = None  # (len(entries), dim) float32 ndarray when available
 
     # ── Index loading ──────────────────────────────────────────────────────────
 
@@ -79,7 +84,7 @@ class TutorialSearcher:
         size_kb = round(index_path.stat().st_size / 1024, 1)
         log.debug("index_file_found", path=str(index_path), size_kb=size_kb)
 
-        raw = json.loads(index_path.read_text())
+        raw = json.loads(index_path.read_bytes())
         self._entries = [TutorialEntry(**item) for item in raw]
         log.info(
             "index_loaded",
@@ -96,7 +101,7 @@ class TutorialSearcher:
             try:
                 import numpy as np
                 arr = np.load(emb_path)
-                self._embeddings = arr.tolist()
+                self._embeddings = arr.astype(np.float32, copy=False)
                 dims = arr.shape[1] if arr.ndim == 2 else "unknown"
                 log.info(
                     "embeddings_loaded",
@@ -212,11 +217,11 @@ class TutorialSearcher:
         # ── Stage 2: Query embedding (semantic search) ───────────────────────
         query_embedding = None
         if query_text:
-            if self._embeddings:
+            if self._embeddings is not None and len(self._embeddings):
                 log.info("computing_query_embedding", query_text=query_text)
                 from foampilot.index.embeddings import embed_text
                 query_embedding = embed_text(query_text)
-                if query_embedding:
+                if query_embedding is not None:
                     log.info(
                         "query_embedding_computed",
                         dimensions=len(query_embedding),
@@ -231,6 +236,11 @@ class TutorialSearcher:
 
         # ── Stage 3: Score and rank all candidates ───────────────────────────
         log.info("scoring_candidates", count=len(candidates))
+        # One matrix-vector product gives every entry's similarity (rows and
+        # query are normalized, so the dot product is the cosine)
+        similarities = (
+            self._embeddings @ query_embedding if query_embedding is not None else None
+        )
         scored = []
         for idx, entry in candidates:
             score, reasons = self._score(
@@ -238,10 +248,9 @@ class TutorialSearcher:
                 solver=solver,
                 physics_tags=physics_tags or [],
                 keywords=keywords or [],
-                query_embedding=query_embedding,
-                entry_embedding=(
-                    self._embeddings[idx]
-                    if self._embeddings and idx < len(self._embeddings)
+                similarity=(
+                    float(similarities[idx])
+                    if similarities is not None and idx < len(similarities)
                     else None
                 ),
             )
@@ -330,8 +339,7 @@ class TutorialSearcher:
         solver: str | None,
         physics_tags: list[str],
         keywords: list[str],
-        query_embedding: list[float] | None,
-        entry_embedding: list[float] | None,
+        similarity: float | None,
     ) -> tuple[float, list[str]]:
         """Compute a relevance score [0..1] for a candidate entry."""
         reasons: list[str] = []
@@ -374,12 +382,10 @@ class TutorialSearcher:
             total += kw_score
 
         # Semantic similarity (10%)
-        if query_embedding and entry_embedding:
-            from foampilot.index.embeddings import cosine_similarity
-            sim = cosine_similarity(query_embedding, entry_embedding)
-            sem_score = _W_SEMANTIC * max(0.0, sim)
+        if similarity is not None:
+            sem_score = _W_SEMANTIC * max(0.0, similarity)
             total += sem_score
-            reasons.append(f"semantic similarity: {sim:.3f}")
+            reasons.append(f"semantic similarity: {similarity:.3f}")
         else:
             sem_score = _W_SEMANTIC * 0.5
             total += sem_score
@@ -397,3 +403,22 @@ class TutorialSearcher:
             reasons=reasons,
         )
         return score, reasons
+
+
+def get_searcher(index_dir: Path | None = None, version: str = "11") -> TutorialSearcher:
+    """Return a process-wide TutorialSearcher with its index already loaded.
+
+    The index JSON and embeddings are read once per (index_dir, version) instead
+    of on every search. A missing or empty index is not cached, so an index built
+    later in the same process is picked up.
+    """
+    searcher = TutorialSearcher(index_dir=index_dir, version=version)
+    key = (searcher._index_dir, version)
+    with _searchers_lock:
+        cached = _searchers.get(key)
+        if cached is not None:
+            return cached
+        searcher._load()
+        if searcher._entries:
+            _searchers[key] = searcher
+    return searcher
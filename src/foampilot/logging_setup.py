@@ -13,6 +13,16 @@ from pathlib import Path
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # optional speedup; structlog falls back to stdlib json
+    orjson = None
+
+
+def _orjson_dumps(obj, default=None, **kwargs) -> str:
+    """json.dumps-compatible serializer for JSONRenderer (which expects str)."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 def configure_logging(
     verbose: bool = False,
@@ -39,7 +49,9 @@ def configure_logging(
     ]
 
     structlog.configure(
-        processors=shared_processors + [
+        # filter_by_level drops events below the logger's level before any other
+        # processor runs (timestamps, formatting), not after all of them
+        processors=[structlog.stdlib.filter_by_level] + shared_processors + [
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -57,7 +69,11 @@ def configure_logging(
     file_handler.setLevel(file_level)
     file_handler.setFormatter(
         structlog.stdlib.ProcessorFormatter(
-            processor=structlog.processors.JSONRenderer(),
+            processor=(
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+                if orjson is not None
+                else structlog.processors.JSONRenderer()
+            ),
             foreign_pre_chain=shared_processors,
         )
     )
@@ -55,11 +55,11 @@ When adapting them for a legacy solver (icoFoam, simpleFoam, pimpleFoam, etc.),
 - NEVER generate files from memory — always start from the tutorial template
 - Make the MINIMUM changes needed to match the user's requirements
 - Preserve the tutorial's numerical stability settings unless explicitly asked to change them
-- Document every modification with its rationale in the output JSON
+- Document every modification with its rationale in the submitted result
 - If search_tutorials does not find an exact match, pick the CLOSEST available tutorial and adapt it
 
 ## Output Format
-Return a JSON object:
+Finish by calling submit_result with an object like:
 ```json
 {{
   "tutorial_source": "incompressibleFluid/pitzDaily",
@@ -0,0 +1,225 @@
+"""Phase agents exposed as tools, so a parent agent can fan work out across cases.
+
+Each call runs one pipeline agent (with its own AgentLoop and message history)
+on one named case under a shared base directory. The tools are parallel-safe:
+calls for different cases in the same turn run concurrently, while a second call
+for a case that is still busy is refused instead of racing on its files.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from foampilot.core.permissions import PermissionLevel
+from foampilot.tools.base import Tool, ToolResult
+
+log = structlog.get_logger(__name__)
+
+_RE_CASE_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+_CASE_NAME_SCHEMA = {
+    "type": "string",
+    "description": "Short unique name for this case, e.g. 'mesh_coarse' or 'Re_1000'. "
+                   "Letters, digits, '_', '.', '-' only.",
+}
+_SPEC_SCHEMA = {
+    "type": "object",
+    "description": "SimulationSpec for this case (as returned by agent__consult).",
+}
+
+
+class CaseRegistry:
+    """Maps case names to directories and tracks which cases an agent is working on."""
+
+    def __init__(self, base_dir: Path) -> None:
+        self.base_dir = base_dir
+        self._busy: set[str] = set()
+        self._lock = threading.Lock()
+
+    def acquire(self, case_name: str) -> Path:
+        """Claim *case_name* and return its directory.
+
+        Raises:
+            ValueError: If the name is invalid or another call holds the case.
+        """
+        if not _RE_CASE_NAME.match(case_name):
+            raise ValueError(f"Invalid case_name '{case_name}'")
+        with self._lock:
+            if case_name in self._busy:
+                raise ValueError(
+                    f"Case '{case_name}' is already being worked on by another agent call. "
+                    "Wait for that call's result before calling another agent on it."
+                )
+            self._busy.add(case_name)
+        return self.base_dir / case_name
+
+    def release(self, case_name: str) -> None:
+        with self._lock:
+            self._busy.discard(case_name)
+
+
+class _AgentTool(Tool):
+    """Runs one phase agent on a named case. Subclasses implement _run_agent()."""
+
+    permission_level = PermissionLevel.NOTIFY
+    is_parallel_safe = True
+
+    def __init__(
+        self,
+        cases: CaseRegistry,
+        docker_client: Any | None = None,
+        event_callback: Any | None = None,
+        approval_callback: Any | None = None,
+    ) -> None:
+        self._cases = cases
+        self._docker = docker_client
+        self._event_cb = event_callback
+        self._approval_cb = approval_callback
+
+    def execute(self, case_name: str, **kwargs: Any) -> ToolResult:
+        try:
+            case_dir = self._cases.acquire(case_name)
+        except ValueError as exc:
+            return ToolResult.fail(str(exc))
+
+        log.info("agent_tool_start", tool=self.name, case=case_name)
+        try:
+            agent_kwargs = {
+                "event_callback": self._tagged(case_name),
+                "approval_callback": self._approval_cb,
+            }
+            data = self._run_agent(case_dir, agent_kwargs, **kwargs)
+        except Exception as exc:
+            log.error("agent_tool_failed", tool=self.name, case=case_name, error=str(exc))
+            return ToolResult.fail(f"{self.name} failed for case '{case_name}': {exc}")
+        finally:
+            self._cases.release(case_name)
+        return ToolResult.ok(data={"case_name": case_name, "case_dir": str(case_dir), **data})
+
+    def _tagged(self, case_name: str) -> Any | None:
+        """Wrap the event callback so each event says which case it came from."""
+        if self._event_cb is None:
+            return None
+
+        def _forward(event: dict) -> None:
+            self._event_cb({**event, "case": case_name})
+
+        return _forward
+
+    @abstractmethod
+    def _run_agent(self, case_dir: Path, agent_kwargs: dict, **kwargs: Any) -> dict:
+        """Run the phase agent on *case_dir* and return the tool's result data."""
+
+
+class ConsultAgentTool(_AgentTool):
+    """Turn a natural-language case description into a SimulationSpec."""
+
+    name = "agent__consult"
+    description = (
+        "Run the ConsultAgent: turn a natural-language description of one case into a "
+        "SimulationSpec. Returns {'simulation_spec': {...}}."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "case_name": _CASE_NAME_SCHEMA,
+            "request": {"type": "string", "description": "Description of this case."},
+        },
+        "required": ["case_name", "request"],
+    }
+
+    def _run_agent(
+        self, case_dir: Path, agent_kwargs: dict, request: str = "", **kwargs: Any,
+    ) -> dict:
+        from foampilot.agents.consult_agent import ConsultAgent
+        return {"simulation_spec": ConsultAgent(**agent_kwargs).run(request)}
+
+
+class SetupAgentTool(_AgentTool):
+    """Create a case directory from the best matching tutorial."""
+
+    name = "agent__setup"
+    description = (
+        "Run the SetupAgent: copy the best matching tutorial into the case directory and "
+        "adapt it to the SimulationSpec."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {"case_name": _CASE_NAME_SCHEMA, "simulation_spec": _SPEC_SCHEMA},
+        "required": ["case_name", "simulation_spec"],
+    }
+
+    def _run_agent(
+        self,
+        case_dir: Path,
+        agent_kwargs: dict,
+        simulation_spec: dict | None = None,
+        **kwargs: Any,
+    ) -> dict:
+        from foampilot.agents.setup_agent import SetupAgent
+        return SetupAgent(**agent_kwargs).run(simulation_spec or {}, case_dir)
+
+
+class MeshAgentTool(_AgentTool):
+    """Generate and check the mesh of a set-up case."""
+
+    name = "agent__mesh"
+    description = (
+        "Run the MeshAgent: generate the mesh for a case created by agent__setup and "
+        "return its quality metrics."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {"case_name": _CASE_NAME_SCHEMA},
+        "required": ["case_name"],
+    }
+
+    def _run_agent(self, case_dir: Path, agent_kwargs: dict, **kwargs: Any) -> dict:
+        from foampilot.agents.mesh_agent import MeshAgent
+        return MeshAgent(docker_client=self._docker, **agent_kwargs).run(case_dir)
+
+
+class RunAgentTool(_AgentTool):
+    """Run the solver on a meshed case."""
+
+    name = "agent__run"
+    description = (
+        "Run the RunAgent: execute the solver on a meshed case and return convergence "
+        "status and final residuals."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {"case_name": _CASE_NAME_SCHEMA, "simulation_spec": _SPEC_SCHEMA},
+        "required": ["case_name", "simulation_spec"],
+    }
+
+    def _run_agent(
+        self,
+        case_dir: Path,
+        agent_kwargs: dict,
+        simulation_spec: dict | None = None,
+        **kwargs: Any,
+    ) -> dict:
+        from foampilot.agents.run_agent import RunAgent
+        agent = RunAgent(docker_client=self._docker, **agent_kwargs)
+        return agent.run(case_dir, simulation_spec or {})
+
+
+def build_agent_tools(
+    cases: CaseRegistry,
+    docker_client: Any | None = None,
+    event_callback: Any | None = None,
+    approval_callback: Any | None = None,
+) -> dict[str, Tool]:
+    """Return the agent tools keyed by name, all bound to the same case registry."""
+    tools = [
+        cls(cases, docker_client, event_callback, approval_callback)
+        for cls in (ConsultAgentTool, SetupAgentTool, MeshAgentTool, RunAgentTool)
+    ]
+    return {tool.name: tool for tool in tools}
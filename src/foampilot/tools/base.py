@@ -40,12 +40,27 @@ class Tool(ABC):
     - input_schema: JSON Schema dict for the tool's parameters.
     - permission_level: AUTO | NOTIFY | APPROVE
     - execute(): The actual implementation.
+
+    Read-only tools may set is_parallel_safe = True so the agent loop can run
+    them concurrently with neighbouring calls from the same turn.
     """
 
     name: str = ""
     description: str = ""
     input_schema: dict = {}
     permission_level: PermissionLevel = PermissionLevel.AUTO
+    is_parallel_safe: bool = False
+
+    # Built once per class from the attributes above; see to_anthropic_tool()
+    _anthropic_schema: dict = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._anthropic_schema = {
+            "name": cls.name,
+            "description": cls.description,
+            "input_schema": cls.input_schema,
+        }
 
     @abstractmethod
     def execute(self, **kwargs: Any) -> ToolResult:
@@ -56,9 +71,9 @@ class Tool(ABC):
         ...
 
     def to_anthropic_tool(self) -> dict:
-        """Convert to the Anthropic API tool format."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.input_schema,
-        }
+        """Return the tool in the Anthropic API format.
+
+        The dict is shared by every instance of the class; copy it before adding
+        keys such as cache_control.
+        """
+        return self._anthropic_schema
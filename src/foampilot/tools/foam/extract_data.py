@@ -45,6 +45,7 @@ class ExtractDataTool(Tool):
         "required": ["case_dir", "operation"],
     }
     permission_level = PermissionLevel.AUTO
+    is_parallel_safe = True
 
     def execute(
         self,
@@ -92,6 +92,7 @@ class ParseLogTool(Tool):
         "required": ["log_path"],
     }
     permission_level = PermissionLevel.AUTO
+    is_parallel_safe = True
 
     def __init__(self, docker_client: Any = None) -> None:
         self._docker = docker_client
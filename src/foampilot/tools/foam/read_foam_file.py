@@ -28,6 +28,7 @@ class ReadFoamFileTool(Tool):
         "required": ["path"],
     }
     permission_level = PermissionLevel.AUTO
+    is_parallel_safe = True
 
     def execute(self, path: str, **kwargs: Any) -> ToolResult:
         file_path = resolve_host_path(path)
@@ -32,15 +32,24 @@ class RunFoamCmdTool(Tool):
         "properties": {
             "command": {
                 "type": "string",
-                "description": "The OpenFOAM command to run (e.g., 'simpleFoam', 'blockMesh -dict system/blockMeshDict')",
+                "description": (
+                    "The OpenFOAM command to run "
+                    "(e.g., 'simpleFoam', 'blockMesh -dict system/blockMeshDict')"
+                ),
             },
             "case_dir": {
                 "type": "string",
-                "description": "Path to the case directory. Use the exact path given in your system prompt.",
+                "description": (
+                    "Path to the case directory. Use the exact path given in your system prompt."
+                ),
             },
             "timeout": {
                 "type": "integer",
-                "description": "Timeout in seconds (default 3600)",
+                "description": (
+                    "Seconds without any new output before the command is abandoned "
+                    "(default 3600). Only enforced when a persistent exec session is in "
+                    "use; a one-off docker exec runs to completion."
+                ),
                 "default": 3600,
             },
             "log_file": {
@@ -52,8 +61,10 @@ class RunFoamCmdTool(Tool):
     }
     permission_level = PermissionLevel.APPROVE
 
-    def __init__(self, docker_client=None) -> None:
+    def __init__(self, docker_client=None, exec_session=None) -> None:
         self._docker = docker_client
+        # Optional persistent ExecSession with the OpenFOAM bashrc already sourced
+        self._session = exec_session
 
     def execute(
         self,
@@ -96,19 +107,51 @@ class RunFoamCmdTool(Tool):
                     ContainerManager(docker_sdk=self._docker).ensure_running()
                     return self._run_in_docker(command, container_dir, timeout, log_file, profile)
                 except Exception as retry_exc:
-                    return ToolResult.fail(f"Docker execution failed after auto-start retry: {retry_exc}")
+                    return ToolResult.fail(
+                        f"Docker execution failed after auto-start retry: {retry_exc}"
+                    )
             return ToolResult.fail(f"Docker execution failed: {exc}")
 
     def _run_in_docker(self, command, case_dir, timeout, log_file, profile):
-        from foampilot.docker.client import DockerClient
-        client = DockerClient(docker_sdk=self._docker)
-
-        source_cmd = f"source /opt/openfoam{profile.VERSION}/etc/bashrc"
-        full_cmd = f"bash -c '{source_cmd} && cd {case_dir} && {command}'"
-        if log_file:
-            full_cmd = f"bash -c '{source_cmd} && cd {case_dir} && {command} 2>&1 | tee {log_file}'"
+        """Run *command* in *case_dir*.
+
+        *timeout* is the allowed time without output on the exec session; the
+        one-off docker exec fallback does not enforce it.
+        """
+        result = None
+        if self._session is not None:
+            from foampilot.docker.session import ExecSessionError, ExecSessionInterrupted
+            session_cmd = f"{command} 2>&1 | tee {log_file}" if log_file else command
+            try:
+                result = self._session.run(session_cmd, workdir=case_dir, timeout=timeout)
+            except ExecSessionInterrupted as exc:
+                # The command was sent and may still be running; running it again
+                # would put a second process on the same case directory and log
+                self._session.close()
+                self._session = None
+                log.warning("exec_session_interrupted", command=command, error=str(exc))
+                return ToolResult.fail(
+                    f"Lost the connection while '{command}' was running; it may still be "
+                    f"running in the container. Check {log_file or 'the case'} before "
+                    f"running it again. ({exc})"
+                )
+            except ExecSessionError as exc:
+                log.warning("exec_session_lost", error=str(exc), hint="Falling back to docker exec")
+                self._session.close()
+                self._session = None
+
+        if result is None:
+            from foampilot.docker.client import DockerClient
+            client = DockerClient(docker_sdk=self._docker)
+
+            source_cmd = f"source /opt/openfoam{profile.VERSION}/etc/bashrc"
+            full_cmd = f"bash -c '{source_cmd} && cd {case_dir} && {command}'"
+            if log_file:
+                full_cmd = (
+                    f"bash -c '{source_cmd} && cd {case_dir} && {command} 2>&1 | tee {log_file}'"
+                )
 
-        result = client.exec_command(full_cmd, timeout=timeout)
+            result = client.exec_command(full_cmd, timeout=timeout)
 
         stdout = result.get("stdout", "")
         stderr = result.get("stderr", "")
@@ -4,7 +4,7 @@ from typing import Any
 
 from foampilot import config
 from foampilot.core.permissions import PermissionLevel
-from foampilot.index.searcher import TutorialSearcher
+from foampilot.index.searcher import get_searcher
 from foampilot.tools.base import Tool, ToolResult
 from foampilot.version.registry import VersionRegistry
 
@@ -42,6 +42,7 @@ class SearchTutorialsTool(Tool):
         },
     }
     permission_level = PermissionLevel.AUTO
+    is_parallel_safe = True
 
     def __init__(self, index_dir=None) -> None:
         self._index_dir = index_dir
@@ -56,7 +57,7 @@ class SearchTutorialsTool(Tool):
     ) -> ToolResult:
         try:
             version = VersionRegistry.get().active().VERSION
-            searcher = TutorialSearcher(
+            searcher = get_searcher(
                 index_dir=self._index_dir or config.INDEX_DIR,
                 version=version,
             )
@@ -38,6 +38,7 @@ class ReadFileTool(Tool):
         "required": ["path"],
     }
     permission_level = PermissionLevel.AUTO
+    is_parallel_safe = True
 
     def execute(
         self,
@@ -0,0 +1,39 @@
+"""Final-answer tool: the agent submits its structured result as tool input."""
+
+from typing import Any
+
+from foampilot.core.permissions import PermissionLevel
+from foampilot.tools.base import Tool, ToolResult
+
+SUBMIT_RESULT = "submit_result"
+
+
+class SubmitResultTool(Tool):
+    """Lets an agent return its result as schema-checked JSON instead of prose.
+
+    AgentLoop ends the run when this tool is called and exposes the call's input
+    as ``AgentLoopResult.result``, so callers never have to dig JSON out of text.
+
+    Args:
+        input_schema: JSON Schema of the result the agent must submit.
+        description: What the result is, shown to the model.
+    """
+
+    name = SUBMIT_RESULT
+    permission_level = PermissionLevel.AUTO
+
+    def __init__(self, input_schema: dict, description: str = "the final result") -> None:
+        self.input_schema = input_schema
+        self.description = (
+            f"Submit {description}. Call this exactly once, as your final action, "
+            "after all other work is done. The run ends when it is called."
+        )
+        # The schema differs per agent, so it is built here rather than per class
+        self._anthropic_schema = {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema,
+        }
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult.ok(data={"submitted": True})
@@ -30,6 +30,7 @@ class WebSearchTool(Tool):
         "required": ["query"],
     }
     permission_level = PermissionLevel.AUTO
+    is_parallel_safe = True
 
     def execute(self, query: str, num_results: int = 5, **kwargs: Any) -> ToolResult:
         # Note: Actual web search would require an API key or library.
@@ -17,6 +17,7 @@ class EventType(str, Enum):
     TOOL_NOTIFY = "tool_notify"
     TOOL_ERROR = "tool_error"
     APPROVAL_REQUIRED = "approval_required"
+    LLM_TOKEN = "llm_token"
     LLM_RESPONSE = "llm_response"
     COMPACTION = "compaction"
     AGENT_DONE = "agent_done"
@@ -6,6 +6,9 @@ import threading
 from pathlib import Path
 from typing import Callable
 
+_RE_CONFIRM_BLOCK = re.compile(r"```confirm\s*([\s\S]+?)\s*```")
+_RE_QUESTION_BLOCK = re.compile(r"```question\s*([\s\S]+?)\s*```")
+_RE_STRUCTURED_BLOCKS = re.compile(r"```(?:question|confirm)[\s\S]*?```")
 
 MAX_CLARIFY_TURNS = 6
 
@@ -175,7 +178,7 @@ class SimulationRunner:
             has_question = "```question" in assistant_text
 
             if has_confirm:
-                match = re.search(r"```confirm\s*([\s\S]+?)\s*```", assistant_text)
+                match = _RE_CONFIRM_BLOCK.search(assistant_text)
                 if match:
                     try:
                         params = json.loads(match.group(1))
@@ -184,7 +187,7 @@ class SimulationRunner:
 
             question_data = None
             if has_question:
-                match = re.search(r"```question\s*([\s\S]+?)\s*```", assistant_text)
+                match = _RE_QUESTION_BLOCK.search(assistant_text)
                 if match:
                     try:
                         question_data = json.loads(match.group(1))
@@ -196,7 +199,7 @@ class SimulationRunner:
                 display_text = assistant_text
             else:
                 # Strip code blocks from any surrounding prose
-                display_text = re.sub(r"```(?:question|confirm)[\s\S]*?```", "", assistant_text).strip()
+                display_text = _RE_STRUCTURED_BLOCKS.sub("", assistant_text).strip()
 
             # Emit question to UI
             self._emit({
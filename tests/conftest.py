@@ -24,6 +24,13 @@ def sample_dicts_dir() -> Path:
     return FIXTURES_DIR / "sample_dicts"
 
 
+def _stream(response: MagicMock) -> MagicMock:
+    """A ``messages.stream`` context manager with no events whose final message is *response*."""
+    stream = MagicMock()
+    stream.__enter__.return_value.get_final_message.return_value = response
+    return stream
+
+
 @pytest.fixture
 def mock_anthropic_client():
     """Mock Anthropic client that returns a canned response with no tool calls."""
@@ -36,7 +43,8 @@ def mock_anthropic_client():
     text_block.text = "Simulation complete."
     # No tool calls
     response.content = [text_block]
-    client.messages.create.return_value = response
+    stream = client.messages.stream.return_value.__enter__.return_value
+    stream.get_final_message.return_value = response
     return client
 
 
@@ -65,5 +73,5 @@ def mock_anthropic_client_with_tool_call():
     text_block.text = "File read successfully."
     final_response.content = [text_block]
 
-    client.messages.create.side_effect = [tool_response, final_response]
+    client.messages.stream.side_effect = [_stream(tool_response), _stream(final_response)]
     return client
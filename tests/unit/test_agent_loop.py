@@ -3,9 +3,11 @@
 from unittest.mock import MagicMock
 
 import pytest
+
 from foampilot.core.agent_loop import AgentLoop
 from foampilot.core.permissions import PermissionChecker, PermissionLevel
-from foampilot.tools.base import PermissionLevel as ToolPermissionLevel, Tool, ToolResult
+from foampilot.tools.base import PermissionLevel as ToolPermissionLevel
+from foampilot.tools.base import Tool, ToolResult
 
 
 class _EchoTool(Tool):
@@ -24,6 +26,30 @@ class _EchoTool(Tool):
         return ToolResult(success=True, data={"echoed": message})
 
 
+def test_tool_schema_is_built_once_per_class():
+    schema = _EchoTool().to_anthropic_tool()
+    assert schema is _EchoTool().to_anthropic_tool()
+    assert schema == {
+        "name": "echo",
+        "description": "Echo back the input",
+        "input_schema": _EchoTool.input_schema,
+    }
+
+    loop = AgentLoop(client=MagicMock(), system_prompt="test", tools={"echo": _EchoTool()})
+    assert loop._anthropic_tools()[-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in schema
+
+
+def _stream_responses(client: MagicMock, *responses: MagicMock) -> None:
+    """Make ``client.messages.stream`` return *responses* in order, with no stream events."""
+    streams = []
+    for response in responses:
+        stream = MagicMock()
+        stream.__enter__.return_value.get_final_message.return_value = response
+        streams.append(stream)
+    client.messages.stream.side_effect = streams
+
+
 def _make_client_no_tools(text: str = "Done.") -> MagicMock:
     client = MagicMock()
     response = MagicMock()
@@ -33,7 +59,7 @@ def _make_client_no_tools(text: str = "Done.") -> MagicMock:
     tb = MagicMock()
     tb.text = text
     response.content = [tb]
-    client.messages.create.return_value = response
+    _stream_responses(client, response)
     return client
 
 
@@ -85,7 +111,7 @@ def test_agent_loop_permission_auto_approve():
     tb.text = "Echo done."
     final_response.content = [tb]
 
-    client.messages.create.side_effect = [tool_response, final_response]
+    _stream_responses(client, tool_response, final_response)
 
     approval_cb = MagicMock(return_value=True)
     loop = AgentLoop(
@@ -100,6 +126,15 @@ def test_agent_loop_permission_auto_approve():
     assert result.stopped_reason == "end_turn"
 
 
+def test_tool_result_json_is_compact():
+    from anthropic.types import ToolUseBlock
+
+    loop = AgentLoop(client=MagicMock(), system_prompt="test", tools={"echo": _EchoTool()})
+    tool_use = ToolUseBlock(type="tool_use", id="t1", name="echo", input={"message": "20°C"})
+    block = loop._tool_result(tool_use, _EchoTool().execute(message="20°C, 1 atm"))
+    assert block["content"] == '{"echoed":"20°C, 1 atm"}'
+
+
 def test_agent_loop_unknown_tool_returns_error():
     from anthropic.types import ToolUseBlock
 
@@ -123,9 +158,297 @@ def test_agent_loop_unknown_tool_returns_error():
     tb.text = "Tool not found error handled."
     final_response.content = [tb]
 
-    client.messages.create.side_effect = [tool_response, final_response]
+    _stream_responses(client, tool_response, final_response)
 
     loop = AgentLoop(system_prompt="Test", tools={}, client=client)
     result = loop.run("call unknown tool")
     # Should not crash — error is fed back to LLM
     assert result.stopped_reason == "end_turn"
+
+
+def test_agent_loop_submit_result_ends_the_run():
+    from anthropic.types import ToolUseBlock
+
+    from foampilot.tools.general.submit_result import SubmitResultTool
+
+    client = MagicMock()
+    submit = ToolUseBlock(
+        type="tool_use", id="t1", name="submit_result", input={"converged": True},
+    )
+    response = MagicMock()
+    response.stop_reason = "tool_use"
+    response.usage.input_tokens = 200
+    response.usage.output_tokens = 20
+    response.content = [submit]
+    _stream_responses(client, response)
+
+    schema = {"type": "object", "properties": {"converged": {"type": "boolean"}}}
+    tool = SubmitResultTool(schema, "the result")
+    loop = AgentLoop(system_prompt="Test", tools={"submit_result": tool}, client=client)
+    result = loop.run("finish")
+
+    assert result.result == {"converged": True}
+    assert result.stopped_reason == "end_turn"
+    assert client.messages.stream.call_count == 1
+    assert tool.to_anthropic_tool()["input_schema"] is schema
+
+
+def _submit_turn(*blocks) -> MagicMock:
+    response = MagicMock()
+    response.stop_reason = "tool_use"
+    response.usage.input_tokens = 200
+    response.usage.output_tokens = 20
+    response.content = list(blocks)
+    return response
+
+
+def test_agent_loop_runs_other_calls_before_accepting_a_submit():
+    from anthropic.types import ToolUseBlock
+
+    from foampilot.tools.general.submit_result import SubmitResultTool
+
+    def submit(tool_id: str) -> ToolUseBlock:
+        return ToolUseBlock(
+            type="tool_use", id=tool_id, name="submit_result", input={"converged": True},
+        )
+
+    echo = ToolUseBlock(type="tool_use", id="t1", name="echo", input={"message": "hi"})
+    client = MagicMock()
+    _stream_responses(client, _submit_turn(echo, submit("t2")), _submit_turn(submit("t3")))
+
+    schema = {"type": "object", "properties": {"converged": {"type": "boolean"}}}
+    tools = {"echo": _EchoTool(), "submit_result": SubmitResultTool(schema)}
+    loop = AgentLoop(system_prompt="Test", tools=tools, client=client)
+    result = loop.run("finish")
+
+    tool_results = client.messages.stream.call_args.kwargs["messages"][2]["content"]
+    assert tool_results[0] == {
+        "type": "tool_result", "tool_use_id": "t1",
+        "content": '{"echoed":"hi"}', "is_error": False,
+    }
+    assert tool_results[1]["tool_use_id"] == "t2"
+    assert tool_results[1]["is_error"]
+    assert result.result == {"converged": True}
+    assert client.messages.stream.call_count == 2
+
+
+def test_agent_loop_rejects_a_submit_missing_required_fields():
+    from anthropic.types import ToolUseBlock
+
+    from foampilot.tools.general.submit_result import SubmitResultTool
+
+    incomplete = ToolUseBlock(
+        type="tool_use", id="t1", name="submit_result", input={"converged": True},
+    )
+    complete = ToolUseBlock(
+        type="tool_use", id="t2", name="submit_result",
+        input={"converged": True, "issues": []},
+    )
+    client = MagicMock()
+    _stream_responses(client, _submit_turn(incomplete), _submit_turn(complete))
+
+    schema = {
+        "type": "object",
+        "properties": {"converged": {"type": "boolean"}, "issues": {"type": "array"}},
+        "required": ["converged", "issues"],
+    }
+    loop = AgentLoop(
+        system_prompt="Test", tools={"submit_result": SubmitResultTool(schema)}, client=client,
+    )
+    result = loop.run("finish")
+
+    (rejection,) = client.messages.stream.call_args.kwargs["messages"][2]["content"]
+    assert rejection["is_error"]
+    assert "issues" in rejection["content"]
+    assert result.result == {"converged": True, "issues": []}
+
+class _BarrierTool(Tool):
+    """Parallel-safe tool that only returns once two calls are in flight."""
+
+    name = "barrier"
+    description = "Wait for a concurrent call"
+    input_schema = {"type": "object", "properties": {"tag": {"type": "string"}}}
+    permission_level = PermissionLevel.AUTO
+    is_parallel_safe = True
+
+    def __init__(self) -> None:
+        import threading
+        self._barrier = threading.Barrier(2, timeout=5)
+
+    def execute(self, tag: str, **kwargs) -> ToolResult:
+        self._barrier.wait()
+        return ToolResult.ok(data=tag)
+
+
+def test_agent_loop_runs_parallel_safe_tools_concurrently():
+    from anthropic.types import ToolUseBlock
+
+    tool_uses = []
+    for i, (name, tag) in enumerate([("barrier", "a"), ("barrier", "b"), ("echo", "c")]):
+        tu = MagicMock(spec=ToolUseBlock)
+        tu.name = name
+        tu.id = f"t{i}"
+        tu.input = {"tag": tag} if name == "barrier" else {"message": tag}
+        tool_uses.append(tu)
+
+    tool_response = MagicMock()
+    tool_response.stop_reason = "tool_use"
+    tool_response.usage.input_tokens = 200
+    tool_response.usage.output_tokens = 80
+    tool_response.content = tool_uses
+
+    final_response = MagicMock()
+    final_response.stop_reason = "end_turn"
+    final_response.usage.input_tokens = 250
+    final_response.usage.output_tokens = 60
+    tb = MagicMock()
+    tb.text = "Done."
+    final_response.content = [tb]
+
+    client = MagicMock()
+    _stream_responses(client, tool_response, final_response)
+
+    loop = AgentLoop(
+        system_prompt="Test",
+        tools={"barrier": _BarrierTool(), "echo": _EchoTool()},
+        client=client,
+    )
+    result = loop.run("run tools")
+    assert result.stopped_reason == "end_turn"
+
+    # Results come back in call order even though the barrier calls ran together
+    tool_results = client.messages.stream.call_args.kwargs["messages"][2]["content"]
+    assert [r["tool_use_id"] for r in tool_results] == ["t0", "t1", "t2"]
+    assert [r["content"] for r in tool_results[:2]] == ["a", "b"]
+    assert not any(r["is_error"] for r in tool_results)
+
+
+def test_agent_loop_streams_tokens_and_starts_tools_early():
+    import threading
+    from types import SimpleNamespace
+
+    from anthropic.types import ToolUseBlock
+
+    started = threading.Event()
+    calls: list[str] = []
+
+    class _ReadTool(_EchoTool):
+        name = "read"
+        is_parallel_safe = True
+
+        def execute(self, message: str, **kwargs) -> ToolResult:
+            calls.append(message)
+            started.set()
+            return super().execute(message)
+
+    tool_use = MagicMock(spec=ToolUseBlock)
+    tool_use.type = "tool_use"
+    tool_use.name = "read"
+    tool_use.id = "t1"
+    tool_use.input = {"message": "hi"}
+
+    tool_response = MagicMock()
+    tool_response.stop_reason = "tool_use"
+    tool_response.usage.input_tokens = 200
+    tool_response.usage.output_tokens = 80
+    tool_response.content = [tool_use]
+
+    final_response = MagicMock()
+    final_response.stop_reason = "end_turn"
+    final_response.usage.input_tokens = 250
+    final_response.usage.output_tokens = 60
+    tb = MagicMock()
+    tb.text = "Done."
+    final_response.content = [tb]
+
+    def _final_message():
+        # The tool must already be running before the response has finished streaming
+        assert started.wait(timeout=5)
+        return tool_response
+
+    stream = MagicMock()
+    ctx = stream.__enter__.return_value
+    ctx.__iter__.return_value = iter([
+        SimpleNamespace(type="text", text="Reading"),
+        SimpleNamespace(type="content_block_stop", content_block=tool_use),
+    ])
+    ctx.get_final_message.side_effect = _final_message
+    final_stream = MagicMock()
+    final_stream.__enter__.return_value.get_final_message.return_value = final_response
+
+    client = MagicMock()
+    client.messages.stream.side_effect = [stream, final_stream]
+
+    events: list[dict] = []
+    loop = AgentLoop(
+        system_prompt="Test",
+        tools={"read": _ReadTool()},
+        client=client,
+        event_callback=events.append,
+    )
+    result = loop.run("read something")
+
+    assert result.stopped_reason == "end_turn"
+    assert {"type": "llm_token", "data": {"turn": 1, "text": "Reading"}} in events
+    tool_results = client.messages.stream.call_args.kwargs["messages"][2]["content"]
+    assert tool_results[0]["content"] == '{"echoed":"hi"}'
+    # The early-started call is not executed a second time
+    assert calls == ["hi"]
+
+
+def test_agent_loop_shuts_its_pool_down_when_a_tool_raises():
+    from anthropic.types import ToolUseBlock
+
+    class _BrokenTool(_EchoTool):
+        name = "broken"
+
+        def execute(self, message: str, **kwargs) -> ToolResult:
+            raise RuntimeError("tool crashed")
+
+    tool_response = MagicMock()
+    tool_response.stop_reason = "tool_use"
+    tool_response.usage.input_tokens = 200
+    tool_response.usage.output_tokens = 80
+    tool_response.content = [
+        ToolUseBlock(type="tool_use", id="t1", name="broken", input={"message": "x"}),
+    ]
+    client = MagicMock()
+    _stream_responses(client, tool_response)
+
+    loop = AgentLoop(system_prompt="Test", tools={"broken": _BrokenTool()}, client=client)
+    with pytest.raises(RuntimeError, match="tool crashed"):
+        loop.run("break")
+
+    assert loop._pool._shutdown
+
+def test_stale_tool_results_keep_recent_turns():
+    from foampilot.core.agent_loop import _StaleToolResults
+
+    def tool_turn(i: int) -> dict:
+        return {"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": f"t{i}", "content": "x" * 1000},
+        ]}
+
+    messages = [{"role": "user", "content": "task"}]
+    for i in range(4):
+        messages += [{"role": "assistant", "content": []}, tool_turn(i)]
+    original = messages[2]
+    stale = _StaleToolResults(keep_last_k=2)
+
+    saved = stale.truncate(messages)
+
+    assert messages[2]["content"][0]["content"].startswith("[truncated")
+    assert messages[4]["content"][0]["content"].startswith("[truncated")
+    assert messages[6]["content"][0]["content"] == "x" * 1000
+    assert messages[8]["content"][0]["content"] == "x" * 1000
+    assert messages[2]["content"][0]["tool_use_id"] == "t0"
+    # The original message objects are not mutated
+    assert original["content"][0]["content"] == "x" * 1000
+    assert saved > 1500
+
+    # Nothing new is stale until more tool turns arrive
+    assert stale.truncate(messages) == 0
+    messages += [{"role": "assistant", "content": []}, tool_turn(4)]
+    assert stale.truncate(messages) > 0
+    assert messages[6]["content"][0]["content"].startswith("[truncated")
+    assert messages[10]["content"][0]["content"] == "x" * 1000
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""Unit tests for the phase-agents-as-tools adapters."""
+
+import threading
+
+import pytest
+
+from foampilot.agents import setup_agent
+from foampilot.tools.agent_tools import (
+    CaseRegistry,
+    SetupAgentTool,
+    _AgentTool,
+    build_agent_tools,
+)
+
+
+class _FakeSetupAgent:
+    """Blocks until every concurrent call has started, then echoes its case."""
+
+    barrier: threading.Barrier | None = None
+
+    def __init__(self, event_callback=None, approval_callback=None) -> None:
+        self._event_cb = event_callback
+
+    def run(self, simulation_spec, case_dir):
+        if self.barrier is not None:
+            self.barrier.wait()
+        if self._event_cb:
+            self._event_cb({"type": "phase_start", "data": {}})
+        return {"tutorial_source": simulation_spec["solver"], "files_modified": []}
+
+
+@pytest.fixture
+def fake_setup(monkeypatch):
+    _FakeSetupAgent.barrier = None
+    monkeypatch.setattr(setup_agent, "SetupAgent", _FakeSetupAgent)
+    return _FakeSetupAgent
+
+
+def test_build_agent_tools_names(tmp_path):
+    tools = build_agent_tools(CaseRegistry(tmp_path))
+    assert set(tools) == {"agent__consult", "agent__setup", "agent__mesh", "agent__run"}
+    assert all(tool.is_parallel_safe for tool in tools.values())
+
+
+def test_calls_for_different_cases_run_concurrently(fake_setup, tmp_path):
+    fake_setup.barrier = threading.Barrier(2, timeout=5)
+    events: list[dict] = []
+    tool = SetupAgentTool(CaseRegistry(tmp_path), event_callback=events.append)
+    results: dict[str, object] = {}
+
+    def call(name):
+        results[name] = tool.execute(case_name=name, simulation_spec={"solver": "simpleFoam"})
+
+    threads = [threading.Thread(target=call, args=(name,)) for name in ("coarse", "fine")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(r.success for r in results.values())
+    assert results["fine"].data["case_dir"] == str(tmp_path / "fine")
+    assert sorted(e["case"] for e in events) == ["coarse", "fine"]
+
+
+def test_busy_case_is_refused(fake_setup, tmp_path):
+    cases = CaseRegistry(tmp_path)
+    cases.acquire("coarse")
+    result = SetupAgentTool(cases).execute(case_name="coarse", simulation_spec={"solver": "x"})
+    assert not result.success
+    assert "already being worked on" in result.error
+
+    cases.release("coarse")
+    result = SetupAgentTool(cases).execute(case_name="coarse", simulation_spec={"solver": "x"})
+    assert result.success
+
+
+def test_invalid_case_name_is_refused(fake_setup, tmp_path):
+    result = SetupAgentTool(CaseRegistry(tmp_path)).execute(
+        case_name="../escape", simulation_spec={"solver": "x"},
+    )
+    assert not result.success
+    assert "Invalid case_name" in result.error
+
+
+def test_agent_tool_without_run_agent_cannot_be_created(tmp_path):
+    class _Incomplete(_AgentTool):
+        name = "agent__incomplete"
+
+    with pytest.raises(TypeError):
+        _Incomplete(CaseRegistry(tmp_path))
@@ -0,0 +1,65 @@
+"""Unit tests for concurrent multi-case orchestration."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from foampilot.core import batch_orchestrator
+from foampilot.core.batch_orchestrator import run_batch
+from foampilot.core.state import SimulationPhase
+
+
+class _FakeOrchestrator:
+    """Records construction and blocks in run() until every session has started."""
+
+    instances: list["_FakeOrchestrator"] = []
+    barrier: threading.Barrier
+
+    def __init__(self, cases_dir=None, event_callback=None, approval_callback=None,
+                 docker_client=None) -> None:
+        self.event_callback = event_callback
+        self.docker_client = docker_client or f"docker-{len(self.instances)}"
+        self.instances.append(self)
+
+    def run(self, user_request, confirmed_params=None):
+        self.barrier.wait()
+        self.event_callback({"type": "session_start", "data": {}})
+        return SimpleNamespace(
+            phase=SimulationPhase.COMPLETE, request=user_request, params=confirmed_params,
+        )
+
+
+@pytest.fixture
+def fake_orchestrator(monkeypatch):
+    _FakeOrchestrator.instances = []
+    monkeypatch.setattr(batch_orchestrator, "Orchestrator", _FakeOrchestrator)
+    return _FakeOrchestrator
+
+
+def test_run_batch_runs_sessions_concurrently_in_order(fake_orchestrator):
+    fake_orchestrator.barrier = threading.Barrier(3, timeout=5)
+    events: list[dict] = []
+
+    states = run_batch(
+        ["case a", "case b", "case c"],
+        confirmed_params=[None, {"Re": 100}, None],
+        event_callback=events.append,
+        max_workers=3,
+    )
+
+    assert [(s.request, s.params) for s in states] == [
+        ("case a", None), ("case b", {"Re": 100}), ("case c", None),
+    ]
+    assert sorted(e["batch_index"] for e in events) == [0, 1, 2]
+    # Only the first session connects to Docker; the others reuse its client
+    assert {o.docker_client for o in fake_orchestrator.instances} == {"docker-0"}
+
+
+def test_run_batch_rejects_mismatched_params(fake_orchestrator):
+    with pytest.raises(ValueError):
+        run_batch(["a", "b"], confirmed_params=[None])
+
+
+def test_run_batch_empty():
+    assert run_batch([]) == []
@@ -0,0 +1,23 @@
+"""Unit tests for the benchmark markdown report."""
+
+import json
+
+from benchmarks.report import generate_markdown_report
+
+
+def test_report_rows_are_ordered_by_case_name_then_run(tmp_path):
+    runs = [("a", "c0ffee00"), ("a_b", "12345678"), ("a", "00aa11bb")]
+    for case, run_id in runs:
+        (tmp_path / f"{case}_{run_id}.json").write_text(json.dumps(
+            {"case": case, "run_id": run_id, "score": 50.0, "tool_calls": 3, "elapsed_s": 1.0},
+        ))
+
+    report = generate_markdown_report(tmp_path)
+
+    rows = [line.split("|")[1].strip() for line in report.splitlines()[6:9]]
+    assert rows == ["a", "a", "a_b"]
+    assert "Total runs: 3" in report
+
+
+def test_report_without_results(tmp_path):
+    assert generate_markdown_report(tmp_path) == "No benchmark results found."
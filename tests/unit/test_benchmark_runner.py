@@ -0,0 +1,90 @@
+"""Unit tests for the benchmark runner: case lookup and token accounting."""
+
+import multiprocessing
+
+import pytest
+import yaml
+
+from benchmarks import runner
+from benchmarks.runner import BenchmarkRunner, _peek_case_name
+
+
+class _FakeOrchestrator:
+    """Emits one tool call and one phase token summary instead of running a case."""
+
+    def __init__(self, cases_dir, event_callback) -> None:
+        self._event_cb = event_callback
+
+    def run(self, prompt: str):
+        self._event_cb({"type": "tool_call", "data": {"tool": "read_foam_file", "input": {}}})
+        self._event_cb({"type": "phase_token_summary", "data": {
+            "phase": "consult", "total_input_tokens": 1200,
+            "total_output_tokens": 300, "total_cost_usd": 0.0081,
+        }})
+        return None
+
+
+@pytest.fixture
+def bench(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "Orchestrator", _FakeOrchestrator)
+    monkeypatch.setattr(runner.config, "CASES_DIR", tmp_path / "cases")
+    tier = tmp_path / "bench" / "tier1"
+    tier.mkdir(parents=True)
+    for name in ("cavity", "pitzDaily"):
+        (tier / f"{name}.yaml").write_text(yaml.safe_dump({"name": name, "prompt": "run it"}))
+    return tmp_path
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_quiet_and_parallel_runs_report_tokens(bench, parallel):
+    if parallel and multiprocessing.get_start_method() != "fork":
+        pytest.skip("the patched orchestrator only reaches forked workers")
+    bench_runner = BenchmarkRunner(
+        cases_dir=bench / "bench", results_dir=bench / "results", quiet=True, parallel=parallel,
+    )
+
+    results = bench_runner.run_suite("tier1", max_workers=2)
+
+    assert [r["case"] for r in results] == ["cavity", "pitzDaily"]
+    for result in results:
+        assert result["tool_calls"] == 1
+        assert result["tokens"] == {
+            "total_input_tokens": 1200, "total_output_tokens": 300, "total_cost_usd": 0.0081,
+        }
+
+
+@pytest.mark.parametrize(("text", "expected"), [
+    ("name: cavity\nprompt: run it\n", "cavity"),
+    ('name: "pitz-daily"\n', "pitz-daily"),
+    ("name: 'bend_3d'  # pipe bend\n", "bend_3d"),
+    ("# header comment\nname: cavity # trailing\n", "cavity"),
+    ("prompt: run it\n", None),
+    ("name: 123\n", None),       # YAML reads an int; left to the full parse
+    ("name: true\n", None),
+    ('name: "123"\n', "123"),
+    ("name: first\nname: second\n", None),  # YAML keeps the last duplicate
+    ("name: [a, b]\n", None),
+])
+def test_peek_case_name(tmp_path, text, expected):
+    spec = tmp_path / "case.yaml"
+    spec.write_text(text)
+
+    assert _peek_case_name(spec) == expected
+    if expected is not None:
+        assert yaml.safe_load(text)["name"] == expected
+
+
+def test_find_case_indexes_nested_specs_and_picks_up_new_files(tmp_path):
+    cases = tmp_path / "cases"
+    (cases / "tier1").mkdir(parents=True)
+    (cases / "tier1" / "cavity.yaml").write_text("name: cavity\nprompt: run it\n")
+    (cases / "tier1" / "notes.txt").write_text("name: not_a_case\n")
+    bench_runner = BenchmarkRunner(cases_dir=cases, results_dir=tmp_path / "results")
+
+    assert bench_runner._find_case("cavity") == {"name": "cavity", "prompt": "run it"}
+    assert bench_runner._find_case("not_a_case") is None
+
+    # A spec added after the index was built is found by rebuilding on the miss
+    (cases / "tier2").mkdir()
+    (cases / "tier2" / "bend.yaml").write_text("prompt: bend\nname: pipe_bend\n")
+    assert bench_runner._find_case("pipe_bend") == {"prompt": "bend", "name": "pipe_bend"}
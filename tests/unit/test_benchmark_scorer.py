@@ -0,0 +1,28 @@
+"""Unit tests for benchmark scoring helpers."""
+
+import pytest
+
+from benchmarks.scorer import _count_present
+
+
+@pytest.fixture
+def case_dir(tmp_path):
+    for rel in ("0/U", "0/p", "constant/transportProperties", "system/controlDict"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (tmp_path / "constant" / "polyMesh").mkdir()
+    return tmp_path
+
+
+@pytest.mark.parametrize("files", [
+    # Short lists take the one-stat-per-file path
+    ["0/U", "0/k", "system/controlDict"],
+    # Longer lists read each parent directory once
+    ["0/U", "0/p", "0/k", "constant/transportProperties", "constant/polyMesh",
+     "system/controlDict", "system/fvSchemes", "missing/dir/file", "Allrun"],
+])
+def test_count_present_matches_a_stat_per_file(case_dir, files):
+    expected = sum(1 for f in files if (case_dir / f).exists())
+
+    assert _count_present(case_dir, files) == expected
@@ -50,3 +50,42 @@ def test_compact_handles_tool_use_blocks():
     client = _make_client("summary")
     result = compact_conversation(messages, client=client)
     assert len(result) == 1
+
+
+def test_compact_routes_small_transcripts_to_default_model(monkeypatch):
+    from foampilot import config
+
+    monkeypatch.setattr(config, "COMPACTION_MODEL_THRESHOLD", 1000)
+    client = _make_client("summary")
+
+    compact_conversation([{"role": "user", "content": "short"}], client=client)
+    kwargs = client.messages.create.call_args.kwargs
+    assert kwargs["model"] == config.MODEL
+    assert kwargs["max_tokens"] == 1024
+
+    compact_conversation([{"role": "user", "content": "x" * 40_000}], client=client)
+    kwargs = client.messages.create.call_args.kwargs
+    assert kwargs["model"] == config.MODEL_COMPLEX
+    assert kwargs["max_tokens"] == 2500
+
+
+def test_compact_incremental_sends_previous_summary_and_new_messages_only():
+    client = _make_client("merged summary")
+    messages = [{"role": "assistant", "content": "Mesh generated."}]
+    result = compact_conversation(messages, client=client, previous_summary="Case set up.")
+
+    assert "merged summary" in result[0]["content"]
+    content = client.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert "Case set up." in content[0]["text"]
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    assert "Mesh generated." in content[1]["text"]
+
+
+def test_compact_includes_sdk_content_blocks():
+    from anthropic.types import TextBlock
+
+    client = _make_client("summary")
+    messages = [{"role": "assistant", "content": [TextBlock(type="text", text="Running solver")]}]
+    compact_conversation(messages, client=client)
+    prompt = client.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert "Running solver" in prompt
@@ -0,0 +1,137 @@
+"""Unit tests for DockerClient output handling (no Docker daemon needed)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from foampilot.docker.client import DockerClient
+
+
+def _client(chunks: list[bytes]) -> DockerClient:
+    sdk = MagicMock()
+    sdk.containers.get.return_value.exec_run.return_value = (None, iter(chunks))
+    return DockerClient(docker_sdk=sdk)
+
+
+def test_stream_command_joins_lines_split_across_chunks():
+    client = _client([b"Time = 1\nUx: Sol", b"ving for Ux\n\nEnd"])
+    lines = list(client.stream_command("simpleFoam"))
+    assert lines == ["Time = 1", "Ux: Solving for Ux", "", "End"]
+
+
+def test_stream_command_keeps_multibyte_characters_split_across_chunks():
+    text = "T = 20°C\r\n".encode()
+    cut = text.index(b"\xb0")  # between the two bytes of "°"
+    lines = list(_client([text[:cut], text[cut:]]).stream_command("echo"))
+    assert lines == ["T = 20°C"]
+
+
+def test_container_is_looked_up_once_per_client():
+    sdk = MagicMock()
+    exec_result = MagicMock(output=(b"", None), exit_code=0)
+    sdk.containers.get.return_value.exec_run.return_value = exec_result
+    client = DockerClient(docker_sdk=sdk)
+
+    client.exec_command("true")
+    client.exec_command("true")
+
+    sdk.containers.get.assert_called_once()
+
+
+def test_not_found_drops_the_cached_container():
+    from docker.errors import NotFound
+
+    sdk = MagicMock()
+    sdk.containers.get.return_value.exec_run.side_effect = NotFound("gone")
+    client = DockerClient(docker_sdk=sdk)
+
+    for _ in range(2):
+        with pytest.raises(NotFound):
+            client.exec_command("true")
+
+    assert sdk.containers.get.call_count == 2
+
+
+def test_connect_docker_reuses_the_socket_found_by_the_fallback(monkeypatch, tmp_path):
+    import docker
+
+    from foampilot.docker import client as client_mod
+
+    sock = tmp_path / "docker.sock"
+    sock.touch()
+    from_env = MagicMock(side_effect=docker.errors.DockerException("no DOCKER_HOST"))
+    sdk_cls = MagicMock()
+    monkeypatch.setattr(docker, "from_env", from_env)
+    monkeypatch.setattr(docker, "DockerClient", sdk_cls)
+    monkeypatch.setattr(client_mod, "_DOCKER_SOCKET_CANDIDATES", [str(sock)])
+    monkeypatch.setattr(client_mod, "_resolved_socket", None)
+
+    client_mod._connect_docker()
+    client_mod._connect_docker()
+
+    from_env.assert_called_once()
+    assert sdk_cls.call_args_list[-1].kwargs == {"base_url": f"unix://{sock}"}
+    assert sdk_cls.call_count == 2
+
+
+def test_clients_without_an_sdk_share_one_connection(monkeypatch):
+    from foampilot.docker import client as client_mod
+    from foampilot.docker.manager import ContainerManager
+
+    connect = MagicMock()
+    monkeypatch.setattr(client_mod, "_connect_docker", connect)
+    monkeypatch.setattr(client_mod, "_shared_sdk", None)
+
+    sdks = {DockerClient()._sdk, DockerClient()._sdk, ContainerManager()._sdk}
+
+    assert sdks == {connect.return_value}
+    connect.assert_called_once()
+
+
+def test_copy_from_container_streams_the_file_out_of_the_archive(tmp_path):
+    import io
+    import tarfile
+
+    payload = bytes(range(256)) * 1000
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        info = tarfile.TarInfo("residuals.csv")
+        info.size = len(payload)
+        tar.addfile(info, io.BytesIO(payload))
+    archive = buf.getvalue()
+    chunks = [archive[i:i + 5000] for i in range(0, len(archive), 5000)]
+
+    sdk = MagicMock()
+    sdk.containers.get.return_value.get_archive.return_value = (iter(chunks), {})
+    dest = tmp_path / "out" / "residuals.csv"
+    DockerClient(docker_sdk=sdk).copy_from_container("/data/residuals.csv", dest)
+
+    assert dest.read_bytes() == payload
+
+
+def test_copy_to_container_uploads_a_tar_of_the_file(tmp_path):
+    import io
+    import tarfile
+
+    src = tmp_path / "controlDict"
+    src.write_bytes(b"endTime 500;\n" * 10000)
+    sdk = MagicMock()
+    DockerClient(docker_sdk=sdk).copy_to_container(src, "/data/case/system/controlDict")
+
+    dest_dir, data = sdk.containers.get.return_value.put_archive.call_args.args
+    assert dest_dir == "/data/case/system"
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        assert tar.extractfile("controlDict").read() == src.read_bytes()
+
+
+def test_copy_many_to_container_uploads_every_file(tmp_path):
+    pairs = []
+    for name in ("U", "p", "k"):
+        (tmp_path / name).write_text(name)
+        pairs.append((tmp_path / name, f"/data/case/0/{name}"))
+    sdk = MagicMock()
+    DockerClient(docker_sdk=sdk).copy_many_to_container(pairs)
+
+    put_archive = sdk.containers.get.return_value.put_archive
+    assert put_archive.call_count == 3
+    assert {c.args[0] for c in put_archive.call_args_list} == {"/data/case/0"}
@@ -0,0 +1,32 @@
+"""Unit tests for embedding similarity helpers (no model needed)."""
+
+import numpy as np
+import pytest
+
+from foampilot.index.embeddings import top_k_similar
+
+
+def test_top_k_similar_returns_best_matches_in_order():
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(200, 16)).astype(np.float32)
+    query = rng.normal(size=16).astype(np.float32)
+
+    result = top_k_similar(query, matrix, k=5)
+
+    expected = np.argsort(matrix @ query)[::-1][:5]
+    assert [i for i, _ in result] == expected.tolist()
+    assert [s for _, s in result] == sorted((s for _, s in result), reverse=True)
+
+
+def test_top_k_similar_handles_lists_and_small_inputs():
+    embeddings = [[1.0, 0.0], [0.0, 1.0]]
+    assert top_k_similar([0.0, 1.0], embeddings, k=10) == [(1, 1.0), (0, 0.0)]
+    assert top_k_similar([1.0, 0.0], [], k=3) == []
+
+
+def test_cosine_similarity():
+    from foampilot.index.embeddings import cosine_similarity
+
+    assert cosine_similarity([3.0, 4.0], [6.0, 8.0]) == pytest.approx(1.0)
+    assert cosine_similarity([1.0, 0.0], [0.0, 2.0]) == 0.0
+    assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
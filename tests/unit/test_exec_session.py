@@ -0,0 +1,134 @@
+"""Unit tests for the persistent Docker exec session.
+
+A local bash stands in for the container: its stdout/stderr are multiplexed onto
+a socketpair with the same 8-byte frame headers the Docker exec socket uses.
+"""
+
+import shutil
+import socket
+import subprocess
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from foampilot.docker.session import ExecSession, ExecSessionError, ExecSessionInterrupted
+from foampilot.tools.foam.run_foam_cmd import RunFoamCmdTool
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="requires bash")
+
+
+class _FakeExec:
+    """A bash process attached to one end of a socketpair using Docker's stream framing."""
+
+    def __init__(self) -> None:
+        self.client, self._server = socket.socketpair()
+        self._proc = subprocess.Popen(
+            ["bash"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        self._lock = threading.Lock()
+        threading.Thread(target=self._pump_stdin, daemon=True).start()
+        threading.Thread(target=self._pump_output, args=(self._proc.stdout, 1), daemon=True).start()
+        threading.Thread(target=self._pump_output, args=(self._proc.stderr, 2), daemon=True).start()
+
+    def _pump_stdin(self) -> None:
+        while data := self._server.recv(4096):
+            self._proc.stdin.write(data)
+            self._proc.stdin.flush()
+        self._proc.stdin.close()
+
+    def _pump_output(self, pipe, stream: int) -> None:
+        while chunk := pipe.read1(4096):
+            with self._lock:
+                header = bytes([stream, 0, 0, 0]) + len(chunk).to_bytes(4, "big")
+                self._server.sendall(header + chunk)
+
+    def sdk(self) -> MagicMock:
+        sdk = MagicMock()
+        sdk.api.exec_create.return_value = {"Id": "exec1"}
+        sdk.api.exec_start.return_value = self.client
+        return sdk
+
+    def close(self) -> None:
+        self._proc.kill()
+        self._proc.wait()
+        self._server.close()
+
+
+@pytest.fixture
+def fake_exec():
+    fake = _FakeExec()
+    yield fake
+    fake.close()
+
+
+def test_run_returns_output_and_exit_code(fake_exec):
+    with ExecSession(fake_exec.sdk()) as session:
+        result = session.run("echo out; echo err >&2; exit 3")
+    assert result == {"stdout": "out\n", "stderr": "err\n", "exit_code": 3}
+
+
+def test_commands_share_the_session_but_not_cwd(fake_exec, tmp_path):
+    with ExecSession(fake_exec.sdk()) as session:
+        first = session.run("pwd", workdir=str(tmp_path))
+        second = session.run("pwd")
+    assert first["stdout"].strip() == str(tmp_path)
+    assert second["stdout"].strip() != str(tmp_path)
+    assert second["exit_code"] == 0
+
+
+def test_env_script_is_sourced_once(fake_exec, tmp_path):
+    script = tmp_path / "env.sh"
+    script.write_text("export FOAM_TEST=1\necho noise\n")
+    with ExecSession(fake_exec.sdk(), env_script=str(script)) as session:
+        result = session.run("echo $FOAM_TEST")
+    assert result["stdout"] == "1\n"
+
+
+def test_output_without_trailing_newline_and_large_output(fake_exec):
+    with ExecSession(fake_exec.sdk()) as session:
+        partial = session.run("printf abc")
+        big = session.run("head -c 300000 /dev/zero | tr '\\0' x")
+    assert partial["stdout"] == "abc"
+    assert len(big["stdout"]) == 300000
+
+
+def test_timeout_closes_session(fake_exec):
+    session = ExecSession(fake_exec.sdk())
+    with pytest.raises(ExecSessionInterrupted):
+        session.run("sleep 5", timeout=0.2)
+    assert session.closed
+    with pytest.raises(ExecSessionError) as exc_info:
+        session.run("echo again")
+    assert not isinstance(exc_info.value, ExecSessionInterrupted)
+
+
+def test_tool_does_not_rerun_a_command_the_session_lost(fake_exec, monkeypatch):
+    from foampilot.docker import client as client_module
+
+    exec_command = MagicMock()
+    monkeypatch.setattr(client_module.DockerClient, "exec_command", exec_command)
+    session = ExecSession(fake_exec.sdk())
+    tool = RunFoamCmdTool(docker_client=MagicMock(), exec_session=session)
+
+    result = tool._run_in_docker("sleep 5", "/tmp", 0.2, "log.sleep", profile=None)
+
+    assert not result.success
+    assert "may still be running" in result.error
+    assert session.closed
+    exec_command.assert_not_called()
+
+
+def test_tool_falls_back_when_the_session_closed_before_sending(fake_exec, monkeypatch):
+    from foampilot.docker import client as client_module
+
+    exec_command = MagicMock(return_value={"stdout": "ok\n", "stderr": "", "exit_code": 0})
+    monkeypatch.setattr(client_module.DockerClient, "exec_command", exec_command)
+    session = ExecSession(fake_exec.sdk())
+    session.close()
+    tool = RunFoamCmdTool(docker_client=MagicMock(), exec_session=session)
+
+    result = tool._run_in_docker("blockMesh", "/tmp", 60, None, MagicMock(VERSION="11"))
+
+    assert result.success
+    exec_command.assert_called_once()
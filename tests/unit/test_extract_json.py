@@ -0,0 +1,55 @@
+"""Unit tests for JSON extraction from agent responses."""
+
+import pytest
+
+from foampilot.agents import base_agent
+from foampilot.agents.base_agent import extract_json, pretty_json
+
+
+def test_prefers_fenced_block():
+    text = 'Here {not json}\n```json\n{"solver": "simpleFoam"}\n```'
+    assert extract_json(text) == {"solver": "simpleFoam"}
+
+
+def test_raw_object_with_surrounding_prose():
+    text = 'Summary: {"passed": true, "cells": 400} — see {log} for details.'
+    assert extract_json(text) == {"passed": True, "cells": 400}
+
+
+def test_skips_unparseable_braces_before_object():
+    text = 'Edited {U} and {p}.\n{"converged": false, "issues": []}'
+    assert extract_json(text) == {"converged": False, "issues": []}
+
+
+def test_braces_inside_strings_are_ignored():
+    text = '{"note": "uses } and { in text", "nested": {"a": 1}}'
+    assert extract_json(text) == {"note": "uses } and { in text", "nested": {"a": 1}}
+
+
+def test_escaped_quote_inside_string():
+    text = '{"msg": "say \\"}\\" twice"} trailing'
+    assert extract_json(text) == {"msg": 'say "}" twice'}
+
+
+def test_unfenced_mode_ignores_fence_language():
+    text = '```json\n[1, 2]\n```\n{"ok": 1}'
+    assert extract_json(text, fenced=False) == {"ok": 1}
+
+
+def test_returns_none_when_nothing_parses():
+    assert extract_json("no json here {at all") is None
+    assert extract_json("{" * 10_000) is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_pretty_json_round_trips_through_extract_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(base_agent, "orjson", None)
+    elif base_agent.orjson is None:
+        pytest.skip("orjson not installed")
+    spec = {"solver": "simpleFoam", "T": "20°C", "inlet": {"U": [1, 0, 0]}}
+
+    text = pretty_json(spec)
+
+    assert '  "T": "20°C"' in text
+    assert extract_json(f"```json\n{text}\n```") == spec
@@ -206,3 +206,15 @@ def test_quoted_regex_key():
     # The key "(U|k|epsilon)" should be parsed without the outer quotes
     solvers = foam.data["solvers"]
     assert "(U|k|epsilon)" in solvers
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("42", 42), ("-7", -7), ("+3", 3), ("1.5", 1.5), ("-.5", -0.5), ("2.", 2.0),
+    ("1e-05", 1e-05), ("3E2", 300.0),
+    ("true", True), ("On", True), ("no", False), ("FALSE", False),
+    ('"quoted"', "quoted"), ("$internalField", "$internalField"),
+    ("inf", "inf"), ("-nan", "-nan"), ("1_000", "1_000"), ("1.2.3", "1.2.3"), ("-", "-"),
+])
+def test_coerce_scalars(raw, expected):
+    value = parser._coerce(raw)
+    assert value == expected and type(value) is type(expected)
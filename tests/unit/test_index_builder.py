@@ -75,3 +75,108 @@ def test_entry_physics_tags_nonempty(builder):
 def test_builder_raises_on_missing_path(builder):
     with pytest.raises(FileNotFoundError):
         builder.build(tutorials_path="/nonexistent/path")
+
+
+def _write_case(case_dir: Path, application: str) -> None:
+    (case_dir / "system").mkdir(parents=True)
+    (case_dir / "system" / "controlDict").write_text(f"application {application};\n")
+    (case_dir / "system" / "blockMeshDict").write_text("")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_builder_extracts_synthetic_cases(tmp_path, workers):
+    tutorials = tmp_path / "tutorials"
+    _write_case(tutorials / "incompressible" / "icoFoam" / "cavity", "icoFoam")
+    _write_case(tutorials / "incompressible" / "simpleFoam" / "pitzDaily", "simpleFoam")
+
+    builder = IndexBuilder(version="11", output_dir=tmp_path / "out")
+    entries = builder.build(tutorials_path=tutorials, workers=workers)
+
+    assert sorted((e.path, e.solver) for e in entries) == [
+        ("incompressible/icoFoam/cavity", "icoFoam"),
+        ("incompressible/simpleFoam/pitzDaily", "simpleFoam"),
+    ]
+    assert all(e.mesh_type == "blockMesh" for e in entries)
+
+
+def test_builder_parses_each_case_file_once(tmp_path, monkeypatch):
+    from foampilot.index import builder as builder_module
+
+    tutorials = tmp_path / "tutorials"
+    case = tutorials / "incompressible" / "simpleFoam" / "pitzDaily"
+    _write_case(case, "simpleFoam")
+    (case / "constant").mkdir()
+    (case / "constant" / "turbulenceProperties").write_text(
+        "simulationType RAS;\nRAS { turbulenceModel kEpsilon; }\n"
+    )
+    parsed: list[str] = []
+    parse_file = builder_module._parser.parse_file
+    monkeypatch.setattr(builder_module._parser, "parse_file",
+                        lambda path: parsed.append(path.name) or parse_file(path))
+    builder_module._parse_cached.cache_clear()
+
+    (entry,) = IndexBuilder(version="11", output_dir=tmp_path / "out").build(
+        tutorials_path=tutorials, workers=1,
+    )
+
+    assert entry.turbulence_model == "kEpsilon"
+    assert "turbulent" in entry.physics_tags
+    assert parsed.count("turbulenceProperties") == 1
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_builder_index_file_round_trips(tmp_path, monkeypatch, use_orjson):
+    from foampilot.index import builder as builder_module
+
+    if not use_orjson:
+        monkeypatch.setattr(builder_module, "orjson", None)
+    elif builder_module.orjson is None:
+        pytest.skip("orjson not installed")
+    tutorials = tmp_path / "tutorials"
+    _write_case(tutorials / "incompressible" / "icoFoam" / "cavity", "icoFoam")
+
+    entries = IndexBuilder(version="11", output_dir=tmp_path / "out").build(
+        tutorials_path=tutorials, workers=1,
+    )
+
+    (saved,) = json.loads((tmp_path / "out" / "tutorial_index_v11.json").read_bytes())
+    assert saved["description"] == entries[0].description
+    assert "embedding" not in saved
+
+
+def test_boundary_patches_come_from_velocity_field_first(tmp_path):
+    case = tmp_path / "case"
+    (case / "0").mkdir(parents=True)
+    for name, bc in (("k", "kqRWallFunction"), ("nut", "nutkWallFunction"), ("U", "noSlip")):
+        (case / "0" / name).write_text(f"boundaryField {{ walls {{ type {bc}; }} }}\n")
+
+    patches = IndexBuilder(output_dir=tmp_path)._extract_boundary_patches(case)
+
+    assert patches == {"walls": "noSlip"}
+
+
+def test_control_dict_runner_keys_read_without_full_parse(tmp_path, monkeypatch):
+    from foampilot.index import builder as builder_module
+
+    tutorials = tmp_path / "tutorials"
+    case = tutorials / "incompressibleFluid" / "pitzDaily"
+    _write_case(case, "foamRun")
+    (case / "system" / "controlDict").write_text(
+        "/* application icoFoam; */\n"
+        "// solver fluid;\n"
+        "application     foamRun;\n"
+        "functions\n{\n    probes\n    {\n        solver   functionSolver;\n    }\n}\n"
+        'solver "incompressibleFluid";\n'
+    )
+    parsed: list[str] = []
+    parse_file = builder_module._parser.parse_file
+    monkeypatch.setattr(builder_module._parser, "parse_file",
+                        lambda path: parsed.append(path.name) or parse_file(path))
+    builder_module._parse_cached.cache_clear()
+
+    (entry,) = IndexBuilder(version="11", output_dir=tmp_path / "out").build(
+        tutorials_path=tutorials, workers=1,
+    )
+
+    assert entry.solver == "incompressibleFluid"
+    assert "controlDict" not in parsed
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 from foampilot.index.builder import TutorialEntry
-from foampilot.index.searcher import TutorialSearcher
+from foampilot.index.searcher import TutorialSearcher, get_searcher
 
 
 def _make_entries() -> list[dict]:
@@ -108,6 +108,21 @@ def test_search_by_mesh_type_block(searcher):
     assert len(results) == 3
 
 
+def test_semantic_search_uses_embedding_matrix(searcher, tmp_path, monkeypatch):
+    np = pytest.importorskip("numpy")
+    from foampilot.index import embeddings
+
+    np.save(tmp_path / "tutorial_embeddings_v11.npy", np.eye(3, dtype=np.float32))
+    monkeypatch.setattr(embeddings, "embed_text", lambda text: np.array([0, 1, 0], np.float32))
+
+    results = searcher.search(query_text="backward facing step", top_n=3)
+
+    by_path = {r.entry.path: r for r in results}
+    second = _make_entries()[1]["path"]
+    assert "semantic similarity: 1.000" in by_path[second].match_reasons
+    assert results[0].entry.path == second
+
+
 def test_search_result_has_score(searcher):
     results = searcher.search(solver="simpleFoam")
     assert results[0].score > 0
@@ -130,3 +145,19 @@ def test_search_missing_index(tmp_path):
     searcher = TutorialSearcher(index_dir=tmp_path, version="11")
     results = searcher.search(solver="simpleFoam")
     assert results == []
+
+
+def test_get_searcher_loads_index_once(tmp_path):
+    index_file = tmp_path / "tutorial_index_v11.json"
+    index_file.write_text(json.dumps(_make_entries()))
+    first = get_searcher(index_dir=tmp_path, version="11")
+    index_file.unlink()
+    second = get_searcher(index_dir=tmp_path, version="11")
+    assert second is first
+    assert second.search(solver="simpleFoam")
+
+
+def test_get_searcher_does_not_cache_missing_index(tmp_path):
+    assert get_searcher(index_dir=tmp_path, version="11").search(solver="simpleFoam") == []
+    (tmp_path / "tutorial_index_v11.json").write_text(json.dumps(_make_entries()))
+    assert get_searcher(index_dir=tmp_path, version="11").search(solver="simpleFoam")
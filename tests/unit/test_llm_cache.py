@@ -0,0 +1,77 @@
+"""Unit tests for the LLM response cache."""
+
+from anthropic.types import Message, TextBlock, ToolUseBlock, Usage
+
+from foampilot.core.llm_cache import LLMCache, _MemoryBackend, cache_key, is_cacheable
+
+
+def _message(text: str = "hi") -> Message:
+    return Message(
+        id="msg_1",
+        type="message",
+        role="assistant",
+        model="claude-sonnet-4-5-20250929",
+        content=[
+            TextBlock(type="text", text=text),
+            ToolUseBlock(type="tool_use", id="t1", name="read_file", input={"path": "/tmp/f"}),
+        ],
+        stop_reason="tool_use",
+        usage=Usage(input_tokens=10, output_tokens=5),
+    )
+
+
+def test_cache_key_is_order_independent_and_content_sensitive():
+    a = cache_key(model="m", messages=[{"role": "user", "content": "x"}])
+    b = cache_key(messages=[{"role": "user", "content": "x"}], model="m")
+    c = cache_key(model="m", messages=[{"role": "user", "content": "y"}])
+    assert a == b
+    assert a != c
+
+
+def test_cache_key_accepts_sdk_content_blocks():
+    msg = _message()
+    key = cache_key(messages=[{"role": "assistant", "content": msg.content}])
+    assert key == cache_key(messages=[{"role": "assistant", "content": _message().content}])
+
+
+def test_round_trip_restores_typed_blocks():
+    cache = LLMCache(_MemoryBackend(4))
+    cache.set("k", _message("hello"))
+    restored = cache.get("k")
+    assert restored is not None
+    assert restored.content[0].text == "hello"
+    assert isinstance(restored.content[1], ToolUseBlock)
+    assert restored.usage.input_tokens == 10
+
+
+def test_miss_returns_none():
+    assert LLMCache(_MemoryBackend(4)).get("missing") is None
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = _MemoryBackend(2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.get("a")
+    backend.set("c", "3")
+    assert backend.get("a") == "1"
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+
+
+def test_backend_errors_are_misses():
+    class _Broken:
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def set(self, key, value):
+            raise ConnectionError("down")
+
+    cache = LLMCache(_Broken())
+    cache.set("k", _message())
+    assert cache.get("k") is None
+
+
+def test_only_temperature_zero_is_cacheable():
+    assert is_cacheable(0)
+    assert not is_cacheable(1.0)
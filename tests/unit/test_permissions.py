@@ -0,0 +1,27 @@
+"""Unit tests for permission mode resolution."""
+
+import pytest
+
+from foampilot.core.permissions import PermissionChecker, PermissionLevel
+
+AUTO, NOTIFY, APPROVE = PermissionLevel.AUTO, PermissionLevel.NOTIFY, PermissionLevel.APPROVE
+
+
+@pytest.mark.parametrize(
+    ("mode", "approval", "notify"),
+    [
+        ("standard", {APPROVE}, {NOTIFY, APPROVE}),
+        ("strict", {NOTIFY, APPROVE}, {NOTIFY, APPROVE}),
+        ("auto_approve", set(), set()),
+    ],
+)
+def test_permission_matrix(mode, approval, notify):
+    checker = PermissionChecker(mode)
+    for level in PermissionLevel:
+        assert checker.requires_approval(level) is (level in approval)
+        assert checker.should_notify(level) is (level in notify)
+
+
+def test_unknown_mode_behaves_like_standard():
+    checker = PermissionChecker("bogus")
+    assert [checker.requires_approval(level) for level in PermissionLevel] == [False, False, True]
@@ -0,0 +1,111 @@
+"""Unit tests for the RunAgent direct-execution fast path."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from foampilot.agents import run_agent
+from foampilot.agents.run_agent import _RUN_RESULT_SCHEMA, RunAgent
+from foampilot.core.permissions import PermissionChecker
+from foampilot.tools.base import ToolResult
+
+_CONVERGED_LOG = {
+    "converged": True, "diverged": False, "iterations": 120,
+    "final_residuals": {"p": 5e-5}, "likely_issue": None,
+}
+
+
+@pytest.fixture
+def fast_path(monkeypatch):
+    """Enable the fast path with stubbed tools; records subagent tasks."""
+    calls: dict = {"tools": [], "subagent": []}
+
+    def _tool(name, result):
+        def execute(self, **kwargs):
+            calls["tools"].append((name, kwargs))
+            return result()
+        return execute
+
+    calls["run"] = lambda: ToolResult.ok(data={"exit_code": 0})
+    calls["log"] = lambda: ToolResult.ok(data=dict(_CONVERGED_LOG))
+    monkeypatch.setattr(run_agent.config, "FAST_PATH_SIMPLE_TASKS", True)
+    monkeypatch.setattr(run_agent.config, "PERMISSION_MODE", "auto_approve")
+    monkeypatch.setattr(run_agent.RunFoamCmdTool, "execute",
+                        _tool("run_foam_cmd", lambda: calls["run"]()))
+    monkeypatch.setattr(run_agent.ParseLogTool, "execute",
+                        _tool("parse_log", lambda: calls["log"]()))
+
+    def fake_subagent(cfg, task):
+        calls["subagent"].append(task)
+        return SimpleNamespace(
+            final_response="", result={"converged": False, "final_residuals": {}, "issues": []},
+        )
+
+    monkeypatch.setattr(run_agent, "run_subagent", fake_subagent)
+    return calls
+
+
+def test_converged_run_skips_the_agent(fast_path, tmp_path):
+    result = RunAgent().run(tmp_path, {"solver": "simpleFoam"})
+
+    assert result["converged"] is True
+    assert result["final_residuals"] == {"p": 5e-5}
+    assert set(result) <= set(_RUN_RESULT_SCHEMA["properties"])
+    assert set(_RUN_RESULT_SCHEMA["required"]) <= set(result)
+    assert fast_path["subagent"] == []
+    (_, run_input), (_, log_input) = fast_path["tools"]
+    assert run_input["log_file"] == "log.simpleFoam"
+    assert log_input["log_path"] == f"{tmp_path.resolve()}/log.simpleFoam"
+
+
+def test_unconverged_run_falls_back_to_agent(fast_path, tmp_path):
+    fast_path["log"] = lambda: ToolResult.ok(data={**_CONVERGED_LOG, "converged": False})
+
+    result = RunAgent().run(tmp_path, {"solver": "simpleFoam"})
+
+    assert result["converged"] is False
+    assert len(fast_path["subagent"]) == 1
+    assert "already been run once" in fast_path["subagent"][0]
+
+
+def test_denied_approval_ends_the_run(fast_path, monkeypatch, tmp_path):
+    monkeypatch.setattr(run_agent.config, "PERMISSION_MODE", "standard")
+    agent = RunAgent(approval_callback=lambda tool, tool_input: False)
+
+    result = agent.run(tmp_path, {"solver": "simpleFoam"})
+
+    assert result["converged"] is False
+    assert "run_foam_cmd" in result["issues"][0]
+    assert fast_path["tools"] == []
+    assert fast_path["subagent"] == []
+
+
+def test_fast_path_uses_the_agent_permission_checker(fast_path, monkeypatch, tmp_path):
+    monkeypatch.setattr(run_agent.config, "PERMISSION_MODE", "standard")
+    asked: list[str] = []
+    agent = RunAgent(
+        approval_callback=lambda tool, tool_input: asked.append(tool) or False,
+        permission_checker=PermissionChecker("auto_approve"),
+    )
+
+    result = agent.run(tmp_path, {"solver": "simpleFoam"})
+
+    assert result["converged"] is True
+    assert asked == []
+
+
+def test_fast_path_emits_the_agent_loop_events(fast_path, monkeypatch, tmp_path):
+    monkeypatch.setattr(run_agent.config, "PERMISSION_MODE", "standard")
+    events: list[dict] = []
+    agent = RunAgent(event_callback=events.append, approval_callback=lambda *args: True)
+
+    agent.run(tmp_path, {"solver": "simpleFoam"})
+
+    assert [(e["type"], e["data"]["tool"]) for e in events] == [
+        ("approval_required", "run_foam_cmd"),
+        ("tool_notify", "run_foam_cmd"),
+        ("tool_call", "run_foam_cmd"),
+        ("tool_result", "run_foam_cmd"),
+        ("tool_call", "parse_log"),
+        ("tool_result", "parse_log"),
+    ]
@@ -0,0 +1,156 @@
+"""Unit tests for simulation state persistence."""
+
+import threading
+
+import pytest
+
+from foampilot.core import state as state_module
+from foampilot.core.state import AsyncStateWriter, SimulationPhase, SimulationState, StateManager
+
+
+class _SlowManager(StateManager):
+    """Blocks the first write until released, recording every state written."""
+
+    def __init__(self, case_dir) -> None:
+        super().__init__(case_dir)
+        self.release = threading.Event()
+        self.written: list[SimulationPhase] = []
+
+    def save(self, state: SimulationState) -> None:
+        self.release.wait(timeout=5)
+        self.written.append(state.phase)
+        super().save(state)
+
+
+def test_writer_coalesces_and_flushes_latest_state(tmp_path):
+    manager = _SlowManager(tmp_path)
+    writer = AsyncStateWriter(manager)
+    state = SimulationState(session_id="s1")
+
+    for phase in (SimulationPhase.CONSULTING, SimulationPhase.SETUP, SimulationPhase.MESHING):
+        state.set_phase(phase)
+        writer.save(state)
+    manager.release.set()
+    writer.close()
+
+    assert manager.written[-1] == SimulationPhase.MESHING
+    assert len(manager.written) <= 2
+    assert StateManager(tmp_path).load().phase == SimulationPhase.MESHING
+
+
+def test_writer_snapshots_state_at_save_time(tmp_path):
+    manager = _SlowManager(tmp_path)
+    writer = AsyncStateWriter(manager)
+    state = SimulationState(session_id="s1")
+    writer.save(state)
+    state.add_issue("added after save")
+    manager.release.set()
+    writer.flush()
+
+    assert StateManager(tmp_path).load().issues == []
+    writer.close()
+
+
+def test_writer_survives_a_failed_write_and_rejects_saves_after_close(tmp_path):
+    class _Flaky(StateManager):
+        calls = 0
+
+        def save(self, state):
+            _Flaky.calls += 1
+            if _Flaky.calls == 1:
+                raise OSError("disk full")
+            super().save(state)
+
+    writer = AsyncStateWriter(_Flaky(tmp_path))
+    writer.save(SimulationState(session_id="s1"))
+    writer.flush()
+    writer.save(SimulationState(session_id="s2"))
+    writer.close()
+
+    assert StateManager(tmp_path).load().session_id == "s2"
+    with pytest.raises(RuntimeError):
+        writer.save(SimulationState(session_id="s3"))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_state_round_trip(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(state_module, "orjson", None)
+    elif state_module.orjson is None:
+        pytest.skip("orjson not installed")
+    state = SimulationState(session_id="s1", simulation_spec={"solver": "simpleFoam", "T": "20°C"})
+    state.set_phase(SimulationPhase.RUNNING)
+    state.record_modification("system/controlDict", "edited", "endTime 500")
+    manager = StateManager(tmp_path)
+    manager.save(state)
+
+    loaded = manager.load()
+    assert loaded == state
+    assert '"solver": "simpleFoam"' in (tmp_path / "FOAMPILOT.md").read_text(encoding="utf-8")
+
+
+def test_failed_save_keeps_the_previous_state_file(tmp_path, monkeypatch):
+    manager = StateManager(tmp_path)
+    manager.save(SimulationState(session_id="s1"))
+
+    def _torn_write(path, data):
+        with open(path, "wb") as f:
+            f.write(data[:10])
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state_module.Path, "write_bytes", _torn_write)
+    with pytest.raises(OSError):
+        manager.save(SimulationState(session_id="s2"))
+
+    assert manager.load().session_id == "s1"
+
+
+def test_assumptions_and_issues_are_deduplicated_in_order(tmp_path):
+    state = SimulationState(session_id="s1", assumptions=["laminar"])
+    for text in ("laminar", "incompressible", "laminar"):
+        state.add_assumption(text)
+    state.add_issue("slow")
+    state.add_issue("slow")
+    assert state.assumptions == ["laminar", "incompressible"]
+    assert state.issues == ["slow"]
+
+    manager = StateManager(tmp_path)
+    manager.save(state)
+    loaded = manager.load()
+    loaded.add_assumption("incompressible")
+    assert loaded == state
+
+
+def test_markdown_is_debounced_until_flushed(tmp_path):
+    manager = StateManager(tmp_path, markdown_interval=3600)
+    state = SimulationState(session_id="s1")
+    manager.save(state)
+    state.set_phase(SimulationPhase.MESHING)
+    manager.save(state)
+
+    md = tmp_path / "FOAMPILOT.md"
+    assert "**Phase:** idle" in md.read_text(encoding="utf-8")
+    assert manager.load().phase == SimulationPhase.MESHING
+
+    manager.flush_markdown()
+    assert "**Phase:** meshing" in md.read_text(encoding="utf-8")
+
+
+def test_to_dict_matches_asdict():
+    from dataclasses import asdict
+
+    state = SimulationState(session_id="s1", mesh_quality={"cells": 100})
+    state.record_modification("0/U", "edited", "inlet 1 m/s")
+    assert state_module._to_dict(state) == asdict(state)
+
+
+def test_markdown_layout(tmp_path):
+    state = SimulationState(session_id="s1", original_request="pipe flow", issues=["slow"])
+    state.record_modification("0/U", "edited", "inlet 1 m/s")
+    StateManager(tmp_path).save(state)
+
+    md = (tmp_path / "FOAMPILOT.md").read_text(encoding="utf-8")
+    assert md.startswith("# FoamPilot Session Log\n\n**Session ID:** s1\n")
+    assert "## Original Request\n\npipe flow\n\n## Files Modified\n\n" in md
+    assert "- `0/U` — **edited**: inlet 1 m/s\n\n## Issues Encountered\n\n- slow\n" in md
+    assert md.endswith("- slow\n")
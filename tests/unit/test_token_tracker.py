@@ -52,3 +52,38 @@ def test_summary_keys():
     assert "total_output_tokens" in summary
     assert "total_cost_usd" in summary
     assert "context_utilization_pct" in summary
+
+
+def test_cached_prompt_tokens_count_towards_context_and_cost():
+    tracker = TokenTracker(_context_window=200_000, _threshold=0.70)
+    tracker.record(
+        turn=1, model="claude-sonnet-4-5-20250929",
+        input_tokens=10_000, output_tokens=0,
+        cache_read_tokens=1_000_000, cache_write_tokens=140_000,
+    )
+    # input_tokens excludes the cached prefix; utilization uses the whole prompt
+    assert tracker.should_compact()
+    # 10k * $3/M + 1M * $0.30/M + 140k * $3.75/M
+    assert abs(tracker.total_cost_usd - (0.03 + 0.30 + 0.525)) < 1e-6
+    assert tracker.summary()["total_cache_read_tokens"] == 1_000_000
+
+
+def test_truncation_savings_lower_utilization_until_next_turn():
+    tracker = TokenTracker(_context_window=200_000, _threshold=0.70)
+    tracker.record(
+        turn=1, model="claude-sonnet-4-5-20250929", input_tokens=150_000, output_tokens=0,
+    )
+    assert tracker.should_compact()
+    tracker.record_truncation(20_000)
+    assert not tracker.should_compact()
+    assert tracker.summary()["total_truncated_tokens"] == 20_000
+    tracker.record(
+        turn=2, model="claude-sonnet-4-5-20250929", input_tokens=150_000, output_tokens=0,
+    )
+    assert tracker.should_compact()
+
+
+def test_unknown_model_uses_default_rates():
+    tracker = TokenTracker()
+    tracker.record(turn=1, model="some-new-model", input_tokens=1_000_000, output_tokens=1_000_000)
+    assert tracker.total_cost_usd == pytest.approx(18.0)
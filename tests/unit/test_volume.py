@@ -0,0 +1,56 @@
+"""Unit tests for VolumeManager path translation."""
+
+from pathlib import Path
+
+from foampilot.docker.volume import VolumeManager
+
+
+def test_host_and_container_paths_round_trip(tmp_path):
+    vm = VolumeManager(host_cases_dir=tmp_path, container_cases_dir="/data/cases")
+    host = tmp_path.resolve() / "case_ab12" / "system"
+
+    assert vm.host_to_container(host) == "/data/cases/case_ab12/system"
+    assert vm.container_to_host("/data/cases/case_ab12/system") == host
+
+
+def test_translation_follows_the_mount_layout_of_each_manager(tmp_path):
+    host = tmp_path.resolve() / "case_ab12"
+
+    first = VolumeManager(host_cases_dir=tmp_path, container_cases_dir="/data/cases")
+    second = VolumeManager(host_cases_dir=tmp_path, container_cases_dir="/mnt/cases")
+
+    assert first.host_to_container(host) == "/data/cases/case_ab12"
+    assert second.host_to_container(host) == "/mnt/cases/case_ab12"
+
+
+def test_paths_outside_the_cases_dir_fall_back_to_the_case_segment(tmp_path):
+    vm = VolumeManager(host_cases_dir=tmp_path / "cases", container_cases_dir="/data/cases")
+
+    assert vm.host_to_container(Path("/elsewhere/cases/case_ff00/0")) == "/data/cases/case_ff00/0"
+    assert vm.container_to_host("/tmp/other") == Path("/tmp/other")
+
+
+def test_relative_paths_resolve_against_the_current_cwd(tmp_path, monkeypatch):
+    vm = VolumeManager(host_cases_dir=tmp_path, container_cases_dir="/data/cases")
+    for case in ("case_aa", "case_bb"):
+        (tmp_path / case).mkdir()
+
+    monkeypatch.chdir(tmp_path / "case_aa")
+    first = vm.host_to_container(Path("0"))
+    monkeypatch.chdir(tmp_path / "case_bb")
+    second = vm.host_to_container(Path("0"))
+
+    assert (first, second) == ("/data/cases/case_aa/0", "/data/cases/case_bb/0")
+
+
+def test_fallback_warning_is_logged_on_every_call(tmp_path, monkeypatch):
+    from foampilot.docker import volume
+
+    warnings: list[str] = []
+    monkeypatch.setattr(volume.log, "warning", lambda event, **kw: warnings.append(event))
+    vm = VolumeManager(host_cases_dir=tmp_path / "cases", container_cases_dir="/data/cases")
+
+    for _ in range(2):
+        vm.host_to_container(Path("/elsewhere/cases/case_ff00/0"))
+
+    assert warnings == ["host_to_container_fallback"] * 2